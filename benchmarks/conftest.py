@@ -0,0 +1,33 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+"""Shared parameters for benchmarks."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import analphipy.potential as pots
+
+POTENTIALS = {
+    "lj": pots.LennardJones(),
+    "lj_lfs": pots.LennardJones().lfs(rcut=2.5),
+    "nm_18_9": pots.LennardJonesNM(n=18, m=9),
+    "yukawa": pots.Yukawa(z=2.0),
+}
+
+SIZES = [10, 1_000, 100_000]
+
+
+@pytest.fixture(params=list(POTENTIALS))
+def potential(request):
+    return POTENTIALS[request.param]
+
+
+@pytest.fixture(params=SIZES)
+def r_array(request):
+    return np.linspace(0.8, 3.0, request.param)
+
+
+@pytest.fixture
+def betas():
+    return np.linspace(0.2, 2.0, 20)
@@ -0,0 +1,14 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+"""Benchmarks of import time (including interpreter startup)."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "statement", ["pass", "import analphipy", "import analphipy.potential"]
+)
+def test_import(benchmark, statement) -> None:
+    benchmark(subprocess.run, [sys.executable, "-c", statement], check=True)
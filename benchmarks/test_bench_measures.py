@@ -0,0 +1,56 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+"""Benchmarks of quadrature based measures."""
+
+import pytest
+
+import analphipy.potential as pots
+from analphipy.measures import diverg_js_matrix, secondvirial
+from analphipy.norofrenkel import NoroFrenkelPair, sig_nf
+
+
+def _to_nf(potential):
+    if isinstance(potential, pots.Yukawa):
+        # hard core, with minimum at contact
+        return NoroFrenkelPair(
+            potential.phi,
+            potential.segments,
+            r_min=potential.sig,
+            phi_min=-potential.eps,
+        )
+    return NoroFrenkelPair.from_phi_class(potential, bounds=[0.5, 1.5])
+
+
+@pytest.mark.parametrize("method", ["quad", "gauss"])
+def test_secondvirial(benchmark, potential, method) -> None:
+    benchmark(secondvirial, potential.phi, 1.0, potential.segments, method=method)
+
+
+@pytest.mark.parametrize("method", ["quad", "gauss"])
+def test_secondvirial_array(benchmark, potential, betas, method) -> None:
+    benchmark(secondvirial, potential.phi, betas, potential.segments, method=method)
+
+
+def test_sig_nf(benchmark, potential) -> None:
+    nf = _to_nf(potential)
+    benchmark(sig_nf, nf.phi_rep, 1.0, [0.0, nf.r_min])
+
+
+def test_nf_table(benchmark, potential, betas) -> None:
+    # new object each round, so that nothing is cached
+    benchmark(lambda: _to_nf(potential).table(betas))
+
+
+def test_boltz_diverg_js(benchmark, potential) -> None:
+    other = pots.LennardJonesNM(n=14, m=7)
+    # new object each round, so that nothing is cached
+    benchmark(lambda: potential.to_measures().boltz_diverg_js(other, beta=1.0))
+
+
+def test_diverg_js_matrix(benchmark, betas) -> None:
+    potentials = [
+        pots.LennardJones(),
+        pots.LennardJones().lfs(rcut=2.5),
+        pots.LennardJonesNM(n=18, m=9),
+        pots.Yukawa(z=2.0),
+    ]
+    benchmark(diverg_js_matrix, potentials, betas)
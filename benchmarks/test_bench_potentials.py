@@ -0,0 +1,47 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+"""Benchmarks of potential evaluation."""
+
+import pytest
+
+import analphipy.potential as pots
+
+_LJ = pots.LennardJones()
+
+PHIS = {
+    "lj": _LJ,
+    "lj_cut": _LJ.cut(rcut=2.5),
+    "lj_lfs": _LJ.lfs(rcut=2.5),
+    "cubic_table": pots.CubicTable.from_phi(_LJ.phi, rmin=0.5, rmax=2.5, ds=0.001),
+    "adaptive_table": pots.AdaptiveCubicTable.from_phi(
+        _LJ.phi, rmin=0.5, rmax=2.5, dphidr=_LJ.dphidr
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(PHIS))
+def test_phi(benchmark, name, r_array) -> None:
+    benchmark(PHIS[name].phi, r_array)
+
+
+@pytest.mark.parametrize("name", list(PHIS))
+def test_dphidr(benchmark, name, r_array) -> None:
+    benchmark(PHIS[name].dphidr, r_array)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+@pytest.mark.parametrize("name", ["lj", "cubic_table"])
+def test_phi_backend(benchmark, name, backend, r_array) -> None:
+    if backend == "numba":
+        pytest.importorskip("numba")
+    benchmark(PHIS[name].phi, r_array, backend=backend)
+
+
+@pytest.mark.parametrize("name", list(PHIS))
+def test_phi_and_dphidr(benchmark, name, r_array) -> None:
+    benchmark(PHIS[name].phi_and_dphidr, r_array)
+
+
+@pytest.mark.parametrize("assume_sorted", [False, True])
+@pytest.mark.parametrize("name", ["lj_cut", "lj_lfs"])
+def test_phi_cut_sorted(benchmark, name, assume_sorted, r_array) -> None:
+    benchmark(PHIS[name].phi, r_array, assume_sorted=assume_sorted)
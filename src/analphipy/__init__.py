@@ -4,17 +4,46 @@ Top level API :mod:`analphipy`
 
 The top level API provides Pair potentials and analysis routines.
 """
-# ruff: noqa: RUF067
+# ruff: noqa: RUF067, F822
 
-from importlib.metadata import PackageNotFoundError
-from importlib.metadata import version as _version
+from __future__ import annotations
 
-from . import measures, norofrenkel, potential
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from . import cache, measures, norofrenkel, potential, sweep
+
+# Submodules (and ``__version__``) are loaded on first access (PEP 562), so
+# that, e.g., ``import analphipy.potential`` does not import
+# :mod:`analphipy.measures`.
+_SUBMODULES = ("cache", "measures", "norofrenkel", "potential", "sweep")
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        from importlib import import_module
+
+        return import_module(f".{name}", __name__)
+
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("analphipy")
+        except PackageNotFoundError:  # pragma: no cover
+            value = "999"
+        globals()["__version__"] = value
+        return value
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-try:
-    __version__ = _version("analphipy")
-except PackageNotFoundError:  # pragma: no cover
-    __version__ = "999"
 
 __author__ = """William P. Krekelberg"""
 __email__ = "wpk@nist.gov"
@@ -33,9 +62,11 @@ __all__ = [
     # "measures",
     # "norofrenkel",
     "__version__",
+    "cache",
     "measures",
     "norofrenkel",
     # "PhiBaseCuttable",
     # "PhiBaseGenericCut",
     "potential",
+    "sweep",
 ]
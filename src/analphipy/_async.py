@@ -0,0 +1,129 @@
+"""
+Run methods of :class:`~analphipy.norofrenkel.NoroFrenkelPair` and
+:class:`~analphipy.measures.Measures` from :mod:`asyncio` code.
+
+Calculations are offloaded to an executor so that the event loop is not
+blocked by quadrature.  Concurrent requests for the same value share a single
+calculation.  Requests are the same if they call the same method, with equal
+arguments, on objects with the same cache token (by default, a hash of the
+potential parameters, ``segments``, and ``quad_kws``).  If the object cannot
+be hashed between processes (e.g., ``phi`` is a ``lambda``), only requests on
+the same object are shared.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from functools import partial
+from typing import TYPE_CHECKING, cast
+
+from .cache import stable_hash
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Mapping
+    from concurrent.futures import Executor
+    from typing import Any
+
+    from .cache import InstanceCache
+
+
+class _InFlight:
+    """Future of a running calculation, and number of requests awaiting it."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future[Any]) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+# Running calculations of each event loop.
+_IN_FLIGHT: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[Hashable, _InFlight]
+] = weakref.WeakKeyDictionary()
+
+
+def _request_key(
+    obj: Any, name: str, args: tuple[Any, ...], kws: Mapping[str, Any]
+) -> Hashable | None:
+    """Key identifying request, or None if it cannot be shared."""
+    token = cast("InstanceCache", obj._cache).token  # noqa: SLF001
+    try:
+        if token is None:
+            token = stable_hash((type(obj).__name__, obj._token_params()))  # noqa: SLF001
+        return stable_hash((token, name, args, kws))
+    except TypeError:
+        pass
+
+    # Calculation holds a reference to ``obj``, so ``id(obj)`` is not reused
+    # while it runs.
+    key = (type(obj).__name__, id(obj), name, args, tuple(sorted(kws.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+async def call_method(
+    obj: Any,
+    name: str,
+    /,
+    *args: Any,
+    executor: Executor | None = None,
+    **kws: Any,
+) -> Any:
+    """
+    Await ``getattr(obj, name)(*args, **kws)`` evaluated in ``executor``.
+
+    Parameters
+    ----------
+    obj : NoroFrenkelPair or Measures
+        Object to call method of.
+    name : str
+        Name of method.
+    *args, **kws
+        Arguments to method.
+    executor : concurrent.futures.Executor, optional
+        Executor which runs the method. Default is the default executor of the
+        running event loop.
+
+    Returns
+    -------
+    object
+        Output of method.
+
+    Notes
+    -----
+    Cancelling a request cancels the calculation only if no other requests
+    are awaiting it.  A calculation which has already started in a thread
+    runs to completion, but its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    in_flight = _IN_FLIGHT.setdefault(loop, {})
+    key = _request_key(obj, name, args, kws)
+
+    entry = None if key is None else in_flight.get(key)
+    if entry is None:
+        entry = _InFlight(
+            loop.run_in_executor(executor, partial(getattr(obj, name), *args, **kws))
+        )
+        if key is not None:
+            in_flight[key] = entry
+
+            def _discard(_: asyncio.Future[Any], entry: _InFlight = entry) -> None:
+                if in_flight.get(key) is entry:
+                    del in_flight[key]
+
+            entry.future.add_done_callback(_discard)
+
+    entry.waiters += 1
+    try:
+        # shield, so that cancelling one request does not cancel the others
+        return await asyncio.shield(entry.future)
+    finally:
+        entry.waiters -= 1
+        if entry.waiters == 0 and not entry.future.done():
+            # last request was cancelled
+            entry.future.cancel()
@@ -0,0 +1,413 @@
+"""
+Optional compiled kernels for pair potentials.
+
+If :mod:`numba` is installed, the kernels below are compiled with
+``numba.njit(parallel=True)`` on first use.  Otherwise, they are plain python
+functions, and potentials fall back to their numpy implementations.  To keep
+imports fast, :mod:`numba` itself is only imported when a kernel is first
+called.
+
+Kernels act on one dimensional ``float64`` or ``float32`` arrays ``r``, and
+write results to ``out``.  Intermediate values are ``float64``.
+"""
+
+from __future__ import annotations
+
+import math
+from functools import update_wrapper
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, Literal, TypeVar
+
+    from numpy.typing import DTypeLike
+
+    from ._typing import Array, Float_or_ArrayLike, IndexArray
+
+    Backend = Literal["numpy", "numba", "auto"]
+    _F = TypeVar("_F", bound=Callable[..., Any])
+
+
+#: Whether :mod:`numba` is installed.
+HAS_NUMBA = find_spec("numba") is not None
+
+#: Minimum size of input for which ``backend="auto"`` selects numba.
+AUTO_MIN_SIZE = 10_000
+
+BACKENDS = ("numpy", "numba", "auto")
+
+
+def use_numba(backend: Backend | None, r: Float_or_ArrayLike) -> bool:
+    """
+    Whether to evaluate with compiled kernels.
+
+    Numba is only used if requested, as compiling kernels on first call and
+    starting threads may be unexpected (e.g., in forked worker processes). If
+    ``backend`` is None, use numpy.  If ``backend`` is ``"auto"``, use numba
+    if installed and ``r`` has at least :data:`AUTO_MIN_SIZE` elements.
+    """
+    if backend is None:
+        return False
+
+    if backend not in BACKENDS:
+        msg = f"backend={backend!r} must be one of {BACKENDS} or None"
+        raise ValueError(msg)
+
+    if backend == "auto":
+        return HAS_NUMBA and np.size(r) >= AUTO_MIN_SIZE
+
+    if backend == "numba" and not HAS_NUMBA:
+        msg = "backend='numba' requires numba to be installed"
+        raise ImportError(msg)
+
+    return backend == "numba"
+
+
+def float_dtype(r: Float_or_ArrayLike) -> np.dtype[Any]:
+    """
+    Floating point type for evaluating at ``r``.
+
+    This is ``float32`` if ``r`` is a ``float32`` array, and ``float64``
+    otherwise.
+    """
+    if getattr(r, "dtype", None) == np.float32:
+        return np.dtype(np.float32)
+    return np.dtype(np.float64)
+
+
+def evaluate(
+    kernel: Callable[..., None],
+    r: Float_or_ArrayLike,
+    *args: Any,
+    out: Array | tuple[Array, ...] | None = None,
+    nout: int = 1,
+    dtype: DTypeLike | None = None,
+) -> Any:
+    """
+    Apply ``kernel(r, *args, *outs)`` to flattened ``r``.
+
+    ``r`` is converted to ``dtype`` (default from :func:`float_dtype`).
+    Returns ``outs`` with the shape of ``r``. If passed, ``out`` must be
+    C-contiguous array(s) of ``dtype`` with the shape of ``r``.
+    """
+    dtype = float_dtype(r) if dtype is None else np.dtype(dtype)
+    r = np.asarray(r, dtype=dtype)
+    if not r.flags.c_contiguous:
+        r = r.copy(order="C")
+    if out is None:
+        outs = tuple(np.empty_like(r) for _ in range(nout))
+    else:
+        outs = out if isinstance(out, tuple) else (out,)
+        for x in outs:
+            if x.shape != r.shape or x.dtype != dtype or not x.flags.c_contiguous:
+                msg = f"out must be C-contiguous {dtype} array(s) with same shape as r"
+                raise ValueError(msg)
+
+    kernel(r.reshape(-1), *args, *(x.reshape(-1) for x in outs))
+    return outs[0] if nout == 1 else outs
+
+
+# Replaced by numba.prange when kernels are compiled.
+prange: Any = range
+
+# Helpers called from kernels.  Replaced in module globals by their compiled
+# versions before any kernel is compiled.
+_INLINE: dict[str, Callable[..., Any]] = {}
+
+
+def _setup_numba() -> Any:
+    """Import numba, and compile helpers used by kernels."""
+    global prange  # noqa: PLW0603
+    import numba  # pyright: ignore[reportMissingImports]
+
+    if prange is range:
+        for name, func in _INLINE.items():
+            globals()[name] = numba.njit(inline="always", cache=True)(func)
+        prange = numba.prange
+    return numba
+
+
+class _LazyKernel:
+    """Kernel compiled with numba (if installed) on first call."""
+
+    def __init__(self, func: Callable[..., None]) -> None:
+        update_wrapper(self, func)
+        self.py_func = func
+        self._compiled: Callable[..., None] | None = None
+
+    def __call__(self, *args: Any) -> None:
+        if self._compiled is None:
+            self._compiled = (
+                _setup_numba().njit(parallel=True, cache=True)(self.py_func)
+                if HAS_NUMBA
+                else self.py_func
+            )
+        self._compiled(*args)
+
+
+def _jit(func: Callable[..., None]) -> Callable[..., None]:
+    return _LazyKernel(func)
+
+
+def _jit_inline(func: _F) -> _F:
+    _INLINE[func.__name__] = func
+    return func
+
+
+# * Analytic potentials --------------------------------------------------------
+
+
+@_jit
+def lj_phi(r: Array, sigsq: float, four_eps: float, out: Array) -> None:
+    """Lennard-Jones potential."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        x2 = sigsq / (r[i] * r[i])
+        x6 = x2 * x2 * x2
+        out[i] = four_eps * x6 * (x6 - 1.0)
+
+
+@_jit
+def lj_dphidr(r: Array, sigsq: float, four_eps: float, out: Array) -> None:
+    """Lennard-Jones potential derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        x2 = sigsq / (r[i] * r[i])
+        x6 = x2 * x2 * x2
+        out[i] = -12.0 * four_eps * x6 * (x6 - 0.5) / r[i]
+
+
+@_jit
+def lj_phi_dphidr(
+    r: Array, sigsq: float, four_eps: float, phi: Array, dphidr: Array
+) -> None:
+    """Lennard-Jones potential and derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        x2 = sigsq / (r[i] * r[i])
+        x6 = x2 * x2 * x2
+        phi[i] = four_eps * x6 * (x6 - 1.0)
+        dphidr[i] = -12.0 * four_eps * x6 * (x6 - 0.5) / r[i]
+
+
+@_jit
+def nm_phi(r: Array, sig: float, n: float, m: float, prefac: float, out: Array) -> None:
+    """Generalized Lennard-Jones potential."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        x = sig / r[i]
+        out[i] = prefac * (x**n - x**m)
+
+
+@_jit
+def nm_dphidr(
+    r: Array, sig: float, n: float, m: float, prefac: float, out: Array
+) -> None:
+    """Generalized Lennard-Jones potential derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        x = sig / r[i]
+        out[i] = -prefac * (n * x**n - m * x**m) / r[i]
+
+
+@_jit
+def nm_phi_dphidr(
+    r: Array,
+    sig: float,
+    n: float,
+    m: float,
+    prefac: float,
+    phi: Array,
+    dphidr: Array,
+) -> None:
+    """Generalized Lennard-Jones potential and derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        x = sig / r[i]
+        xn = x**n
+        xm = x**m
+        phi[i] = prefac * (xn - xm)
+        dphidr[i] = -prefac * (n * xn - m * xm) / r[i]
+
+
+@_jit
+def yukawa_phi(r: Array, sig: float, eps: float, z: float, out: Array) -> None:
+    """Hard core Yukawa potential."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        if r[i] >= sig:
+            x = r[i] / sig
+            out[i] = -eps * math.exp(-z * (x - 1.0)) / x
+        else:
+            out[i] = math.inf
+
+
+@_jit
+def yukawa_dphidr(r: Array, sig: float, eps: float, z: float, out: Array) -> None:
+    """Hard core Yukawa potential derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        if r[i] >= sig:
+            x = r[i] / sig
+            out[i] = eps * math.exp(-z * (x - 1.0)) / x * (z + 1.0 / x) / sig
+        else:
+            out[i] = -math.inf
+
+
+@_jit
+def yukawa_phi_dphidr(
+    r: Array, sig: float, eps: float, z: float, phi: Array, dphidr: Array
+) -> None:
+    """Hard core Yukawa potential and derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        if r[i] >= sig:
+            x = r[i] / sig
+            v = -eps * math.exp(-z * (x - 1.0)) / x
+            phi[i] = v
+            dphidr[i] = -v * (z + 1.0 / x) / sig
+        else:
+            phi[i] = math.inf
+            dphidr[i] = -math.inf
+
+
+@_jit
+def sw_phi(r: Array, sig: float, eps: float, lam: float, out: Array) -> None:
+    """Square well potential."""
+    rcut = lam * sig
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        if r[i] < sig:
+            out[i] = math.inf
+        elif r[i] >= rcut:
+            out[i] = 0.0
+        else:
+            out[i] = eps
+
+
+# * Cubic table ----------------------------------------------------------------
+# coefs has the layout of CubicTable._coefs: rows 0-2 are coefficients of phi,
+# rows 3-4 of -1/r dphi/dr, column 0 is the left bound, and column size + 1 the
+# right bound.  For CubicTableBank, tables are concatenated along columns, with
+# table k starting at column offsets[k].
+
+
+@_jit_inline
+def _cubic_interval(sds: float, size: int) -> tuple[int, float]:
+    """Column (relative to table start) and fractional position, or -1 for nan."""
+    if sds <= 0.0:
+        return 0, 0.0
+    if sds >= size:
+        return size + 1, 0.0
+    if sds == sds:  # noqa: PLR0124
+        k = int(sds)
+        return k + 1, sds - k
+    return -1, 0.0
+
+
+@_jit
+def cubic_table_phidphi(
+    r: Array,
+    smin: float,
+    dsinv: float,
+    size: int,
+    coefs: Array,
+    phi: Array,
+    dphi: Array,
+) -> None:
+    """Cubic table potential and ``-1/r dphi/dr``."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        j, xi = _cubic_interval((r[i] * r[i] - smin) * dsinv, size)
+        if j < 0:
+            phi[i] = dphi[i] = math.nan
+        else:
+            phi[i] = coefs[0, j] + xi * (coefs[1, j] + xi * coefs[2, j])
+            dphi[i] = coefs[3, j] + xi * coefs[4, j]
+
+
+@_jit
+def cubic_table_phi(
+    r: Array, smin: float, dsinv: float, size: int, coefs: Array, out: Array
+) -> None:
+    """Cubic table potential."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        j, xi = _cubic_interval((r[i] * r[i] - smin) * dsinv, size)
+        if j < 0:
+            out[i] = math.nan
+        else:
+            out[i] = coefs[0, j] + xi * (coefs[1, j] + xi * coefs[2, j])
+
+
+@_jit
+def cubic_table_dphidr(
+    r: Array, smin: float, dsinv: float, size: int, coefs: Array, out: Array
+) -> None:
+    """Cubic table potential derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        j, xi = _cubic_interval((r[i] * r[i] - smin) * dsinv, size)
+        if j < 0:
+            out[i] = math.nan
+        else:
+            out[i] = -r[i] * (coefs[3, j] + xi * coefs[4, j])
+
+
+@_jit
+def cubic_bank_phidphi(
+    r: Array,
+    index: IndexArray,
+    smin: Array,
+    dsinv: Array,
+    size: IndexArray,
+    offsets: IndexArray,
+    coefs: Array,
+    phi: Array,
+    dphi: Array,
+) -> None:
+    """Cubic table bank potential and ``-1/r dphi/dr``."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        k = index[i]
+        j, xi = _cubic_interval((r[i] * r[i] - smin[k]) * dsinv[k], size[k])
+        if j < 0:
+            phi[i] = dphi[i] = math.nan
+        else:
+            j += offsets[k]
+            phi[i] = coefs[0, j] + xi * (coefs[1, j] + xi * coefs[2, j])
+            dphi[i] = coefs[3, j] + xi * coefs[4, j]
+
+
+@_jit
+def cubic_bank_phi(
+    r: Array,
+    index: IndexArray,
+    smin: Array,
+    dsinv: Array,
+    size: IndexArray,
+    offsets: IndexArray,
+    coefs: Array,
+    out: Array,
+) -> None:
+    """Cubic table bank potential."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        k = index[i]
+        j, xi = _cubic_interval((r[i] * r[i] - smin[k]) * dsinv[k], size[k])
+        if j < 0:
+            out[i] = math.nan
+        else:
+            j += offsets[k]
+            out[i] = coefs[0, j] + xi * (coefs[1, j] + xi * coefs[2, j])
+
+
+@_jit
+def cubic_bank_dphidr(
+    r: Array,
+    index: IndexArray,
+    smin: Array,
+    dsinv: Array,
+    size: IndexArray,
+    offsets: IndexArray,
+    coefs: Array,
+    out: Array,
+) -> None:
+    """Cubic table bank potential derivative."""
+    for i in prange(r.shape[0]):  # pylint: disable=not-an-iterable
+        k = index[i]
+        j, xi = _cubic_interval((r[i] * r[i] - smin[k]) * dsinv[k], size[k])
+        if j < 0:
+            out[i] = math.nan
+        else:
+            j += offsets[k]
+            out[i] = -r[i] * (coefs[3, j] + xi * coefs[4, j])
@@ -1,8 +1,31 @@
-"""Common docstrings."""
+"""
+Common docstrings.
+
+Docstrings are filled with :class:`module_utilities.docfiller.DocFiller`
+through :data:`docfiller`.  To speed up imports, filled docstrings are
+precomputed (with ``python -m analphipy._docstrings``) and stored in
+``_docstrings_filled.json``, keyed by a hash of everything the filled docstring
+depends on (template docstrings, parameters, and shared docstrings).  The
+``DocFiller`` is only created (importing :mod:`module_utilities`) to fill
+docstrings which are missing or out of date there.  If docstrings are stripped
+(``python -OO``), no filling is done.
+"""
 
 from __future__ import annotations
 
-from module_utilities.docfiller import DocFiller
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, TypeVar
+
+    from module_utilities.docfiller import DocFiller
+
+    _F = TypeVar("_F", bound=Callable[..., Any])
 
 
 def _docstrings_shared() -> None:  # pylint: disable=differing-param-doc,differing-type-doc
@@ -16,6 +39,8 @@ def _docstrings_shared() -> None:  # pylint: disable=differing-param-doc,differi
         Repulsive part of pair potential.
     beta : float
         Inverse temperature.
+    beta_array | beta : float or array-like
+        Inverse temperature(s). If an array, the output has the same shape as ``beta``.
     phi : callable
         Potential function.
     r : float or array-like
@@ -38,6 +63,42 @@ def _docstrings_shared() -> None:  # pylint: disable=differing-param-doc,differi
         Volume element in integration.
         For example, use ``volume = lambda x: 4 * np.pi * x ** 2`` for spherically symmetric 3d integration.
         Can also pass string value of {'1d', '2d', '3d'}.  If passed None, then assume '1d' integration.
+    assume_sorted : bool, default False
+        If True, ``r`` must be one dimensional and sorted in ascending order.
+        The cutoff is then located with a single :func:`numpy.searchsorted`,
+        and values are written through slices rather than boolean masks,
+        avoiding copies of ``r``.
+    backend : {'numpy', 'numba', 'auto'}, optional
+        Evaluation backend. ``"numba"`` uses compiled, parallel kernels, and
+        requires :mod:`numba`. ``"auto"`` uses numba (if installed) for inputs
+        with at least 10,000 elements, and numpy otherwise. Default is
+        ``"numpy"``.
+    persistent_cache : PersistentCache or str or path-like, optional
+        Optional on-disk cache (or path to one) for results of cached methods.
+        See :class:`analphipy.cache.PersistentCache`.
+    cache_token : str, optional
+        Token identifying this calculation in ``persistent_cache``. Default is
+        to hash the potential parameters, ``segments``, and ``quad_kws``.
+        Required if these cannot be hashed between processes (e.g., if ``phi``
+        is a ``lambda``).
+    cache_maxsize : int, optional
+        Maximum number of values to keep in memory for each cached method. If
+        exceeded, the least recently used values are discarded. Default is to
+        keep all values.
+    cache_key_digits : int, optional
+        If passed, round float arguments (e.g., ``beta``) of cached methods to
+        this many significant digits when looking up cached values. Values of
+        ``beta`` which agree to ``cache_key_digits`` digits (e.g., ``1 / 1.3``
+        calculated in different ways) then share a cached value, the one
+        calculated at the first ``beta`` requested. Default is to use exact
+        values.
+    executor_async | executor : concurrent.futures.Executor, optional
+        Executor which runs the calculation, so that the event loop is not
+        blocked. Default is the default executor of the running event loop
+        (see :meth:`asyncio.loop.set_default_executor`). With a
+        :class:`~concurrent.futures.ProcessPoolExecutor`, values are
+        calculated by the workers, and are not added to the in-memory cache of
+        this object (pass ``persistent_cache`` to share them).
 
     """
 
@@ -48,9 +109,195 @@ _references = {
     "ref_WCA": "J.D. Weeks, D. Chandler and H.C. Andersen (1971), 'Role of Repulsive Forces in Determining the Equilibrium Structure of Simple Liquids', Journal of Chemical Physics 54, 5237-5247",
     "kl_link": "`See here for more info on Kullback & Leibeler divergence <https://en.wikipedia.org/wiki/Kullback%E2%80%93Leibler_divergence#Definition>`_",
     "js_link": "`See here for more info on Jeffreys symmetric divergence <https://en.wikipedia.org/wiki/Kullback%E2%80%93Leibler_divergence#Symmetrised_divergence>`_",
+    "async_notes": "Concurrent calls with equal arguments, on objects with the same ``cache_token`` (by default, the same potential, ``segments``, and ``quad_kws``), share a single calculation. Cancelling a call cancels the calculation only if no other calls are awaiting it and it has not yet started.",
 }
 
 
-docfiller = DocFiller.from_docstring(
-    _docstrings_shared, combine_keys="parameters"
-).update(**_references)
+_FILLED_PATH = Path(__file__).with_name("_docstrings_filled.json")
+
+# Modules with docstrings filled on import.
+_MODULES = ("base_potential", "measures", "norofrenkel", "potential", "sweep", "utils")
+
+
+def _load_filled() -> dict[str, str]:
+    try:
+        with _FILLED_PATH.open(encoding="utf-8") as f:
+            return dict(json.load(f))
+    except (OSError, ValueError):
+        return {}
+
+
+# Precomputed docstrings.
+_FILLED = _load_filled()
+# Docstrings filled by DocFiller, if recording (see _generate).
+_RECORDED: dict[str, str] | None = None
+
+
+def _key(*parts: str | None) -> str:
+    return hashlib.sha256("\0".join(x or "" for x in parts).encode()).hexdigest()
+
+
+def _describe(template: Any) -> str:
+    """Name and docstring of template."""
+    if isinstance(template, str):
+        return template
+    return f"{getattr(template, '__qualname__', '')}\0{template.__doc__ or ''}"
+
+
+class _DocFiller:
+    """
+    :class:`~module_utilities.docfiller.DocFiller` using precomputed docstrings.
+
+    Supports the subset of the ``DocFiller`` interface used in this package.
+    ``key`` identifies the data of the filler.
+    """
+
+    def __init__(self, factory: Callable[[], DocFiller], key: str) -> None:
+        self._factory = factory
+        self._filler: DocFiller | None = None
+        self._key = key
+
+    @property
+    def filler(self) -> DocFiller:
+        if self._filler is None:
+            self._filler = self._factory()
+        return self._filler
+
+    @property
+    def data(self) -> Any:
+        return self.filler.data
+
+    def update(self, *args: Any, **kwargs: Any) -> _DocFiller:
+        return type(self)(
+            lambda: self.filler.update(*args, **kwargs),
+            _key(self._key, "update", repr(args), repr(sorted(kwargs.items()))),
+        )
+
+    def dedent(self) -> _DocFiller:
+        return type(self)(
+            lambda: self.filler.dedent(),  # noqa: PLW0108
+            _key(self._key, "dedent"),
+        )
+
+    def _apply(
+        self, make_decorator: Callable[[DocFiller], Callable[[_F], _F]], *parts: str
+    ) -> Callable[[_F], _F]:
+        def decorator(obj: _F) -> _F:
+            if sys.flags.optimize >= 2:  # noqa: PLR2004
+                return obj
+
+            key = _key(
+                self._key,
+                *parts,
+                f"{obj.__module__}.{obj.__qualname__}",
+                obj.__doc__,
+            )
+            if (doc := _FILLED.get(key)) is not None:
+                obj.__doc__ = doc
+                return obj
+
+            out = make_decorator(self.filler)(obj)
+            if _RECORDED is not None and out is obj and obj.__doc__ is not None:
+                _RECORDED[key] = obj.__doc__
+            return out
+
+        return decorator
+
+    def decorate(self, func: _F) -> _F:
+        return self._apply(lambda filler: filler.decorate, "decorate")(func)
+
+    def __call__(
+        self, *templates: Any, _prepend: bool = False, **params: str
+    ) -> Callable[[_F], _F]:
+        return self._apply(
+            lambda filler: filler(*templates, _prepend=_prepend, **params),
+            "call",
+            *map(_describe, templates),
+            repr(_prepend),
+            repr(sorted(params.items())),
+        )
+
+    def inherit(
+        self, template: Any, _prepend: bool = False, **params: str
+    ) -> Callable[[_F], _F]:
+        return self._apply(
+            lambda filler: filler.inherit(template, _prepend=_prepend, **params),
+            "inherit",
+            _describe(template),
+            repr(_prepend),
+            repr(sorted(params.items())),
+        )
+
+    def factory_inherit_from_parent(
+        self, cls: type
+    ) -> Callable[..., Callable[[_F], _F]]:
+        """Same as :meth:`module_utilities.docfiller.DocFiller.factory_inherit_from_parent`."""
+
+        def factory(
+            name_or_method: str | Callable[..., Any] | None = None,
+            /,
+            _prepend: bool = False,
+            **params: str,
+        ) -> Callable[[_F], _F]:
+            def decorator(method: _F) -> _F:
+                template = (
+                    name_or_method
+                    if callable(name_or_method)
+                    else getattr(cls, name_or_method or method.__name__)
+                )
+                return self.inherit(template, _prepend=_prepend, **params)(method)
+
+            return decorator
+
+        return factory
+
+    def format(self, template: str) -> str:
+        """Fill ``template`` with :attr:`data` (e.g., for module docstrings)."""
+        key = _key(self._key, "format", template)
+        if (doc := _FILLED.get(key)) is None:
+            doc = template.format(**self.data)
+            if _RECORDED is not None:
+                _RECORDED[key] = doc
+        return doc
+
+
+def _make_docfiller() -> DocFiller:
+    from module_utilities.docfiller import DocFiller
+
+    return DocFiller.from_docstring(
+        _docstrings_shared, combine_keys="parameters"
+    ).update(**_references)
+
+
+docfiller = _DocFiller(
+    _make_docfiller,
+    _key(_docstrings_shared.__doc__, repr(sorted(_references.items()))),
+)
+
+
+def _generate() -> None:
+    """Write docstrings filled on import of :data:`_MODULES` to ``_FILLED_PATH``."""
+    global _RECORDED  # noqa: PLW0603
+
+    import importlib
+
+    names = [f"{__package__}.{name}" for name in _MODULES]
+    if any(name in sys.modules for name in names):
+        msg = "Generate filled docstrings before importing other modules"
+        raise RuntimeError(msg)
+
+    _FILLED.clear()
+    _RECORDED = {}
+    for name in names:
+        importlib.import_module(name)
+
+    with _FILLED_PATH.open("w", encoding="utf-8") as f:
+        json.dump(_RECORDED, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+if __name__ == "__main__":
+    import importlib
+
+    # run on the package module, which other modules use
+    importlib.import_module("analphipy._docstrings")._generate()  # noqa: SLF001
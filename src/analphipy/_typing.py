@@ -19,6 +19,8 @@ R = TypeVar("R")
 """Return Type"""
 
 Array: TypeAlias = NDArray["np.floating[Any]"]
+IndexArray: TypeAlias = NDArray["np.intp"]
+BoolArray: TypeAlias = NDArray["np.bool_"]
 ArrayLike: TypeAlias = "Sequence[float] | NDArray[np.floating[Any]]"
 Float_or_ArrayLike: TypeAlias = "float | ArrayLike"
 Float_or_Array: TypeAlias = "float | Array"
@@ -30,8 +32,8 @@ T_Float_or_Array = TypeVar("T_Float_or_Array", float, Array)
 
 # Quadrature
 
-QuadSegments_Integrals: TypeAlias = "float | list[float]"
-QuadSegments_Errors: TypeAlias = "float | list[float]"
+QuadSegments_Integrals: TypeAlias = "float | list[float] | Array"
+QuadSegments_Errors: TypeAlias = "float | list[float] | Array"
 QuadSegments_Outputs: TypeAlias = "dict[str, Any] | list[dict[str, Any]]"
 
 QuadSegments: TypeAlias = """(
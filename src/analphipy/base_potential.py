@@ -14,16 +14,16 @@ from attrs import field
 from ._attrs_utils import field_formatter
 from ._docstrings import docfiller
 from ._typing_compat import override
-from .measures import Measures
-from .norofrenkel import NoroFrenkelPair
 from .utils import minimize_phi
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Sequence
     from typing import Any, Literal
 
-    from ._typing import Array, Float_or_ArrayLike
+    from ._typing import Array, BoolArray, Float_or_ArrayLike
     from ._typing_compat import Self
+    from .measures import Measures
+    from .norofrenkel import NoroFrenkelPair
 
 
 # * attrs utilities
@@ -210,6 +210,120 @@ class PhiAbstract:
         msg = "Must implement in subclass"
         raise NotImplementedError(msg)
 
+    def phi_and_dphidr(self, r: Float_or_ArrayLike) -> tuple[Array, Array]:
+        r"""
+        Pair potential and its derivative.
+
+        Subclasses override this to share intermediate values between
+        :math:`\phi(r)` and :math:`d \phi(r) / dr`.
+
+        Parameters
+        ----------
+        r : array-like
+            pair separation
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+
+        """
+        return self.phi(r), self.dphidr(r)
+
+    def secondvirial_analytic(self, beta: Float_or_ArrayLike) -> Any:
+        """
+        Analytic second virial coefficient.
+
+        Subclasses with a closed form (or series) for the second virial
+        coefficient should override this method.
+        :class:`~analphipy.measures.Measures` and
+        :class:`~analphipy.norofrenkel.NoroFrenkelPair` use it in place of
+        numerical integration if available.
+
+        Parameters
+        ----------
+        beta : float or array-like
+            Inverse temperature(s).
+
+        Returns
+        -------
+        B2 : float or ndarray or None
+            Value(s) of second virial coefficient, or None if not available.
+
+        See Also
+        --------
+        ~analphipy.measures.secondvirial
+        """
+        return None
+
+    def secondvirial_dbeta_analytic(self, beta: Float_or_ArrayLike) -> Any:
+        """
+        Analytic derivative of second virial coefficient with respect to ``beta``.
+
+        Parameters
+        ----------
+        beta : float or array-like
+            Inverse temperature(s).
+
+        Returns
+        -------
+        B2_dbeta : float or ndarray or None
+            Value(s) of derivative, or None if not available.
+
+        See Also
+        --------
+        secondvirial_analytic
+        ~analphipy.measures.secondvirial_dbeta
+        """
+        return None
+
+    def sig_nf_analytic(self, beta: Float_or_ArrayLike) -> Any:
+        """
+        Analytic Noro-Frenkel effective hard sphere diameter.
+
+        This is relative to the WCA repulsive part of the potential defined by
+        ``r_min`` and ``phi_min``.
+
+        Parameters
+        ----------
+        beta : float or array-like
+            Inverse temperature(s).
+
+        Returns
+        -------
+        sig : float or ndarray or None
+            Value(s) of effective diameter, or None if not available.
+
+        See Also
+        --------
+        secondvirial_analytic
+        ~analphipy.norofrenkel.sig_nf
+        """
+        return None
+
+    def sig_nf_dbeta_analytic(self, beta: Float_or_ArrayLike) -> Any:
+        """
+        Analytic derivative of :meth:`sig_nf_analytic` with respect to ``beta``.
+
+        Parameters
+        ----------
+        beta : float or array-like
+            Inverse temperature(s).
+
+        Returns
+        -------
+        sig_dbeta : float or ndarray or None
+            Value(s) of derivative, or None if not available.
+
+        See Also
+        --------
+        secondvirial_analytic
+        ~analphipy.norofrenkel.sig_nf_dbeta
+        """
+        return None
+
     def minimize(
         self,
         r0: float | Literal["mean"],
@@ -299,6 +413,8 @@ class PhiAbstract:
             msg = "must set `self.r_min` to use NoroFrenkel"
             raise ValueError(msg)
 
+        from .norofrenkel import NoroFrenkelPair
+
         for k in ("phi", "segments", "r_min", "phi_min"):
             if k not in kws:
                 kws[k] = getattr(self, k)
@@ -320,6 +436,8 @@ class PhiAbstract:
         nf : :class:`analphipy.measures.Measures`
 
         """
+        from .measures import Measures
+
         for k in ("phi", "segments"):
             if k not in kws:
                 kws[k] = getattr(self, k)
@@ -383,35 +501,141 @@ class PhiCutBase(PhiAbstract):
             )
         )
 
-    @_docfiller_phiabstract()
-    @override
-    def phi(self, r: Float_or_ArrayLike) -> Array:  # noqa: D102
-        r = np.asarray(r)
-        v = np.empty_like(r)
+    def _split(
+        self, r: Array, assume_sorted: bool
+    ) -> tuple[slice | BoolArray, slice | BoolArray]:
+        """
+        Index of ``r`` inside (``left``) and outside (``right``) of ``rcut``.
+
+        If ``assume_sorted``, these are slices (views) rather than boolean masks.
+        """
+        if assume_sorted:
+            if r.ndim != 1:
+                msg = "assume_sorted requires one dimensional r"
+                raise ValueError(msg)
+            n = int(np.searchsorted(r, self.rcut, side="right"))
+            return slice(None, n), slice(n, None)
 
         left = r <= self.rcut
-        right = ~left
+        return left, ~left
+
+    @staticmethod
+    def _empty_like(r: Array, out: Array | None) -> Array:
+        if out is None:
+            return np.empty_like(r)
+        if out.shape != r.shape:
+            msg = f"out.shape={out.shape} must equal r.shape={r.shape}"
+            raise ValueError(msg)
+        return out
 
-        v[right] = 0.0
+    @docfiller.decorate
+    @override
+    def phi(
+        self,
+        r: Float_or_ArrayLike,
+        assume_sorted: bool = False,
+        out: Array | None = None,
+    ) -> Array:
+        """
+        Pair potential.
+
+        Parameters
+        ----------
+        {r}
+        {assume_sorted}
+        out : ndarray, optional
+            Array with same shape as ``r`` to store output in.
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
+        r = np.asarray(r)
+        left, right = self._split(r, assume_sorted)
+        v = self._empty_like(r, out)
 
-        if np.any(left):
-            v[left] = self.phi_base.phi(r[left]) + self._vcorrect(r[left])
+        v[right] = 0.0
+        r_left = r[left]
+        if r_left.size:
+            v[left] = self.phi_base.phi(r_left) + self._vcorrect(r_left)
         return v
 
-    @_docfiller_phiabstract()
+    @docfiller.decorate
     @override
-    def dphidr(self, r: Float_or_ArrayLike) -> Array:  # noqa: D102
-        r = np.asarray(r)
-        dvdr = np.empty_like(r)
+    def dphidr(
+        self,
+        r: Float_or_ArrayLike,
+        assume_sorted: bool = False,
+        out: Array | None = None,
+    ) -> Array:
+        r"""
+        Derivative of pair potential.
 
-        left = r <= self.rcut
-        right = ~left
+        This returns the value of :math:`d \phi(r) / dr`
 
-        dvdr[right] = 0.0
-        dvdr[left] = self.phi_base.dphidr(r[left]) + self._dvdrcorrect(r[left])
+        Parameters
+        ----------
+        {r}
+        {assume_sorted}
+        out : ndarray, optional
+            Array with same shape as ``r`` to store output in.
 
+        Returns
+        -------
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        r = np.asarray(r)
+        left, right = self._split(r, assume_sorted)
+        dvdr = self._empty_like(r, out)
+
+        dvdr[right] = 0.0
+        r_left = r[left]
+        if r_left.size:
+            dvdr[left] = self.phi_base.dphidr(r_left) + self._dvdrcorrect(r_left)
         return dvdr
 
+    @docfiller.decorate
+    @override
+    def phi_and_dphidr(
+        self,
+        r: Float_or_ArrayLike,
+        assume_sorted: bool = False,
+        out: tuple[Array, Array] | None = None,
+    ) -> tuple[Array, Array]:
+        """
+        Pair potential and its derivative.
+
+        Parameters
+        ----------
+        {r}
+        {assume_sorted}
+        out : tuple of ndarray, optional
+            Arrays with same shape as ``r`` to store ``phi`` and ``dphidr`` in.
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        r = np.asarray(r)
+        left, right = self._split(r, assume_sorted)
+        v_out, dvdr_out = (None, None) if out is None else out
+        v = self._empty_like(r, v_out)
+        dvdr = self._empty_like(r, dvdr_out)
+
+        v[right] = 0.0
+        dvdr[right] = 0.0
+        r_left = r[left]
+        if r_left.size:
+            v_left, dvdr_left = self.phi_base.phi_and_dphidr(r_left)
+            v[left] = v_left + self._vcorrect(r_left)
+            dvdr[left] = dvdr_left + self._dvdrcorrect(r_left)
+        return v, dvdr
+
     def _vcorrect(self, r: Array) -> Array:
         raise NotImplementedError
 
@@ -457,6 +681,23 @@ class PhiCut(PhiCutBase):
     def _dvdrcorrect(self, r: Array) -> Array:
         return np.array(0.0)
 
+    @property
+    def _is_uncut(self) -> bool:
+        """Whether ``phi_base`` vanishes for ``r >= rcut``, so cutting has no effect."""
+        return self._vcut == 0.0 and self.rcut >= self.phi_base.segments[-1]
+
+    @_docfiller_phiabstract()
+    @override
+    def secondvirial_analytic(self, beta: Float_or_ArrayLike) -> Any:  # noqa: D102
+        return self.phi_base.secondvirial_analytic(beta) if self._is_uncut else None
+
+    @_docfiller_phiabstract()
+    @override
+    def secondvirial_dbeta_analytic(self, beta: Float_or_ArrayLike) -> Any:  # noqa: D102
+        return (
+            self.phi_base.secondvirial_dbeta_analytic(beta) if self._is_uncut else None
+        )
+
 
 @attrs.frozen
 @docfiller.inherit(PhiCutBase)
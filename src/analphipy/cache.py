@@ -0,0 +1,587 @@
+"""
+Caching of analysis results (:mod:`analphipy.cache`)
+====================================================
+
+Classes and routines to cache the results of
+:class:`~analphipy.norofrenkel.NoroFrenkelPair` and
+:class:`~analphipy.measures.Measures` methods between processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle  # noqa: S403
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future
+from functools import wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+import attrs
+import numpy as np
+
+from ._typing_compat import override
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any, TypeVar
+
+    from ._typing_compat import Self
+
+    _F = TypeVar("_F", bound=Callable[..., Any])
+
+
+__all__ = ["CacheInfo", "PersistentCache", "single_flight", "stable_hash"]
+
+
+# Bump if the format of keys changes, so that old entries are not reused.
+_KEY_VERSION = 1
+
+_MISSING = object()
+
+
+def _canonical(obj: Any) -> str:  # noqa: C901, PLR0911
+    """
+    Canonical string representation of ``obj``.
+
+    Raises
+    ------
+    TypeError
+        If ``obj`` does not have a representation that is stable between
+        processes.
+    """
+    if obj is None or isinstance(obj, (bool, str)):
+        return repr(obj)
+    if isinstance(obj, (int, np.integer)):
+        return repr(int(obj))
+    if isinstance(obj, (float, np.floating)):
+        return repr(float(obj))
+    if isinstance(obj, np.dtype):
+        return "dtype:" + obj.str
+    if isinstance(obj, np.ndarray):
+        return f"ndarray({obj.dtype.str},{obj.shape},{_canonical(obj.tolist())})"
+    if isinstance(obj, Mapping):
+        items = sorted(f"{_canonical(k)}:{_canonical(v)}" for k, v in obj.items())
+        return "{" + ",".join(items) + "}"
+    if isinstance(obj, (set, frozenset)):
+        return "set(" + ",".join(sorted(_canonical(x) for x in obj)) + ")"
+    if isinstance(obj, (list, tuple)):
+        return "(" + ",".join(_canonical(x) for x in obj) + ")"
+    if attrs.has(type(obj)):
+        # fields which identify object (e.g., CubicTable by its coefficients)
+        fields = {
+            f.name: getattr(obj, f.name)
+            for f in attrs.fields(type(obj))
+            if f.init and f.eq
+        }
+        return f"{type(obj).__module__}.{type(obj).__qualname__}{_canonical(fields)}"
+    if callable(obj) and hasattr(obj, "__self__") and hasattr(obj, "__func__"):
+        # bound method of an object with a stable representation
+        return f"{obj.__func__.__qualname__}@{_canonical(obj.__self__)}"
+
+    msg = f"No stable representation of {type(obj)}"
+    raise TypeError(msg)
+
+
+def stable_hash(obj: Any) -> str:
+    """
+    Hash of ``obj`` which is stable between processes.
+
+    Parameters
+    ----------
+    obj : object
+        Object to hash. May be composed of ``None``, numbers, strings, numpy
+        arrays and dtypes, sequences, mappings, attrs classes (e.g., pair
+        potentials), and bound methods of attrs classes (e.g.,
+        ``LennardJones().phi``). Other objects (e.g., a ``lambda``) raise a
+        ``TypeError``.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+
+    Examples
+    --------
+    >>> import analphipy.potential as pots
+    >>> stable_hash(pots.LennardJones().phi) == stable_hash(pots.LennardJones().phi)
+    True
+    >>> stable_hash(pots.LennardJones().phi) == stable_hash(
+    ...     pots.LennardJones(sig=1.1).phi
+    ... )
+    False
+    """
+    return hashlib.sha256(
+        f"{_KEY_VERSION}:{_canonical(obj)}".encode(), usedforsecurity=False
+    ).hexdigest()
+
+
+class PersistentCache:
+    """
+    On-disk key/value store backed by SQLite.
+
+    Values are stored with :mod:`pickle`. The store can be shared between
+    threads and processes. Instances can be pickled (e.g., passed to
+    :func:`analphipy.sweep.map_nf`), in which case each process opens its own
+    connection to the same database.
+
+    Parameters
+    ----------
+    path : str or path-like
+        Path to database file. Created if it does not exist.
+    maxsize : int, optional
+        Maximum number of entries to store. If the number of entries exceeds
+        ``maxsize``, the least recently used entries are removed. Default is
+        to not limit the number of entries.
+    timeout : float, default=60.0
+        Seconds to wait for a lock on the database held by another process.
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> import analphipy.potential as pots
+    >>> with tempfile.TemporaryDirectory() as d:
+    ...     store = PersistentCache(f"{d}/cache.sqlite")
+    ...     a = pots.LennardJones().to_nf(persistent_cache=store).lam(1.0)
+    ...     # values of `lam`, and `sig`, `secondvirial` used to calculate it, are stored
+    ...     print(len(store))
+    ...     # new object (or new process) reuses stored values
+    ...     b = pots.LennardJones().to_nf(persistent_cache=store).lam(1.0)
+    ...     print(a == b)
+    ...     store.close()
+    3
+    True
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        maxsize: int | None = None,
+        timeout: float = 60.0,
+    ) -> None:
+        if maxsize is not None and maxsize < 1:
+            msg = f"maxsize must be None or positive, not {maxsize}"
+            raise ValueError(msg)
+
+        self.path = Path(path)
+        self.maxsize = maxsize
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._pid: int | None = None
+        self._finalizer: weakref.finalize[[], PersistentCache] | None = None
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(path={str(self.path)!r}, maxsize={self.maxsize})"
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {"path": self.path, "maxsize": self.maxsize, "timeout": self.timeout}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__init__(**state)  # type: ignore[misc]  # pylint: disable=unnecessary-dunder-call
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections cannot be shared with child processes.
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.timeout,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, atime REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_atime ON cache (atime)")
+            self._conn = conn
+            self._pid = os.getpid()
+            # close connection when object is garbage collected
+            self._finalizer = weakref.finalize(self, conn.close)
+        return self._conn
+
+    def close(self) -> None:
+        """Close connection to database."""
+        with self._lock:
+            if self._finalizer is not None and self._pid == os.getpid():
+                self._finalizer()
+            self._conn = self._finalizer = None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get stored value.
+
+        Parameters
+        ----------
+        key : str
+            Key, typically from :func:`stable_hash`.
+        default : object, optional
+            Value to return if ``key`` is not in the store.
+
+        Returns
+        -------
+        object
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+            if self.maxsize is not None:
+                conn.execute(
+                    "UPDATE cache SET atime = ? WHERE key = ?", (time.time(), key)
+                )
+        return pickle.loads(row[0])  # noqa: S301
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store value.
+
+        Parameters
+        ----------
+        key : str
+            Key, typically from :func:`stable_hash`.
+        value : object
+            Picklable value to store.
+        """
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, atime) VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+            if self.maxsize is not None:
+                conn.execute(
+                    "DELETE FROM cache WHERE key IN "
+                    "(SELECT key FROM cache ORDER BY atime DESC, rowid DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.maxsize,),
+                )
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(
+                self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            )
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._connect().execute("DELETE FROM cache")
+
+
+def as_persistent_cache(
+    persistent_cache: PersistentCache | str | os.PathLike[str] | None,
+) -> PersistentCache | None:
+    """Convert path to :class:`PersistentCache`."""
+    if persistent_cache is None or isinstance(persistent_cache, PersistentCache):
+        return persistent_cache
+    return PersistentCache(persistent_cache)
+
+
+def cache_token_from_params(name: str, **params: Any) -> str:
+    """
+    Create token identifying calculation from parameters.
+
+    Raises
+    ------
+    ValueError
+        If the parameters cannot be hashed in a stable way.
+    """
+    try:
+        return stable_hash((name, params))
+    except TypeError as e:
+        msg = (
+            f"Could not create a stable cache token for {name} ({e}). "
+            "Pass `cache_token` to use a persistent cache."
+        )
+        raise ValueError(msg) from e
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of in-memory cache (see :func:`functools.lru_cache`)."""
+
+    #: Number of lookups which found a value.
+    hits: int
+    #: Number of lookups which did not find a value.
+    misses: int
+    #: Maximum number of entries per method.
+    maxsize: int | None
+    #: Current number of entries.
+    currsize: int
+
+
+def _round_key(key: Any, digits: int) -> Any:
+    """Round floats in positional arguments of :func:`module_utilities.cached.meth` key."""
+    if not (isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], tuple)):  # noqa: PLR2004
+        return key
+    args, kws = key
+    return (
+        tuple(
+            float(f"{x:.{digits - 1}e}") if isinstance(x, (float, np.floating)) else x
+            for x in args
+        ),
+        kws,
+    )
+
+
+class _MethodCache(OrderedDict):  # type: ignore[type-arg]
+    """
+    Per method storage of cached values.
+
+    Holds at most ``maxsize`` values, discarding the least recently used.
+    If ``key_digits`` is set, float arguments (e.g., ``beta``) are rounded to
+    this many significant digits in keys. Misses are looked up in the
+    persistent cache, and new values are written through to it.  Access is
+    guarded by ``lock``, which is shared with the owning :class:`InstanceCache`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        persistent: PersistentCache | None,
+        token: str | None,
+        maxsize: int | None,
+        key_digits: int | None = None,
+        lock: threading.RLock | None = None,
+    ) -> None:
+        super().__init__()
+        self._lock = threading.RLock() if lock is None else lock
+        self._name = name
+        self._persistent = persistent
+        self._token = token
+        self.maxsize = maxsize
+        self.key_digits = key_digits
+        self.hits = self.misses = 0
+
+    def _key(self, key: Any) -> Any:
+        if self.key_digits is None:
+            return key
+        return _round_key(key, self.key_digits)
+
+    def _digest(self, key: Any) -> str | None:
+        if self._persistent is None:
+            return None
+        try:
+            return stable_hash((self._token, self._name, key))
+        except TypeError:
+            # e.g., callable in kwargs.  Keep in memory only.
+            return None
+
+    def _insert(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        if self.maxsize is not None and len(self) > self.maxsize:
+            self.popitem(last=False)
+
+    @override
+    def __getitem__(self, key: Any) -> Any:
+        key = self._key(key)
+        with self._lock:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                self.move_to_end(key)
+                return value
+
+        # The persistent cache may wait on disk, so do not hold the lock.
+        if (digest := self._digest(key)) is not None:
+            value = self._persistent.get(digest, _MISSING)  # type: ignore[union-attr]
+
+        with self._lock:
+            if value is _MISSING:
+                self.misses += 1
+                raise KeyError(key)
+            self.hits += 1
+            self._insert(key, value)
+        return value
+
+    @override
+    def __setitem__(self, key: Any, value: Any) -> None:
+        key = self._key(key)
+        with self._lock:
+            self._insert(key, value)
+        if (digest := self._digest(key)) is not None:
+            self._persistent.set(digest, value)  # type: ignore[union-attr]
+
+
+class _Flight:
+    """Calculation in progress by thread ``owner``. ``future`` is created for waiting threads."""
+
+    __slots__ = ("future", "owner")
+
+    def __init__(self, owner: int) -> None:
+        self.owner = owner
+        self.future: Future[Any] | None = None
+
+
+class InstanceCache(dict):  # type: ignore[type-arg]  # noqa: FURB189
+    """
+    Storage for :mod:`module_utilities.cached` results of an instance.
+
+    :func:`module_utilities.cached.meth` creates an empty dict per method on
+    first call. These are replaced by storage which holds at most ``maxsize``
+    values, optionally rounds float arguments to ``key_digits`` significant
+    digits, and reads from and writes to an optional :class:`PersistentCache`.
+    In-memory values are dropped when pickled.
+
+    The storage is thread safe, and tracks calculations in progress for
+    :func:`single_flight`.
+    """
+
+    def __init__(
+        self,
+        persistent: PersistentCache | None = None,
+        token: str | None = None,
+        maxsize: int | None = None,
+        key_digits: int | None = None,
+    ) -> None:
+        if maxsize is not None and maxsize < 0:
+            msg = f"maxsize must be None or non-negative, not {maxsize}"
+            raise ValueError(msg)
+        if key_digits is not None and key_digits < 1:
+            msg = f"key_digits must be None or positive, not {key_digits}"
+            raise ValueError(msg)
+
+        super().__init__()
+        self.persistent = persistent
+        self.token = token
+        self.maxsize = maxsize
+        self.key_digits = key_digits
+
+        self._lock = threading.RLock()
+        # calculations in progress
+        self._flights: dict[Any, _Flight] = {}
+
+    @override
+    def __setitem__(self, key: str, value: Any) -> None:
+        with self._lock:
+            if type(value) is dict and not value:
+                if isinstance(self.get(key), _MethodCache):
+                    # another thread created the storage first
+                    return
+                value = _MethodCache(
+                    key,
+                    self.persistent,
+                    self.token,
+                    self.maxsize,
+                    self.key_digits,
+                    lock=self._lock,
+                )
+            super().__setitem__(key, value)
+
+    @override
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Cached values are not pickled (e.g., when sending an object to a
+        # process pool).  The persistent cache is shared.
+        return (
+            type(self),
+            (self.persistent, self.token, self.maxsize, self.key_digits),
+        )
+
+    def info(self, name: str | None = None) -> CacheInfo:
+        """Statistics for method ``name``, or totals over all methods."""
+        with self._lock:
+            stores = [
+                v
+                for k, v in self.items()
+                if isinstance(v, _MethodCache) and (name is None or k == name)
+            ]
+            return CacheInfo(
+                hits=sum(x.hits for x in stores),
+                misses=sum(x.misses for x in stores),
+                maxsize=self.maxsize,
+                currsize=sum(len(x) for x in stores),
+            )
+
+    def call_once(
+        self, key: Any, func: Callable[..., Any], /, *args: Any, **kws: Any
+    ) -> Any:
+        """
+        Call ``func(*args, **kws)``, unless a call with the same ``key`` is in progress.
+
+        If another thread is already calculating ``key``, wait for, and
+        return, its result (or raise its exception).  Nested calls with the
+        same ``key`` from the calculating thread call ``func`` directly.
+        """
+        ident = threading.get_ident()
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                self._flights[key] = _Flight(ident)
+            elif flight.owner != ident and flight.future is None:
+                flight.future = Future()
+
+        if flight is not None:
+            if flight.owner == ident:
+                return func(*args, **kws)
+            return flight.future.result()  # type: ignore[union-attr]
+
+        try:
+            result = func(*args, **kws)
+        except BaseException as e:
+            if (future := self._land(key)) is not None:
+                future.set_exception(e)
+            raise
+        if (future := self._land(key)) is not None:
+            future.set_result(result)
+        return result
+
+    def _land(self, key: Any) -> Future[Any] | None:
+        """Remove calculation of ``key``, returning future of any waiting threads."""
+        with self._lock:
+            return self._flights.pop(key).future
+
+
+def single_flight(func: _F) -> _F:
+    """
+    Decorate cached method so that concurrent calls share a single calculation.
+
+    Place above :func:`module_utilities.cached.meth`.  If several threads call
+    the method of the same instance with the same arguments at once, the first
+    calculates the value (filling the cache), and the others wait for, and
+    return, its result. Calls with unhashable arguments are not shared.
+
+    Requires ``self._cache`` to be an :class:`InstanceCache`.
+    """
+    name = func.__name__
+
+    @wraps(func)
+    def wrapper(self: Any, /, *args: Any, **kws: Any) -> Any:
+        # Unlike :func:`module_utilities.cached.meth`, arguments are not bound
+        # to the signature (which is slow), so ``f(1.0)`` and ``f(beta=1.0)``
+        # are calculated separately if called at once.
+        try:
+            key = (name, args, frozenset(kws.items()) if kws else None)
+            hash(key)
+        except TypeError:
+            return func(self, *args, **kws)
+        return self._cache.call_once(key, func, self, *args, **kws)
+
+    return wrapper  # type: ignore[return-value]
@@ -5,17 +5,35 @@ Routines to calculate measures of pair potentials (:mod:`analphipy.measures`)
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from itertools import pairwise
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
 from module_utilities import cached
 
 from ._docstrings import docfiller
-from .utils import TWO_PI, add_quad_kws, combine_segmets, quad_segments
+from .cache import (
+    InstanceCache,
+    as_persistent_cache,
+    cache_token_from_params,
+    single_flight,
+)
+from .utils import (
+    TWO_PI,
+    add_quad_kws,
+    combine_segmets,
+    gauss_legendre_nodes,
+    quad_segments,
+    quad_segments_beta,
+    split_segments,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Mapping, Sequence
-    from typing import Any
+    from concurrent.futures import Executor
+    from os import PathLike
+    from typing import Any, Literal
 
     from ._typing import (
         Array,
@@ -26,11 +44,13 @@ if TYPE_CHECKING:
         QuadSegments,
     )
     from .base_potential import PhiAbstract
+    from .cache import CacheInfo, PersistentCache
 
 
 __all__ = [
     "Measures",
     "diverg_js_cont",
+    "diverg_js_matrix",
     "diverg_kl_cont",
     "secondvirial",
     "secondvirial_dbeta",
@@ -38,10 +58,38 @@ __all__ = [
 ]
 
 
+def _analytic_from_phi(
+    phi: Phi_Signature, segments: ArrayLike, name: str, beta: Float_or_ArrayLike
+) -> Any:
+    """
+    Evaluate analytic method ``name`` of the potential which defines ``phi``.
+
+    This applies if ``phi`` is the bound method ``phi`` of a
+    :class:`~analphipy.base_potential.PhiAbstract` instance, and ``segments``
+    span the same range as the potential's segments. Otherwise (or if the
+    potential has no closed form), return None.
+    """
+    potential = getattr(phi, "__self__", None)
+    method = getattr(potential, name, None)
+    if getattr(phi, "__name__", None) != "phi" or not callable(method):
+        return None
+
+    ref = getattr(potential, "segments", None)
+    segments = np.asarray(segments, dtype=np.float64)
+    if (
+        ref is None
+        or segments.ndim != 1
+        or len(segments) < 2  # noqa: PLR2004
+        or (segments[0], segments[-1]) != (ref[0], ref[-1])
+    ):
+        return None
+    return method(beta)
+
+
 @docfiller.decorate
 def secondvirial(
     phi: Phi_Signature,
-    beta: float,
+    beta: Float_or_ArrayLike,
     segments: ArrayLike,
     err: bool = False,
     full_output: bool = False,
@@ -57,7 +105,7 @@ def secondvirial(
     Parameters
     ----------
     {phi}
-    {beta}
+    {beta_array}
     {segments}
     {err}
     {full_output}
@@ -66,7 +114,7 @@ def secondvirial(
 
     Returns
     -------
-    B2 : float
+    B2 : float or ndarray
         Value of second virial coefficient.
     {error_summed}
     {full_output_summed}
@@ -74,18 +122,23 @@ def secondvirial(
     See Also
     --------
     ~analphipy.utils.quad_segments
+    ~analphipy.utils.quad_segments_beta
+
+    Notes
+    -----
+    For an array of ``beta`` values, passing ``method="gauss"`` evaluates
+    ``phi`` once on the quadrature nodes for all ``beta``.
 
     """
 
-    def integrand(r: Float_or_Array) -> Array:
+    def integrand(r: Float_or_Array, beta: Float_or_Array) -> Array:
         out: Array = TWO_PI * r**2 * (1 - np.exp(-beta * phi(r)))
         return out
 
-    return quad_segments(
+    return quad_segments_beta(
         integrand,
+        beta=beta,
         segments=segments,
-        sum_integrals=True,
-        sum_errors=True,
         err=err,
         full_output=full_output,
         **kws,
@@ -95,7 +148,7 @@ def secondvirial(
 @docfiller.decorate
 def secondvirial_dbeta(
     phi: Phi_Signature,
-    beta: float,
+    beta: Float_or_ArrayLike,
     segments: ArrayLike,
     err: bool = False,
     full_output: bool = False,
@@ -111,14 +164,14 @@ def secondvirial_dbeta(
     Parameters
     ----------
     {phi}
-    {beta}
+    {beta_array}
     {segments}
     {err}
     {full_output}
 
     Returns
     -------
-    dB2dbeta : float
+    dB2dbeta : float or ndarray
         Value of derivative.
     {error_summed}
     {full_output_summed}
@@ -126,16 +179,16 @@ def secondvirial_dbeta(
 
     """
 
-    def integrand(r: Float_or_Array) -> Array:
+    def integrand(r: Float_or_Array, beta: Float_or_Array) -> Array:
         v = phi(r)
-        out = np.array(0.0) if np.isinf(v) else TWO_PI * r**2 * v * np.exp(-beta * v)
+        with np.errstate(invalid="ignore"):
+            out = np.where(np.isinf(v), 0.0, TWO_PI * r**2 * v * np.exp(-beta * v))
         return cast("Array", out)
 
-    return quad_segments(
+    return quad_segments_beta(
         integrand,
+        beta=beta,
         segments=segments,
-        sum_integrals=True,
-        sum_errors=True,
         err=err,
         full_output=full_output,
         **kws,
@@ -319,11 +372,105 @@ def diverg_kl_cont(
 def diverg_js_disc(
     p: Float_or_ArrayLike, q: Float_or_ArrayLike, axis: int | None = None
 ) -> Float_or_Array:
-    p, q = np.asarray(p), np.asarray(q)
+    return cast("Float_or_Array", diverg_js_integrand(p, q).sum(axis=axis))
+
+
+def _disc_blocks(
+    x: ArrayLike | Iterator[ArrayLike], axis: int | None, chunksize: int
+) -> Iterator[Any]:
+    """Iterator over blocks of ``x`` along ``axis``."""
+    if isinstance(x, Iterator):
+        return x
+
+    # np.asarray keeps memory-mapped data as a view
+    x = np.atleast_1d(np.asarray(x))
+    axis = 0 if axis is None else axis
+    n = x.shape[axis]
+    step = max(1, chunksize * n // max(x.size, 1))
+    return (
+        x[(slice(None),) * (axis % x.ndim) + (slice(start, start + step),)]
+        for start in range(0, n, step)
+    )
+
+
+def _diverg_disc_chunked(
+    integrand: Callable[[Array, Array], Array],
+    p: ArrayLike | Iterator[ArrayLike],
+    q: ArrayLike | Iterator[ArrayLike],
+    axis: int | None,
+    chunksize: int,
+) -> Float_or_Array:
+    if chunksize < 1:
+        msg = f"chunksize={chunksize} must be positive"
+        raise ValueError(msg)
+
+    out: Any = None
+    for p_block, q_block in zip(
+        _disc_blocks(p, axis, chunksize),
+        _disc_blocks(q, axis, chunksize),
+        strict=True,
+    ):
+        block = integrand(
+            np.asarray(p_block, dtype=np.float64), np.asarray(q_block, dtype=np.float64)
+        ).sum(axis=axis)
+        out = block if out is None else out + block
+
+    if out is None:
+        msg = "p and q must have at least one block"
+        raise ValueError(msg)
+    return cast("Float_or_Array", out)
+
+
+@docfiller(summary="Calculate discrete Kullback-Leibler divergence in chunks")
+def diverg_kl_disc_chunked(
+    p: ArrayLike | Iterator[ArrayLike],
+    q: ArrayLike | Iterator[ArrayLike],
+    axis: int | None = None,
+    chunksize: int = 2**20,
+) -> Float_or_Array:
+    """
+    {summary}.
 
-    m = 0.5 * (p + q)
+    Same as :func:`diverg_kl_disc`, but with memory use bounded by the size of
+    a block rather than that of ``p`` and ``q``.
 
-    return 0.5 * (diverg_kl_disc(p, m, axis=axis) + diverg_kl_disc(q, m, axis=axis))
+    Parameters
+    ----------
+    p, q : array-like or iterator of array-like
+        Probabilities to consider. Array-like values (e.g.,
+        :class:`numpy.memmap` or nested lists) are processed in blocks along
+        ``axis`` (along the first axis if ``axis`` is None). Iterators (e.g.,
+        generators) yield blocks of probabilities, where blocks of ``p`` and
+        ``q`` are paired up, and the full probabilities are the blocks
+        concatenated along ``axis``.
+    axis : int, optional
+        Axis to sum over. Default is to sum over all values.
+    chunksize : int, default=2**20
+        Approximate number of elements per block for array ``p`` and ``q``.
+
+    Returns
+    -------
+    results : float or ndarray
+        Value of divergence.
+
+    References
+    ----------
+    {kl_link}
+
+    """
+    return _diverg_disc_chunked(diverg_kl_integrand, p, q, axis, chunksize)
+
+
+@docfiller(
+    diverg_kl_disc_chunked, summary="Discrete Jensen-Shannon divergence in chunks"
+)
+def diverg_js_disc_chunked(
+    p: ArrayLike | Iterator[ArrayLike],
+    q: ArrayLike | Iterator[ArrayLike],
+    axis: int | None = None,
+    chunksize: int = 2**20,
+) -> Float_or_Array:
+    return _diverg_disc_chunked(diverg_js_integrand, p, q, axis, chunksize)
 
 
 def diverg_js_integrand(
@@ -334,9 +481,28 @@ def diverg_js_integrand(
     p = np.asarray(p)
     q = np.asarray(q)
 
-    m = 0.5 * (p + q)
-
-    out = 0.5 * (diverg_kl_integrand(p, m) + diverg_kl_integrand(q, m))
+    # With m = (p + q) / 2 and s = p + q, the integrand is
+    # (p * log(2 * p / s) + q * log(2 * q / s)) / 2.  Dividing by s rather than
+    # m avoids m underflowing to zero for denormal p.  Terms with p == 0 are
+    # zero, as is 2 * p, so the division and log are skipped there (``where``).
+    s = p + q
+    if s.ndim == 0:
+        # scalar calls from scipy.integrate.quad
+        value: Array = 0.5 * np.sum(
+            [x * np.log(2.0 * x / s) for x in (float(p), float(q)) if x != 0.0]
+        )
+        return value if volume is None else value * np.asarray(volume)
+
+    out = np.zeros(s.shape)
+    term = np.empty_like(out)
+    for x in (p, q):
+        nonzero = x != 0.0
+        np.multiply(x, 2.0, out=term)
+        np.divide(term, s, out=term, where=nonzero)
+        np.log(term, out=term, where=nonzero)
+        term *= x
+        out += term
+    out *= 0.5
 
     if volume is not None:
         out *= np.asarray(volume)
@@ -375,6 +541,83 @@ def diverg_js_cont(
     )
 
 
+@docfiller.decorate
+def diverg_js_matrix(
+    potentials: Sequence[PhiAbstract],
+    beta: Float_or_ArrayLike,
+    kind: Literal["boltz", "mayer"] = "boltz",
+    volume: str | Callable[[Float_or_Array], Float_or_Array] = "3d",
+    order: int = 200,
+) -> Array:
+    r"""
+    Jensen-Shannon divergence between all pairs of potentials.
+
+    Each potential is evaluated once, on Gauss-Legendre nodes (see
+    :func:`analphipy.utils.gauss_legendre_nodes`) over the combined segments
+    of all potentials, split at the minimum ``r_min`` of each potential (if
+    set).  The divergences for all values of ``beta`` and all
+    pairs are then computed from these values.  As the divergence is
+    symmetric, only pairs ``i < j`` are integrated.
+
+    Parameters
+    ----------
+    potentials : sequence of :class:`analphipy.base_potential.PhiAbstract`
+        Potentials to compare.
+    {beta_array}
+    kind : {{"boltz", "mayer"}}
+        Compare Boltzmann factors :math:`\exp(-\beta \phi(r))` (as in
+        :meth:`Measures.boltz_diverg_js`) or Mayer f-functions
+        :math:`\exp(-\beta \phi(r)) - 1` (as in
+        :meth:`Measures.mayer_diverg_js`).
+    {volume_int_func}
+    order : int, default=200
+        Number of quadrature nodes per segment.
+
+    Returns
+    -------
+    diverg : ndarray
+        Array of shape ``(*beta.shape, n, n)``, with ``n = len(potentials)``,
+        where ``diverg[..., i, j]`` is the divergence between
+        ``potentials[i]`` and ``potentials[j]``.
+
+    See Also
+    --------
+    ~analphipy.measures.diverg_js_cont
+    """
+    if kind not in {"boltz", "mayer"}:
+        msg = f"kind={kind!r} must be one of 'boltz' or 'mayer'"
+        raise ValueError(msg)
+
+    segments: list[float] = []
+    for potential in potentials:
+        segments = combine_segmets(segments, potential.segments)
+    # break at minima, so that narrow wells are resolved
+    segments = split_segments(segments, *(potential.r_min for potential in potentials))
+
+    nodes = [gauss_legendre_nodes(a, b, order) for a, b in pairwise(segments)]
+    r = np.concatenate([x for x, _ in nodes])
+    weights = np.concatenate([w for _, w in nodes]) * _check_volume_func(volume)(r)
+
+    betas = np.asarray(beta, dtype=np.float64)
+    # Boltzmann or Mayer function of each potential at each node and beta
+    funcs = np.exp(
+        -betas[..., None, None]
+        * np.array([potential.phi(r) for potential in potentials])
+    )
+    if kind == "mayer":
+        funcs -= 1.0
+
+    n = len(potentials)
+    out = np.zeros((*betas.shape, n, n))
+    for i in range(n - 1):
+        diverg = diverg_js_integrand(
+            funcs[..., i : i + 1, :], funcs[..., i + 1 :, :], weights
+        ).sum(axis=-1)
+        out[..., i, i + 1 :] = diverg
+        out[..., i + 1 :, i] = diverg
+    return out
+
+
 @docfiller.decorate
 class Measures:
     """
@@ -385,6 +628,10 @@ class Measures:
     {phi}
     {segments}
     {quad_kws}
+    {persistent_cache}
+    {cache_token}
+    {cache_maxsize}
+    {cache_key_digits}
 
     """
 
@@ -393,26 +640,76 @@ class Measures:
         phi: Phi_Signature,
         segments: Sequence[float],
         quad_kws: Mapping[str, Any] | None = None,
+        persistent_cache: PersistentCache | str | PathLike[str] | None = None,
+        cache_token: str | None = None,
+        cache_maxsize: int | None = None,
+        cache_key_digits: int | None = None,
     ) -> None:
         self.phi = phi
         self.segments = segments
         if quad_kws is None:
             quad_kws = {}
         self.quad_kws = quad_kws
-        self._cache: dict[str, Any] = {}
 
+        persistent_cache = as_persistent_cache(persistent_cache)
+        if persistent_cache is not None and cache_token is None:
+            cache_token = cache_token_from_params(
+                type(self).__name__, **self._token_params()
+            )
+        self._cache: dict[str, Any] = InstanceCache(
+            persistent_cache, cache_token, cache_maxsize, cache_key_digits
+        )
+
+    def _token_params(self) -> dict[str, Any]:
+        """Parameters identifying calculation (see ``cache_token``)."""
+        return {"phi": self.phi, "segments": self.segments, "quad_kws": self.quad_kws}
+
+    def cache_info(self, name: str | None = None) -> CacheInfo:
+        """
+        Statistics of the in-memory cache.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of method (e.g., ``"sig"``). Default is to total over all
+            cached methods.
+
+        Returns
+        -------
+        info : :class:`~analphipy.cache.CacheInfo`
+            Named tuple of ``hits``, ``misses``, ``maxsize``, and ``currsize``.
+        """
+        return cast("InstanceCache", self._cache).info(name)
+
+    def cache_clear(self) -> None:
+        """Clear the in-memory cache and statistics. ``persistent_cache`` is not changed."""
+        self._cache.clear()
+
+    @single_flight
     @cached.meth
     @add_quad_kws
     @docfiller.decorate
     def secondvirial(  # pylint: disable=missing-type-doc
-        self, /, beta: float, err: bool = False, full_output: bool = False, **kws: Any
+        self,
+        /,
+        beta: Float_or_ArrayLike,
+        err: bool = False,
+        full_output: bool = False,
+        **kws: Any,
     ) -> QuadSegments:
         """
         Calculate second virial coefficient.
 
+        Results for scalar ``beta`` are cached.
+        If ``phi`` is the ``phi`` method of a potential with a closed form
+        (see
+        :meth:`~analphipy.base_potential.PhiAbstract.secondvirial_analytic`),
+        it is used in place of numerical integration, unless ``err`` or
+        ``full_output`` are requested.
+
         Parameters
         ----------
-        {beta}
+        {beta_array}
         {err}
         {full_output}
         **kws
@@ -430,6 +727,13 @@ class Measures:
         ~analphipy.measures.secondvirial
 
         """
+        if not (err or full_output):
+            out = _analytic_from_phi(
+                self.phi, self.segments, "secondvirial_analytic", beta
+            )
+            if out is not None:
+                return cast("QuadSegments", out)
+
         return secondvirial(
             phi=self.phi,
             beta=beta,
@@ -439,18 +743,29 @@ class Measures:
             **kws,
         )
 
+    @single_flight
     @cached.meth
     @add_quad_kws
     @docfiller.decorate
     def secondvirial_dbeta(
-        self, /, beta: float, err: bool = False, full_output: bool = False, **kws: Any
+        self,
+        /,
+        beta: Float_or_ArrayLike,
+        err: bool = False,
+        full_output: bool = False,
+        **kws: Any,
     ) -> QuadSegments:
         """
         Calculate ``beta`` derivative of second virial coefficient.
 
+        Results for scalar ``beta`` are cached.
+        Uses
+        :meth:`~analphipy.base_potential.PhiAbstract.secondvirial_dbeta_analytic`
+        if available (see :meth:`secondvirial`).
+
         Parameters
         ----------
-        {beta}
+        {beta_array}
         {err}
         {full_output}
 
@@ -466,6 +781,13 @@ class Measures:
         ~analphipy.measures.secondvirial_dbeta
 
         """
+        if not (err or full_output):
+            out = _analytic_from_phi(
+                self.phi, self.segments, "secondvirial_dbeta_analytic", beta
+            )
+            if out is not None:
+                return cast("QuadSegments", out)
+
         return secondvirial_dbeta(
             phi=self.phi,
             beta=beta,
@@ -475,6 +797,84 @@ class Measures:
             **kws,
         )
 
+    @docfiller.decorate
+    async def asecondvirial(
+        self,
+        /,
+        beta: Float_or_ArrayLike,
+        executor: Executor | None = None,
+        **kws: Any,
+    ) -> QuadSegments:
+        """
+        Asynchronous version of :meth:`secondvirial`.
+
+        Parameters
+        ----------
+        {beta_array}
+        {executor_async}
+        **kws
+            Extra arguments to :meth:`secondvirial`.
+
+        Returns
+        -------
+        QuadSegments
+            Output of :meth:`secondvirial`.
+
+        Notes
+        -----
+        {async_notes}
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> import analphipy.potential as pots
+        >>> m = pots.SquareWell(sig=1.0, eps=-1.0, lam=1.5).to_measures()
+        >>> print(f"{{asyncio.run(m.asecondvirial(1.0)):.4f}}")
+        -6.4527
+        """
+        from ._async import call_method
+
+        return cast(
+            "QuadSegments",
+            await call_method(self, "secondvirial", beta, executor=executor, **kws),
+        )
+
+    @docfiller.decorate
+    async def asecondvirial_dbeta(
+        self,
+        /,
+        beta: Float_or_ArrayLike,
+        executor: Executor | None = None,
+        **kws: Any,
+    ) -> QuadSegments:
+        """
+        Asynchronous version of :meth:`secondvirial_dbeta`.
+
+        Parameters
+        ----------
+        {beta_array}
+        {executor_async}
+        **kws
+            Extra arguments to :meth:`secondvirial_dbeta`.
+
+        Returns
+        -------
+        QuadSegments
+            Output of :meth:`secondvirial_dbeta`.
+
+        Notes
+        -----
+        {async_notes}
+        """
+        from ._async import call_method
+
+        return cast(
+            "QuadSegments",
+            await call_method(
+                self, "secondvirial_dbeta", beta, executor=executor, **kws
+            ),
+        )
+
     @docfiller.decorate
     @add_quad_kws
     def boltz_diverg_js(  # pylint: disable=missing-type-doc
@@ -25,11 +25,31 @@ from module_utilities import cached
 
 from ._docstrings import docfiller
 from ._typing_compat import override
-from .measures import secondvirial, secondvirial_dbeta, secondvirial_sw
-from .utils import TWO_PI, add_quad_kws, is_float, minimize_phi, quad_segments
+from .cache import (
+    InstanceCache,
+    as_persistent_cache,
+    cache_token_from_params,
+    single_flight,
+)
+from .measures import (
+    _analytic_from_phi,  # pyright: ignore[reportPrivateUsage]
+    secondvirial,
+    secondvirial_dbeta,
+    secondvirial_sw,
+)
+from .utils import (
+    TWO_PI,
+    add_quad_kws,
+    is_float,
+    minimize_phi,
+    quad_segments_beta,
+    split_segments,
+)
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping, Sequence
+    from collections.abc import Callable, Mapping, Sequence
+    from concurrent.futures import Executor
+    from os import PathLike
     from typing import Any
 
     from analphipy.base_potential import PhiAbstract
@@ -43,11 +63,14 @@ if TYPE_CHECKING:
         QuadSegments,
     )
     from ._typing_compat import Self
+    from .cache import CacheInfo, PersistentCache
 
 # Workaround to document module level docstring
-__doc__ = __doc__.format(**docfiller.data)  # pyright: ignore[reportOptionalMemberAccess]  # ty: ignore[possibly-missing-attribute]
+if __doc__ is not None:  # stripped with python -OO
+    __doc__ = docfiller.format(__doc__)
 
 __all__ = [
+    "NoroFrenkelInterpolator",
     "NoroFrenkelPair",
     "lam_nf",
     "lam_nf_dbeta",
@@ -72,7 +95,7 @@ _d = docfiller.update(
 @_d.decorate
 def sig_nf(
     phi_rep: Phi_Signature,
-    beta: float,
+    beta: Float_or_ArrayLike,
     segments: ArrayLike,
     err: bool = False,
     full_output: bool = False,
@@ -86,12 +109,12 @@ def sig_nf(
     Parameters
     ----------
     {phi_rep}
-    {beta}
+    {beta_array}
     {segments}
     phi_rep : callable
         Repulsive part of pair potential.
-    beta : float
-        Inverse temperature.
+    beta : float or array-like
+        Inverse temperature(s).
     segments : array-like
         Integration segments.
     err : bool, default=False
@@ -101,7 +124,7 @@ def sig_nf(
 
     Returns
     -------
-    sig_nf : float or list of float
+    sig_nf : float or ndarray
         Value of integral.
     errors : float or list of float, optional
         If `err` or `full_output` are True, then return sum of errors.
@@ -113,18 +136,18 @@ def sig_nf(
     See Also
     --------
     ~analphipy.utils.quad_segments
+    ~analphipy.utils.quad_segments_beta
 
     """
 
-    def integrand(r: Float_or_Array) -> Array:
+    def integrand(r: Float_or_Array, beta: Float_or_Array) -> Array:
         out: Array = 1.0 - np.exp(-beta * phi_rep(r))
         return out
 
-    return quad_segments(
+    return quad_segments_beta(
         integrand,
+        beta=beta,
         segments=segments,
-        sum_integrals=True,
-        sum_errors=True,
         err=err,
         full_output=full_output,
         **kws,
@@ -144,7 +167,7 @@ def sig_nf(
 )
 def sig_nf_dbeta(
     phi_rep: Phi_Signature,
-    beta: float,
+    beta: Float_or_ArrayLike,
     segments: ArrayLike,
     err: bool = False,
     full_output: bool = False,
@@ -160,17 +183,17 @@ def sig_nf_dbeta(
         \frac{{d \sigma_{{\rm BH}}}}{{d\beta}} = \int_0^{{\infty}} dr \phi_{{\rm rep}}(r) \exp[-\beta \phi_{{\rm rep}}(r)]
     """
 
-    def integrand(r: Float_or_Array) -> Array:
+    def integrand(r: Float_or_Array, beta: Float_or_Array) -> Array:
         v = phi_rep(r)
-        out = np.array(0.0) if np.isinf(v) else v * np.exp(-beta * v)
+        with np.errstate(invalid="ignore"):
+            out = np.where(np.isinf(v), 0.0, v * np.exp(-beta * v))
 
         return cast("Array", out)
 
-    return quad_segments(
+    return quad_segments_beta(
         integrand,
+        beta=beta,
         segments=segments,
-        sum_integrals=True,
-        sum_errors=True,
         err=err,
         full_output=full_output,
         **kws,
@@ -270,6 +293,33 @@ def lam_nf_dbeta(
     return out
 
 
+_TABLE_ALIASES = {
+    "B2": "secondvirial",
+    "B2_dbeta": "secondvirial_dbeta",
+    "B2_sw": "secondvirial_sw",
+}
+
+# Analytic methods of PhiAbstract used in place of quadrature
+_ANALYTIC_METHODS = {
+    "secondvirial": "secondvirial_analytic",
+    "secondvirial_dbeta": "secondvirial_dbeta_analytic",
+    "sig": "sig_nf_analytic",
+    "sig_dbeta": "sig_nf_dbeta_analytic",
+}
+
+_TABLE_BATCHED_PROPS = frozenset(
+    {
+        *_TABLE_ALIASES,
+        *_TABLE_ALIASES.values(),
+        "sig",
+        "sig_dbeta",
+        "eps",
+        "lam",
+        "lam_dbeta",
+    }
+)
+
+
 @docfiller.decorate
 class NoroFrenkelPair:
     """
@@ -284,6 +334,10 @@ class NoroFrenkelPair:
     {r_min_exact}
     {phi_min_exact}
     {quad_kws}
+    {persistent_cache}
+    {cache_token}
+    {cache_maxsize}
+    {cache_key_digits}
 
     """
 
@@ -294,6 +348,10 @@ class NoroFrenkelPair:
         r_min: float,
         phi_min: Float_or_Array | None,
         quad_kws: Mapping[str, Any] | None = None,
+        persistent_cache: PersistentCache | str | PathLike[str] | None = None,
+        cache_token: str | None = None,
+        cache_maxsize: int | None = None,
+        cache_key_digits: int | None = None,
     ) -> None:
         self.phi = phi
         self.r_min = r_min
@@ -307,7 +365,45 @@ class NoroFrenkelPair:
             quad_kws = {}
         self.quad_kws = quad_kws
 
-        self._cache: dict[str, Any] = {}
+        persistent_cache = as_persistent_cache(persistent_cache)
+        if persistent_cache is not None and cache_token is None:
+            cache_token = cache_token_from_params(
+                type(self).__name__, **self._token_params()
+            )
+        self._cache: dict[str, Any] = InstanceCache(
+            persistent_cache, cache_token, cache_maxsize, cache_key_digits
+        )
+
+    def _token_params(self) -> dict[str, Any]:
+        """Parameters identifying calculation (see ``cache_token``)."""
+        return {
+            "phi": self.phi,
+            "segments": self.segments,
+            "r_min": self.r_min,
+            "phi_min": self.phi_min,
+            "quad_kws": self.quad_kws,
+        }
+
+    def cache_info(self, name: str | None = None) -> CacheInfo:
+        """
+        Statistics of the in-memory cache.
+
+        Parameters
+        ----------
+        name : str, optional
+            Name of method (e.g., ``"sig"``). Default is to total over all
+            cached methods.
+
+        Returns
+        -------
+        info : :class:`~analphipy.cache.CacheInfo`
+            Named tuple of ``hits``, ``misses``, ``maxsize``, and ``currsize``.
+        """
+        return cast("InstanceCache", self._cache).info(name)
+
+    def cache_clear(self) -> None:
+        """Clear the in-memory cache and statistics. ``persistent_cache`` is not changed."""
+        self._cache.clear()
 
     @override
     def __repr__(self) -> str:
@@ -355,6 +451,10 @@ class NoroFrenkelPair:
         r_min: float | None = None,
         bounds: Sequence[float] | None = None,
         quad_kws: Mapping[str, Any] | None = None,
+        persistent_cache: PersistentCache | str | PathLike[str] | None = None,
+        cache_token: str | None = None,
+        cache_maxsize: int | None = None,
+        cache_key_digits: int | None = None,
         **kws: Any,
     ) -> Self:
         """
@@ -370,6 +470,10 @@ class NoroFrenkelPair:
             Optional bounds for numerically locating ``r_min``.
         quad_kws : mapping, optional
             Optional arguments to :func:`analphipy.utils.quad_segments`.
+        {persistent_cache}
+        {cache_token}
+        {cache_maxsize}
+        {cache_key_digits}
         **kws :
             Extra arguments to :func:`analphipy.utils.minimize_phi`.
 
@@ -391,16 +495,29 @@ class NoroFrenkelPair:
 
         r_min, phi_min, _ = minimize_phi(phi, r0=r_min, bounds=bounds, **kws)
         return cls(
-            phi=phi, r_min=r_min, phi_min=phi_min, segments=segments, quad_kws=quad_kws
+            phi=phi,
+            r_min=r_min,
+            phi_min=phi_min,
+            segments=segments,
+            quad_kws=quad_kws,
+            persistent_cache=persistent_cache,
+            cache_token=cache_token,
+            cache_maxsize=cache_maxsize,
+            cache_key_digits=cache_key_digits,
         )
 
     @classmethod
+    @docfiller.decorate
     def from_phi_class(
         cls,
         phi: PhiAbstract,
         r_min: float | None = None,
         bounds: Sequence[float] | None = None,
         quad_kws: dict[str, Any] | None = None,
+        persistent_cache: PersistentCache | str | PathLike[str] | None = None,
+        cache_token: str | None = None,
+        cache_maxsize: int | None = None,
+        cache_key_digits: int | None = None,
         **kws: Any,
     ) -> Self:
         """
@@ -415,6 +532,10 @@ class NoroFrenkelPair:
             Optional bounds for numerically locating ``r_min``.
         quad_kws : mapping, optional
             Optional arguments to :func:`analphipy.utils.quad_segments`.
+        {persistent_cache}
+        {cache_token}
+        {cache_maxsize}
+        {cache_key_digits}
         **kws :
             Extra arguments to :func:`analphipy.utils.minimize_phi`.
 
@@ -435,6 +556,10 @@ class NoroFrenkelPair:
                 r_min=phi.r_min,
                 phi_min=phi.phi_min,
                 quad_kws=quad_kws,
+                persistent_cache=persistent_cache,
+                cache_token=cache_token,
+                cache_maxsize=cache_maxsize,
+                cache_key_digits=cache_key_digits,
             )
 
         return cls.from_phi(
@@ -443,9 +568,14 @@ class NoroFrenkelPair:
             r_min=r_min,
             bounds=bounds,
             quad_kws=quad_kws,
+            persistent_cache=persistent_cache,
+            cache_token=cache_token,
+            cache_maxsize=cache_maxsize,
+            cache_key_digits=cache_key_digits,
             **kws,
         )
 
+    @single_flight
     @cached.meth
     @add_quad_kws
     def secondvirial(self, /, beta: float, **kws: Any) -> QuadSegments:
@@ -457,12 +587,24 @@ class NoroFrenkelPair:
         ~analphipy.measures.secondvirial
 
         """
-        return secondvirial(phi=self.phi, beta=beta, segments=self.segments, **kws)
+        out = self._analytic("secondvirial", beta, kws)
+        if out is not None:
+            return cast("QuadSegments", out)
+        return secondvirial(
+            phi=self.phi, beta=beta, segments=self._segments_split, **kws
+        )
 
     @cached.prop
     def _segments_rep(self) -> list[float]:
         return [float(x) for x in self.segments if x < self.r_min] + [self.r_min]
 
+    @cached.prop
+    def _segments_split(self) -> list[float]:
+        # Break at r_min, so that fixed order quadrature (method="gauss")
+        # resolves narrow wells of steep potentials.
+        return split_segments(self.segments, self.r_min)
+
+    @single_flight
     @cached.meth
     @add_quad_kws
     def sig(self, /, beta: float, **kws: Any) -> QuadSegments:
@@ -474,6 +616,9 @@ class NoroFrenkelPair:
         ~analphipy.norofrenkel.sig_nf
 
         """
+        out = self._analytic("sig", beta, kws)
+        if out is not None:
+            return cast("QuadSegments", out)
         return sig_nf(
             self.phi_rep,
             beta=beta,
@@ -489,6 +634,7 @@ class NoroFrenkelPair:
         """
         return cast("float", self.phi_min)
 
+    @single_flight
     @cached.meth
     @add_quad_kws
     def lam(self, /, beta: float, **kws: Any) -> float:
@@ -514,6 +660,7 @@ class NoroFrenkelPair:
         msg = f"Bad kws={kws}"
         raise ValueError(msg)
 
+    @single_flight
     @cached.meth
     @add_quad_kws
     def sw_dict(self, /, beta: float, **kws: Any) -> dict[str, float]:
@@ -529,6 +676,7 @@ class NoroFrenkelPair:
         msg = f"Bad kws={kws}"
         raise ValueError(msg)
 
+    @single_flight
     @cached.meth
     @add_quad_kws
     def secondvirial_dbeta(self, /, beta: float, **kws: Any) -> QuadSegments:
@@ -540,10 +688,14 @@ class NoroFrenkelPair:
         ~analphipy.measures.secondvirial_dbeta
 
         """
+        out = self._analytic("secondvirial_dbeta", beta, kws)
+        if out is not None:
+            return cast("QuadSegments", out)
         return secondvirial_dbeta(
-            phi=self.phi, beta=beta, segments=self.segments, **kws
+            phi=self.phi, beta=beta, segments=self._segments_split, **kws
         )
 
+    @single_flight
     @cached.meth
     @add_quad_kws
     def sig_dbeta(self, /, beta: float, **kws: Any) -> QuadSegments:
@@ -555,8 +707,12 @@ class NoroFrenkelPair:
         ~analphipy.norofrenkel.sig_nf_dbeta
 
         """
-        return sig_nf_dbeta(self.phi_rep, beta=beta, segments=self.segments, **kws)
+        out = self._analytic("sig_dbeta", beta, kws)
+        if out is not None:
+            return cast("QuadSegments", out)
+        return sig_nf_dbeta(self.phi_rep, beta=beta, segments=self._segments_rep, **kws)
 
+    @single_flight
     @cached.meth
     def lam_dbeta(self, /, beta: float, **kws: Any) -> float:
         """
@@ -594,6 +750,7 @@ class NoroFrenkelPair:
         msg = f"Bad kws={kws}"
         raise ValueError(msg)  # pragma: no cover
 
+    @single_flight
     @cached.meth
     def secondvirial_sw(self, /, beta: float, **kws: Any) -> float:
         """
@@ -628,6 +785,220 @@ class NoroFrenkelPair:
         """Alias to :meth:`secondvirial_sw`."""
         return self.secondvirial_sw(beta, **kws)
 
+    @docfiller.decorate
+    async def asecondvirial(
+        self, /, beta: float, executor: Executor | None = None, **kws: Any
+    ) -> QuadSegments:
+        """
+        Asynchronous version of :meth:`secondvirial`.
+
+        Parameters
+        ----------
+        {beta}
+        {executor_async}
+        **kws
+            Extra arguments to :meth:`secondvirial`.
+
+        Returns
+        -------
+        QuadSegments
+            Output of :meth:`secondvirial`.
+
+        Notes
+        -----
+        {async_notes}
+        """
+        from ._async import call_method
+
+        return cast(
+            "QuadSegments",
+            await call_method(self, "secondvirial", beta, executor=executor, **kws),
+        )
+
+    @docfiller.decorate
+    async def asig(
+        self, /, beta: float, executor: Executor | None = None, **kws: Any
+    ) -> QuadSegments:
+        """
+        Asynchronous version of :meth:`sig`.
+
+        Parameters
+        ----------
+        {beta}
+        {executor_async}
+        **kws
+            Extra arguments to :meth:`sig`.
+
+        Returns
+        -------
+        QuadSegments
+            Output of :meth:`sig`.
+
+        Notes
+        -----
+        {async_notes}
+        """
+        from ._async import call_method
+
+        return cast(
+            "QuadSegments",
+            await call_method(self, "sig", beta, executor=executor, **kws),
+        )
+
+    @docfiller.decorate
+    async def alam(
+        self, /, beta: float, executor: Executor | None = None, **kws: Any
+    ) -> float:
+        """
+        Asynchronous version of :meth:`lam`.
+
+        Parameters
+        ----------
+        {beta}
+        {executor_async}
+        **kws
+            Extra arguments to :meth:`lam`.
+
+        Returns
+        -------
+        float
+            Output of :meth:`lam`.
+
+        Notes
+        -----
+        {async_notes}
+        """
+        from ._async import call_method
+
+        return cast(
+            "float", await call_method(self, "lam", beta, executor=executor, **kws)
+        )
+
+    def _analytic(self, prop: str, beta: Any, kws: Mapping[str, Any]) -> Any:
+        """
+        Closed form value of ``prop``, or None if not available.
+
+        Closed forms are skipped if errors or full output are requested. For
+        ``sig`` and ``sig_dbeta``, the potential must also define the same
+        ``r_min`` and ``phi_min``.
+        """
+        if kws.get("err") or kws.get("full_output"):
+            return None
+
+        if prop in {"sig", "sig_dbeta"}:
+            potential = getattr(self.phi, "__self__", None)
+            if (
+                getattr(potential, "r_min", None) != self.r_min
+                or getattr(potential, "phi_min", None) != self.phi_min
+            ):
+                return None
+
+        return _analytic_from_phi(
+            self.phi, self.segments, _ANALYTIC_METHODS[prop], beta
+        )
+
+    def _cached_batched(
+        self,
+        name: str,
+        func: Callable[[Array], Any],
+        betas: Array,
+        kws: Mapping[str, Any],
+    ) -> Array:
+        """
+        Evaluate ``func(betas)``, sharing cached values with method ``name``.
+
+        Only values of ``beta`` missing from the cache of ``name`` are
+        calculated, and new values are added to the cache.
+        """
+        if name not in self._cache:
+            self._cache[name] = {}
+        store = self._cache[name]
+
+        out = np.empty(betas.shape, dtype=np.float64)
+        missing: list[tuple[int, ...]] = []
+        try:
+            key_kws = frozenset(kws.items())
+            for index, beta in np.ndenumerate(betas):
+                try:
+                    out[index] = store[(beta,), key_kws]
+                except KeyError:  # noqa: PERF203
+                    missing.append(index)
+        except TypeError:
+            # unhashable kws
+            return cast("Array", func(betas))
+
+        if missing:
+            index_missing = tuple(np.array(missing, dtype=np.intp).T)
+            out[index_missing] = func(betas[index_missing])
+            for index in missing:
+                store[(betas[index],), key_kws] = float(out[index])
+        return out
+
+    def _table_batched(
+        self, betas: Array, props: Sequence[str], **kws: Any
+    ) -> dict[str, Array]:
+        """Evaluate ``props`` at all ``betas`` at once."""
+        quad_kws = dict(self.quad_kws, **kws)
+        # functions below are written for scalars, but vectorize over beta
+        beta: Any = betas
+        values: dict[str, Any] = {}
+
+        quadrature: dict[str, Callable[[Array], Any]] = {
+            "secondvirial": lambda x: secondvirial(
+                self.phi, x, self._segments_split, **quad_kws
+            ),
+            "secondvirial_dbeta": lambda x: secondvirial_dbeta(
+                self.phi, x, self._segments_split, **quad_kws
+            ),
+            "sig": lambda x: sig_nf(self.phi_rep, x, self._segments_rep, **quad_kws),
+            "sig_dbeta": lambda x: sig_nf_dbeta(
+                self.phi_rep, x, self._segments_rep, **quad_kws
+            ),
+        }
+
+        def get(prop: str) -> Any:
+            prop = _TABLE_ALIASES.get(prop, prop)
+            if prop in values:
+                return values[prop]
+
+            out: Any
+
+            if prop in quadrature:
+                out = self._analytic(prop, betas, kws)
+                if out is None:
+                    out = self._cached_batched(prop, quadrature[prop], betas, kws)
+            elif prop == "eps":
+                out = np.full(betas.shape, self.eps())
+            elif prop == "lam":
+                out = lam_nf(
+                    beta=beta,
+                    sig=get("sig"),
+                    eps=self.eps(),
+                    B2=get("secondvirial"),
+                )
+            elif prop == "lam_dbeta":
+                out = lam_nf_dbeta(
+                    beta=beta,
+                    sig=get("sig"),
+                    eps=self.eps(),
+                    lam=get("lam"),
+                    B2=get("secondvirial"),
+                    B2_dbeta=get("secondvirial_dbeta"),
+                    sig_dbeta=get("sig_dbeta"),
+                )
+            else:
+                out = secondvirial_sw(
+                    beta=beta,
+                    sig=get("sig"),
+                    eps=self.eps(),
+                    lam=get("lam"),
+                )
+
+            values[prop] = out = np.ascontiguousarray(out, dtype=np.float64)
+            return out
+
+        return {prop: get(prop) for prop in props}
+
     def table(
         self,
         betas: ArrayLike,
@@ -647,15 +1018,43 @@ class NoroFrenkelPair:
         key_format : string, default="{prop}"
             Each key in the output dictionary will have the value ``key_format.format(prop=prop)``
 
+        **kws :
+            Extra arguments to methods.
+
         Returns
         -------
         output : dict
             dictionary of arrays.
 
+        Notes
+        -----
+        If all ``props`` are in ``{{"B2", "B2_dbeta", "B2_sw", "sig", "sig_dbeta",
+        "eps", "lam", "lam_dbeta"}}`` (or the long form names, e.g.,
+        ``"secondvirial"``), and ``kws`` does not request errors or full output,
+        then the values are calculated for all ``betas`` at once, and returned
+        as arrays.  Combine with ``quad_kws={{"method": "gauss"}}`` to
+        evaluate the integrals for all ``betas`` with a single evaluation of
+        the potential per segment.  Otherwise, the methods are called
+        separately for each value of ``beta``.
+
+        The output can be passed directly to :class:`pandas.DataFrame`.
+
         """
         if props is None:
             props = ["B2", "sig", "eps", "lam"]
 
+        if (
+            all(prop in _TABLE_BATCHED_PROPS for prop in props)
+            and not kws.get("err")
+            and not kws.get("full_output")
+        ):
+            betas = np.asarray(betas, dtype=np.float64)
+            values = self._table_batched(betas, props, **kws)
+            return {
+                "beta": betas,
+                **{key_format.format(prop=prop): values[prop] for prop in props},
+            }
+
         table = {"beta": betas}
 
         for prop in props:
@@ -663,3 +1062,261 @@ class NoroFrenkelPair:
             key = key_format.format(prop=prop)
             table[key] = [f(beta=beta, **kws) for beta in betas]
         return table
+
+    @docfiller.decorate
+    async def atable(
+        self,
+        betas: ArrayLike,
+        props: Sequence[str] | None = None,
+        key_format: str = "{prop}",
+        executor: Executor | None = None,
+        **kws: Any,
+    ) -> dict[str, Any]:
+        """
+        Asynchronous version of :meth:`table`.
+
+        Parameters
+        ----------
+        betas : array-like
+            Array of values of inverse temperature ``beta``.
+        props : sequence of string
+            Name of methods to access.
+        key_format : string, default="{{prop}}"
+            Format of keys in output (see :meth:`table`).
+        {executor_async}
+        **kws :
+            Extra arguments to methods.
+
+        Returns
+        -------
+        output : dict
+            Output of :meth:`table`.
+
+        Notes
+        -----
+        {async_notes}
+
+        Examples
+        --------
+        >>> import asyncio
+        >>> import analphipy.potential as pots
+        >>> nf = pots.LennardJones().to_nf()
+        >>> table = asyncio.run(nf.atable([0.5, 1.0], props=["lam"]))
+        >>> print(table["lam"].round(4))
+        [1.5246 1.441 ]
+        """
+        from ._async import call_method
+
+        if not isinstance(betas, np.ndarray):
+            betas = np.asarray(betas, dtype=np.float64)
+        return cast(
+            "dict[str, Any]",
+            await call_method(
+                self,
+                "table",
+                betas,
+                props=props,
+                key_format=key_format,
+                executor=executor,
+                **kws,
+            ),
+        )
+
+    def interpolator(
+        self,
+        beta_min: float,
+        beta_max: float,
+        props: Sequence[str] | None = None,
+        rtol: float = 1e-6,
+        atol: float = 1e-8,
+        max_nodes: int = 1000,
+        n_check: int = 3,
+        **kws: Any,
+    ) -> NoroFrenkelInterpolator:
+        """
+        Create piecewise cubic Hermite interpolator of Noro-Frenkel parameters.
+
+        The exact values and their derivatives with respect to ``beta`` are
+        calculated on an adaptively refined grid of ``beta`` values.  An
+        interval is accepted if, at ``n_check`` equally spaced interior
+        points, the interpolated value of each property ``x`` differs from the
+        exact value by less than ``atol + rtol * abs(x)``. Otherwise, the
+        interval is split at these points. As each cubic depends only on the
+        values at the ends of its interval, the tolerance holds at the checked
+        points of the returned interpolator. This is an estimate of the error
+        between these points, not a bound.
+
+        Parameters
+        ----------
+        beta_min, beta_max : float
+            Range of inverse temperature ``beta``.
+        props : sequence of str, optional
+            Properties to interpolate.  Values in ``{"B2", "sig", "eps", "lam"}``
+            (or long form name ``"secondvirial"``).  Default is all of these.
+        rtol, atol : float
+            Relative and absolute tolerance.
+        max_nodes : int, default=1000
+            Maximum number of values of ``beta`` to calculate.
+        n_check : int, default=3
+            Number of interior points of each interval at which to check the
+            interpolated values.
+        **kws :
+            Extra arguments to methods.
+
+        Returns
+        -------
+        NoroFrenkelInterpolator
+
+        Examples
+        --------
+        >>> import analphipy.potential as pots
+        >>> nf = pots.LennardJones().to_nf(quad_kws={"method": "gauss"})
+        >>> f = nf.interpolator(0.5, 2.0)
+        >>> print(f"{f['lam'](1.2):.6f} {nf.lam(1.2):.6f}")
+        1.415404 1.415404
+        """
+        if props is None:
+            props = ["B2", "sig", "eps", "lam"]
+        names = [_TABLE_ALIASES.get(prop, prop) for prop in props]
+        if unknown := set(names).difference(_INTERPOLATOR_DERIVS):
+            msg = f"Cannot interpolate {unknown}"
+            raise ValueError(msg)
+        if not beta_min < beta_max:
+            msg = f"Must have beta_min < beta_max, not {beta_min=}, {beta_max=}"
+            raise ValueError(msg)
+        if n_check < 1:
+            msg = f"Must have n_check >= 1, not {n_check=}"
+            raise ValueError(msg)
+
+        derivs = {
+            name: deriv for name in names if (deriv := _INTERPOLATOR_DERIVS[name])
+        }
+
+        def evaluate(betas: Array) -> dict[str, Array]:
+            return self.table(betas, [*names, *derivs.values()], **kws)
+
+        from scipy.interpolate import CubicHermiteSpline
+
+        def build(data: dict[str, Array]) -> dict[str, Any]:
+            return {
+                name: CubicHermiteSpline(
+                    data["beta"],
+                    data[name],
+                    data[derivs[name]]
+                    if name in derivs
+                    else np.zeros_like(data["beta"]),
+                    extrapolate=False,
+                )
+                for name in names
+            }
+
+        fractions = np.arange(1, n_check + 1) / (n_check + 1)
+        data = evaluate(np.linspace(beta_min, beta_max, 5))
+        accepted = np.zeros(len(data["beta"]) - 1, dtype=bool)
+        while True:
+            splines = build(data)
+
+            left = data["beta"][:-1][~accepted]
+            width = np.diff(data["beta"])[~accepted]
+            check = evaluate((left[:, None] + width[:, None] * fractions).ravel())
+            ok = (
+                np.all(
+                    [
+                        np.abs(splines[name](check["beta"]) - check[name])
+                        <= atol + rtol * np.abs(check[name])
+                        for name in names
+                    ],
+                    axis=0,
+                )
+                .reshape(-1, n_check)
+                .all(axis=1)
+            )
+
+            accepted[~accepted] = ok
+            if accepted.all():
+                break
+
+            # add check points of failed intervals, splitting each into n_check + 1
+            failed = np.repeat(~ok, n_check)
+            order = np.argsort(np.concatenate((data["beta"], check["beta"][failed])))
+            data = {
+                k: np.concatenate((v, check[k][failed]))[order] for k, v in data.items()
+            }
+            accepted = np.repeat(accepted, np.where(accepted, 1, n_check + 1))
+
+            if len(data["beta"]) > max_nodes:
+                msg = (
+                    f"Interpolation did not converge with {max_nodes=}. "
+                    "Increase max_nodes or tolerance."
+                )
+                raise ValueError(msg)
+
+        return NoroFrenkelInterpolator(
+            build(data), aliases=dict(zip(props, names, strict=True))
+        )
+
+
+_INTERPOLATOR_DERIVS = {
+    "secondvirial": "secondvirial_dbeta",
+    "sig": "sig_dbeta",
+    "lam": "lam_dbeta",
+    "eps": None,
+}
+
+
+class NoroFrenkelInterpolator:
+    """
+    Piecewise cubic Hermite interpolator of Noro-Frenkel parameters.
+
+    Created by :meth:`NoroFrenkelPair.interpolator`.  Each property is
+    evaluated with ``interp[prop](beta)``, and all properties with
+    ``interp(beta)``.  Values outside the interpolated range of ``beta`` are
+    ``nan``.
+
+    Parameters
+    ----------
+    splines : mapping
+        Mapping from property name to :class:`scipy.interpolate.CubicHermiteSpline`.
+    aliases : mapping, optional
+        Alternative names of properties.
+    """
+
+    def __init__(
+        self, splines: Mapping[str, Any], aliases: Mapping[str, str] | None = None
+    ) -> None:
+        self.splines = dict(splines)
+        self._aliases = {**_TABLE_ALIASES, **(aliases or {})}
+
+    @override
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(props={self.props}, beta=[{self.beta_min}, {self.beta_max}], nodes={len(self.betas)})"
+
+    @property
+    def props(self) -> tuple[str, ...]:
+        """Names of interpolated properties."""
+        return tuple(self.splines)
+
+    @property
+    def betas(self) -> Array:
+        """Values of ``beta`` where exact values were calculated."""
+        return cast("Array", next(iter(self.splines.values())).x)
+
+    @property
+    def beta_min(self) -> float:
+        """Minimum value of ``beta``."""
+        return float(self.betas[0])
+
+    @property
+    def beta_max(self) -> float:
+        """Maximum value of ``beta``."""
+        return float(self.betas[-1])
+
+    def __getitem__(self, prop: str) -> Callable[[Float_or_ArrayLike], Array]:
+        return cast(
+            "Callable[[Float_or_ArrayLike], Array]",
+            self.splines[self._aliases.get(prop, prop)],
+        )
+
+    def __call__(self, beta: Float_or_ArrayLike) -> dict[str, Array]:
+        """Dictionary of interpolated values of all properties at ``beta``."""
+        return {prop: spline(beta) for prop, spline in self.splines.items()}
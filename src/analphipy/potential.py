@@ -5,22 +5,37 @@ Classes/routines for pair potentials (:mod:`analphipy.potential`)
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import math
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, cast
 
 import attrs
 import numpy as np
 from attrs import field
 
+from . import _backend
 from ._attrs_utils import field_array_formatter, field_formatter
 from ._docstrings import docfiller
 from ._typing_compat import override
 from .base_potential import PhiAbstract, PhiBase
+from .utils import TWO_PI
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
+    from os import PathLike
     from typing import Any, Literal
 
-    from ._typing import Array, ArrayLike, Float_or_ArrayLike, Phi_Signature
+    from ._backend import Backend
+    from ._typing import (
+        Array,
+        ArrayLike,
+        BoolArray,
+        Float_or_Array,
+        Float_or_ArrayLike,
+        IndexArray,
+        Phi_Signature,
+    )
     from ._typing_compat import Self
 
 
@@ -104,6 +119,68 @@ class Analytic(PhiBase):
 
 _docfiller_analytic = docfiller.factory_inherit_from_parent(Analytic)
 
+_MIE_MAX_TERMS = 1000
+_MIE_RTOL = 1e-16
+
+
+def _secondvirial_mie(
+    beta: Float_or_ArrayLike,
+    n: float,
+    m: float,
+    sig: float,
+    prefac: float,
+    dbeta: bool = False,
+) -> Float_or_Array | None:
+    r"""
+    Second virial coefficient (or derivative) of potential ``prefac * [(sig/r)**n - (sig/r)**m]``.
+
+    Uses the series
+
+    .. math::
+
+        B_2 = -\frac{2 \pi \sigma^3}{n} \sum_{j=0}^{\infty} \frac{\Gamma[(m j - 3) / n]}{j!} x^{[3 + j (n - m)] / n}
+
+    with :math:`x = \beta \times {\rm prefac}`. Returns None if this does not apply or does not converge.
+    """
+    if not (n > m > 3):  # noqa: PLR2004
+        return None
+
+    beta = np.asarray(beta, dtype=np.float64)
+    if np.any(beta <= 0.0) or not np.all(np.isfinite(beta)):
+        return None
+
+    log_x = np.log(beta * prefac)
+    total = np.zeros_like(beta)
+    last = np.full_like(beta, np.inf)
+    for j in range(_MIE_MAX_TERMS):
+        power = (3 + j * (n - m)) / n
+        g = (m * j - 3) / n
+        # gamma(g) < 0 for j = 0, and > 0 for j > 0
+        term = np.exp(math.lgamma(g) - math.lgamma(j + 1) + power * log_x)
+        if j == 0:
+            term = -term
+        if dbeta:
+            term = term * power / beta
+
+        total += term
+        if j > 0 and np.all(
+            (np.abs(term) <= _MIE_RTOL * np.abs(total)) & (np.abs(term) <= last)
+        ):
+            break
+        last = np.abs(term)
+    else:
+        return None
+
+    out = -TWO_PI * sig**3 / n * total
+    return out if out.ndim else float(out)
+
+
+def _full_like_beta(value: float, beta: Float_or_ArrayLike) -> Float_or_Array:
+    """Constant ``value`` with shape of ``beta``."""
+    if np.ndim(beta) == 0:
+        return float(value)
+    return np.full(np.shape(beta), value, dtype=np.float64)
+
 
 @attrs.define(frozen=True)
 @_docfiller_analytic(Analytic)
@@ -144,18 +221,53 @@ class LennardJones(Analytic):
     def _four_eps(self) -> float:
         return 4.0 * self.eps
 
-    @_docfiller_analytic()
+    @docfiller.decorate
     @override
-    def phi(self, r: Float_or_ArrayLike) -> Array:
+    def phi(self, r: Float_or_ArrayLike, backend: Backend | None = None) -> Array:
+        """
+        Pair potential.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(_backend.lj_phi, r, self._sigsq, self._four_eps)  # type: ignore[no-any-return]
+
         r = np.array(r)
         x2: Array = self._sigsq / (r * r)
         x6: Array = x2 * x2 * x2
         return self._four_eps * x6 * (x6 - 1.0)
 
-    @_docfiller_analytic()
+    @docfiller.decorate
     @override
-    def dphidr(self, r: Float_or_ArrayLike) -> Array:
-        """Calculate phi and dphi (=-1/r dphi/dr) at particular r."""
+    def dphidr(self, r: Float_or_ArrayLike, backend: Backend | None = None) -> Array:
+        r"""
+        Derivative of pair potential.
+
+        This returns the value of :math:`d \phi(r) / dr`
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.lj_dphidr, r, self._sigsq, self._four_eps
+            )
+
         r = np.array(r)
         rinvsq = 1.0 / (r * r)
 
@@ -164,6 +276,59 @@ class LennardJones(Analytic):
 
         return -12.0 * self._four_eps * x6 * (x6 - 0.5) / r
 
+    @docfiller.decorate
+    @override
+    def phi_and_dphidr(
+        self, r: Float_or_ArrayLike, backend: Backend | None = None
+    ) -> tuple[Array, Array]:
+        """
+        Pair potential and its derivative.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.lj_phi_dphidr, r, self._sigsq, self._four_eps, nout=2
+            )
+
+        # in-place operations to limit temporaries
+        r = np.asarray(r)
+        x2: Array = self._sigsq / (r * r)
+        x6: Array = x2 * x2
+        x6 *= x2
+
+        phi = x6 - 1.0
+        phi *= x6
+        phi *= self._four_eps
+
+        dphidr = x6 - 0.5
+        dphidr *= x6
+        dphidr *= -12.0 * self._four_eps
+        dphidr /= r
+        return phi, dphidr
+
+    @_docfiller_analytic()
+    @override
+    def secondvirial_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array | None:
+        return _secondvirial_mie(beta, 12, 6, self.sig, self._four_eps)
+
+    @_docfiller_analytic()
+    @override
+    def secondvirial_dbeta_analytic(
+        self, beta: Float_or_ArrayLike
+    ) -> Float_or_Array | None:
+        return _secondvirial_mie(beta, 12, 6, self.sig, self._four_eps, dbeta=True)
+
 
 @attrs.define(frozen=True)
 @_docfiller_analytic(Analytic)
@@ -217,17 +382,60 @@ class LennardJonesNM(Analytic):
         msg = f"Bad parameters lead to unknown prefac {out}"
         raise ValueError(msg)
 
-    @_docfiller_analytic()
+    @docfiller.decorate
     @override
-    def phi(self, r: Float_or_ArrayLike) -> Array:
+    def phi(self, r: Float_or_ArrayLike, backend: Backend | None = None) -> Array:
+        """
+        Pair potential.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.nm_phi, r, self.sig, float(self.n), float(self.m), self._prefac
+            )
+
         r = np.array(r)
 
         x = self.sig / r
         return self._prefac * (x**self.n - x**self.m)
 
-    @_docfiller_analytic()
+    @docfiller.decorate
     @override
-    def dphidr(self, r: Float_or_ArrayLike) -> Array:
+    def dphidr(self, r: Float_or_ArrayLike, backend: Backend | None = None) -> Array:
+        r"""
+        Derivative of pair potential.
+
+        This returns the value of :math:`d \phi(r) / dr`
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.nm_dphidr,
+                r,
+                self.sig,
+                float(self.n),
+                float(self.m),
+                self._prefac,
+            )
+
         r = np.array(r)
         x = self.sig / r
 
@@ -236,6 +444,62 @@ class LennardJonesNM(Analytic):
 
         return -self._prefac * (self.n * xn - self.m * xm) / (r)
 
+    @docfiller.decorate
+    @override
+    def phi_and_dphidr(
+        self, r: Float_or_ArrayLike, backend: Backend | None = None
+    ) -> tuple[Array, Array]:
+        """
+        Pair potential and its derivative.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.nm_phi_dphidr,
+                r,
+                self.sig,
+                float(self.n),
+                float(self.m),
+                self._prefac,
+                nout=2,
+            )
+
+        r = np.array(r)
+        x = self.sig / r
+
+        xn = x**self.n
+        xm = x**self.m
+
+        return (
+            self._prefac * (xn - xm),
+            -self._prefac * (self.n * xn - self.m * xm) / r,
+        )
+
+    @_docfiller_analytic()
+    @override
+    def secondvirial_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array | None:
+        return _secondvirial_mie(beta, self.n, self.m, self.sig, self._prefac)
+
+    @_docfiller_analytic()
+    @override
+    def secondvirial_dbeta_analytic(
+        self, beta: Float_or_ArrayLike
+    ) -> Float_or_Array | None:
+        return _secondvirial_mie(
+            beta, self.n, self.m, self.sig, self._prefac, dbeta=True
+        )
+
 
 @attrs.define(frozen=True)
 @_docfiller_analytic(Analytic)
@@ -275,10 +539,25 @@ class Yukawa(Analytic):
             segments=(0.0, self.sig, np.inf),
         )
 
-    @_docfiller_analytic()
+    @docfiller.decorate
     @override
-    def phi(self, r: Float_or_ArrayLike) -> Array:
+    def phi(self, r: Float_or_ArrayLike, backend: Backend | None = None) -> Array:
+        """
+        Pair potential.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
         sig, eps = self.sig, self.eps
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(_backend.yukawa_phi, r, sig, eps, self.z)  # type: ignore[no-any-return]
 
         r = np.array(r)
         phi = np.empty_like(r)
@@ -290,6 +569,74 @@ class Yukawa(Analytic):
             phi[m] = -eps * np.exp(-self.z * (x - 1.0)) / x
         return phi
 
+    @docfiller.decorate
+    @override
+    def dphidr(self, r: Float_or_ArrayLike, backend: Backend | None = None) -> Array:
+        r"""
+        Derivative of pair potential.
+
+        This returns the value of :math:`d \phi(r) / dr`.  Inside the hard
+        core (``r < sig``), this is ``-inf``.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.yukawa_dphidr, r, self.sig, self.eps, self.z
+            )
+        return self.phi_and_dphidr(r)[1]
+
+    @docfiller.decorate
+    @override
+    def phi_and_dphidr(
+        self, r: Float_or_ArrayLike, backend: Backend | None = None
+    ) -> tuple[Array, Array]:
+        """
+        Pair potential and its derivative.
+
+        Inside the hard core (``r < sig``), ``phi`` is ``inf`` and ``dphidr``
+        is ``-inf``.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        sig, eps = self.sig, self.eps
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.yukawa_phi_dphidr, r, sig, eps, self.z, nout=2
+            )
+
+        r = np.array(r)
+        phi = np.empty_like(r)
+        dphidr = np.empty_like(r)
+        m = r >= sig
+
+        phi[~m] = np.inf
+        dphidr[~m] = -np.inf
+        if np.any(m):
+            x = r[m] / sig
+            v = -eps * np.exp(-self.z * (x - 1.0)) / x
+            phi[m] = v
+            dphidr[m] = -v * (self.z + 1.0 / x) / sig
+        return phi, dphidr
+
 
 @attrs.define(frozen=True)
 @_docfiller_analytic(Analytic)
@@ -329,6 +676,16 @@ class HardSphere(Analytic):
         phi[~m0] = 0.0
         return phi
 
+    @_docfiller_analytic()
+    @override
+    def secondvirial_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array:
+        return _full_like_beta(TWO_PI / 3.0 * self.sig**3, beta)
+
+    @_docfiller_analytic()
+    @override
+    def secondvirial_dbeta_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array:  # noqa: PLR6301
+        return _full_like_beta(0.0, beta)
+
 
 @attrs.define(frozen=True)
 @_docfiller_analytic(Analytic)
@@ -368,10 +725,25 @@ class SquareWell(Analytic):
             segments=(0.0, self.sig, self.sig * self.lam),
         )
 
-    @_docfiller_analytic()
+    @docfiller.decorate
     @override
-    def phi(self, r: Float_or_ArrayLike) -> Array:
+    def phi(self, r: Float_or_ArrayLike, backend: Backend | None = None) -> Array:
+        """
+        Pair potential.
+
+        Parameters
+        ----------
+        {r}
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
         sig, eps, lam = self.sig, self.eps, self.lam
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(_backend.sw_phi, r, sig, eps, lam)  # type: ignore[no-any-return]
 
         r = np.array(r)
 
@@ -387,6 +759,57 @@ class SquareWell(Analytic):
 
         return phi
 
+    @_docfiller_analytic()
+    @override
+    def secondvirial_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array:
+        from .measures import secondvirial_sw
+
+        return cast(
+            "Float_or_Array",
+            secondvirial_sw(np.asarray(beta), self.sig, self.eps, self.lam),  # type: ignore[arg-type]
+        )
+
+    @_docfiller_analytic()
+    @override
+    def secondvirial_dbeta_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array:
+        beta = np.asarray(beta)
+        out = (
+            TWO_PI
+            / 3.0
+            * self.sig**3
+            * (self.lam**3 - 1.0)
+            * self.eps
+            * np.exp(-beta * self.eps)
+        )
+        return cast("Float_or_Array", out)
+
+    @_docfiller_analytic()
+    @override
+    def sig_nf_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array:
+        return _full_like_beta(self.sig, beta)
+
+    @_docfiller_analytic()
+    @override
+    def sig_nf_dbeta_analytic(self, beta: Float_or_ArrayLike) -> Float_or_Array:  # noqa: PLR6301
+        return _full_like_beta(0.0, beta)
+
+
+# supported floating point types of tables, by item size
+_FLOAT_DTYPES: dict[int, np.dtype[Any]] = {
+    4: np.dtype(np.float32),
+    8: np.dtype(np.float64),
+}
+
+
+def _validate_float_dtype(self: Any, attribute: Any, dtype: np.dtype[Any]) -> None:  # noqa: ARG001
+    if dtype not in _FLOAT_DTYPES.values():
+        msg = f"dtype must be float32 or float64, not {dtype}"
+        raise ValueError(msg)
+
+
+def _optional_asarray(value: ArrayLike | None) -> Array | None:
+    return None if value is None else np.asarray(value)
+
 
 def _validate_bounds(self: Any, attribute: Any, bounds: Sequence[float]) -> None:  # noqa: ARG001
     if len(bounds) != 2:  # noqa: PLR2004
@@ -394,6 +817,79 @@ def _validate_bounds(self: Any, attribute: Any, bounds: Sequence[float]) -> None
         raise ValueError(msg)
 
 
+# binary file format of CubicTable.save: magic, version, item size of dtype,
+# number of segments, number of table values, then smin, smax, phi_left,
+# phi_right, dphi_left, dphi_right, r_min, phi_min (nan for None).  Followed by
+# segments as float64 and CubicTable._coefs (shape (5, number of table values
+# + 1)) as little-endian dtype.
+_CUBIC_TABLE_HEADER = struct.Struct("<8sHHIQ8d")
+_CUBIC_TABLE_MAGIC = b"APYCUBIC"
+_CUBIC_TABLE_VERSION = 2
+
+
+def _read_cubic_table_header(path: Path) -> tuple[int, int, dict[str, Any]]:
+    """Offset and number of table values, and other constructor arguments of file."""
+    with path.open("rb") as f:
+        header = f.read(_CUBIC_TABLE_HEADER.size)
+        if len(header) != _CUBIC_TABLE_HEADER.size:
+            msg = f"{path} is not a CubicTable file"
+            raise ValueError(msg)
+        magic, version, itemsize, nseg, size, *values = _CUBIC_TABLE_HEADER.unpack(
+            header
+        )
+        if magic != _CUBIC_TABLE_MAGIC:
+            msg = f"{path} is not a CubicTable file"
+            raise ValueError(msg)
+        if version != _CUBIC_TABLE_VERSION:
+            msg = f"Unsupported CubicTable file version {version}"
+            raise ValueError(msg)
+        segments = tuple(np.fromfile(f, dtype="<f8", count=nseg).tolist())
+
+    offset = _CUBIC_TABLE_HEADER.size + 8 * nseg
+    nbytes = offset + itemsize * 5 * (size + 1)
+    if itemsize not in _FLOAT_DTYPES or path.stat().st_size != nbytes:
+        msg = f"{path} has wrong size for CubicTable with {size} values"
+        raise ValueError(msg)
+
+    kws: dict[str, Any] = dict(
+        zip(
+            ("phi_left", "phi_right", "dphi_left", "dphi_right", "r_min", "phi_min"),
+            values[2:],
+            strict=True,
+        )
+    )
+    for name in ("r_min", "phi_min"):
+        if math.isnan(kws[name]):
+            kws[name] = None
+    kws.update(
+        bounds=tuple(values[:2]), segments=segments, dtype=_FLOAT_DTYPES[itemsize]
+    )
+    return offset, size, kws
+
+
+# rows of CubicTable._coefs for phi and -1/r * dphi/dr
+_CUBIC_PHI_ROWS = (0, 1, 2)
+_CUBIC_DPHI_ROWS = (3, 4)
+
+
+def _horner(
+    coefs: Array,
+    rows: Sequence[int],
+    index: IndexArray,
+    xi: Array,
+    out: Array | None,
+) -> Array:
+    """Evaluate ``sum_i coefs[rows[i], index] * xi**i`` using Horner's method."""
+    if out is None:
+        out = np.empty_like(xi)
+    np.take(coefs[rows[-1]], index, out=out, mode="clip")
+    tmp = np.empty_like(xi)
+    for row in reversed(rows[:-1]):
+        np.multiply(out, xi, out=out)
+        np.add(out, np.take(coefs[row], index, out=tmp, mode="clip"), out=out)
+    return out
+
+
 @attrs.define(frozen=True)
 @docfiller.decorate
 class CubicTable(PhiBase):
@@ -407,13 +903,20 @@ class CubicTable(PhiBase):
     bounds : sequence of float
         the minimum and maximum values of squared pair separation `r**2` at which `phi_table` is evaluated.
     phi_table : array-like
-        Values of potential evaluated on even grid of ``r**2`` values.
+        Values of potential evaluated on even grid of ``r**2`` values.  This
+        is None for tables created by :meth:`load`, which hold only the
+        interpolation coefficients.
 
     segments : sequence of float, optional
         Integration segments.  Defaults to ``sqrt(bounds)``.
 
     phi_left, phi_right, dphi_left, dphi_right : float, optional
         Values to set for ``phi``/``-1/r dphidr`` if  (left) ``r < bounds[0]`` or (right) ``r > bounds[1]``.
+    dtype : {{float64, float32}}
+        Floating point type of interpolation coefficients and evaluated
+        values. ``float32`` halves memory and bandwidth, with relative error
+        of evaluated values of about ``1e-6`` (a few float32 epsilon times
+        ``d log(phi) / d log(r)``) in addition to interpolation error.
 
     """
 
@@ -422,7 +925,9 @@ class CubicTable(PhiBase):
         validator=_validate_bounds
     )  # validator=_validate_bounds, converter=tuple)
     #: Values of potential evaluated on even grid of :math:`r^2` values.
-    phi_table: ArrayLike = field(converter=np.asarray, repr=field_array_formatter())  # ty:ignore[dataclass-field-order]
+    phi_table: ArrayLike | None = field(
+        converter=_optional_asarray, repr=field_array_formatter(), eq=False
+    )  # ty:ignore[dataclass-field-order]
     #: value of `phi` at left bound (`r < bounds[0]`)
     phi_left: float = field(converter=float, default=np.inf)
     #: value of `phi` at right bound (`r > bounds[1]`)
@@ -432,18 +937,41 @@ class CubicTable(PhiBase):
     dphi_left: float = field(converter=float, default=np.inf)
     #: value of `dphi` at right bound
     dphi_right: float = field(converter=float, default=0.0)
+    #: Floating point type of coefficients and evaluation
+    dtype: np.dtype[Any] = field(
+        default=_FLOAT_DTYPES[8], converter=np.dtype, validator=_validate_float_dtype
+    )
 
     _ds: float = field(init=False, repr=False)
     _dsinv: float = field(init=False, repr=False)
+    # Set by load.  Ignored if phi_table is set.  Tables are compared by
+    # coefficients, which are set for tables with or without phi_table.
+    _coefs: Array = field(
+        default=None,
+        alias="_coefs",
+        kw_only=True,
+        repr=False,
+        eq=attrs.cmp_using(eq=np.array_equal, require_same_type=False),
+    )
 
     def __attrs_post_init__(self) -> None:
-        assert isinstance(self.phi_table, np.ndarray)  # noqa: S101
+        if self.phi_table is not None:
+            assert isinstance(self.phi_table, np.ndarray)  # noqa: S101
+            size = len(self.phi_table) - 1
+        elif self._coefs is not None:  # pyright: ignore[reportUnnecessaryComparison]
+            size = len(self._coefs[0]) - 2
+        else:
+            msg = "must set phi_table"  # type: ignore[unreachable]
+            raise ValueError(msg)
 
-        ds = (self.bounds[1] - self.bounds[0]) / self.size
+        ds = (self.bounds[1] - self.bounds[0]) / size
 
         self._immutable_setattrs(
             _ds=ds,
             _dsinv=1.0 / ds,
+            _coefs=self._get_coefs(1.0 / ds)
+            if self.phi_table is not None
+            else self._coefs.astype(self.dtype, copy=False),
         )
 
         if self.segments is None:  # pyright: ignore[reportUnnecessaryComparison]
@@ -496,8 +1024,100 @@ class CubicTable(PhiBase):
 
         return cls(bounds=bounds, phi_table=phi_table, **kws)
 
+    def save(self, path: str | PathLike[str]) -> None:
+        """
+        Write table to binary file.
+
+        The file holds a fixed size header (bounds, boundary values, ``dtype``,
+        ``r_min``, ``phi_min``, and ``segments``) followed by the interpolation
+        coefficients of each interval as raw little-endian ``dtype`` values, so
+        that they can be memory-mapped by :meth:`load`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Output file.
+
+        See Also
+        --------
+        load
+        """
+        segments = tuple(self.segments)
+        header = _CUBIC_TABLE_HEADER.pack(
+            _CUBIC_TABLE_MAGIC,
+            _CUBIC_TABLE_VERSION,
+            self.dtype.itemsize,
+            len(segments),
+            len(self),
+            self.smin,
+            self.smax,
+            self.phi_left,
+            self.phi_right,
+            self.dphi_left,
+            self.dphi_right,
+            np.nan if self.r_min is None else self.r_min,
+            np.nan if self.phi_min is None else self.phi_min,
+        )
+        with Path(path).open("wb") as f:
+            f.write(header)
+            f.write(np.asarray(segments, dtype="<f8").tobytes())
+            f.write(self._coefs.astype(self.dtype.newbyteorder("<")).tobytes())
+
+    @classmethod
+    def load(cls, path: str | PathLike[str], mmap: bool = True) -> Self:
+        """
+        Read table from file created by :meth:`save`.
+
+        Parameters
+        ----------
+        path : str or path-like
+            Input file.
+        mmap : bool, default=True
+            If True, the interpolation coefficients are a read-only
+            memory-map of the file.  Processes loading the same file share its
+            pages.  Otherwise, read the coefficients into memory.
+
+        Returns
+        -------
+        table : CubicTable
+            Table with ``phi_table`` of None.  Use :meth:`new_like` with
+            parameters which change the coefficients (for example, ``dtype``
+            or ``bounds``) to recover ``phi_table`` from the coefficients.
+
+        See Also
+        --------
+        save
+        """
+        path = Path(path)
+        offset, size, kws = _read_cubic_table_header(path)
+
+        dtype = kws["dtype"].newbyteorder("<")
+        shape = (5, size + 1)
+        coefs: Array
+        if mmap:
+            coefs = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=shape)
+        else:
+            coefs = np.fromfile(
+                path, dtype=dtype, count=shape[0] * shape[1], offset=offset
+            ).reshape(shape)
+        return cls(phi_table=None, _coefs=coefs, **kws)
+
+    def new_like(self, **kws: Any) -> Self:
+        if self.phi_table is None and kws.keys() - {"r_min", "phi_min", "segments"}:
+            # coefficients change, so recreate them from table values
+            kws.setdefault("phi_table", self._table_values())
+        return super().new_like(**kws)
+
+    def _table_values(self) -> Array:
+        """Values of potential at table nodes, from ``_coefs``."""
+        coefs = self._coefs[:3, 1:-1].astype(np.float64)
+        return np.append(coefs[0], coefs[:, -1].sum())
+
+    def __hash__(self) -> int:
+        return hash((tuple(self.bounds), self.dtype, self._coefs.tobytes()))
+
     def __len__(self) -> int:
-        return len(self.phi_table)
+        return len(self._coefs[0]) - 1
 
     @property
     def size(self) -> int:
@@ -514,51 +1134,213 @@ class CubicTable(PhiBase):
         """Maximum value of `s = r**2`."""
         return self.bounds[1]
 
-    def phidphi(self, r: Float_or_ArrayLike) -> tuple[Array, Array]:
-        """Values of `phi` and `dphi` at `r`."""
-        r = np.asarray(r)
+    def _get_coefs(self, dsinv: float) -> Array:
+        """
+        Polynomial coefficients of each interval.
+
+        Row ``i`` of the output is the coefficient of ``xi**i`` for ``phi``
+        (rows 0 to 2) and ``-1/r * dphi/dr`` (rows 3 and 4), where ``xi`` is
+        the fractional position in the interval. Column 0 is for
+        ``r < bounds[0]``, and the last column for ``r > bounds[1]``.
+        """
+        table = np.asarray(self.phi_table, dtype=np.float64)
+
+        t0 = table[:-1]
+        dt = np.diff(table)
+        # second difference, with last value repeated past end of table
+        ddt = np.append(dt[1:], 0.0) - dt
+
+        coefs = np.zeros((5, len(table) + 1), dtype=np.float64)
+        c0, c1, c2, d0, d1 = coefs[:, 1:-1]
+        c0[:] = t0
+        c1[:] = dt - 0.5 * ddt
+        c2[:] = 0.5 * ddt
+        d0[:] = -2.0 * dsinv * c1
+        d1[:] = -4.0 * dsinv * c2
+
+        coefs[[0, 3], 0] = self.phi_left, self.dphi_left
+        coefs[[0, 3], -1] = self.phi_right, self.dphi_right
+        return coefs.astype(self.dtype, copy=False)
+
+    def _interval(self, r: Float_or_ArrayLike) -> tuple[IndexArray, Array]:
+        """Index into columns of ``_coefs`` and fractional position for each ``r``."""
+        r = np.asarray(r, dtype=self.dtype)
+
+        xi = np.multiply(r, r, out=np.empty_like(r))
+        np.subtract(xi, self.smin, out=xi)
+        np.multiply(xi, self._dsinv, out=xi)
+        # r <= bounds[0] -> left
+        left = xi <= 0.0
+        np.clip(xi, -1.0, self.size, out=xi)
+
+        # nan r -> nan xi (and output), with any valid index
+        index = np.zeros(xi.shape, dtype=np.intp)
+        np.floor(xi, out=index, casting="unsafe", where=~np.isnan(xi))
+        np.subtract(xi, index, out=xi)
+        np.add(index, 1, out=index)
+        np.putmask(index, left, 0)
+        return index, xi
 
-        v = np.empty_like(r)
-        dv = np.empty_like(r)
+    @property
+    def _kernel_args(self) -> tuple[float, float, int, Array]:
+        return self.smin, self._dsinv, self.size, self._coefs
+
+    def _horner(
+        self, rows: Sequence[int], index: IndexArray, xi: Array, out: Array | None
+    ) -> Array:
+        return _horner(self._coefs, rows, index, xi, out)
+
+    @docfiller.decorate
+    def phidphi(
+        self,
+        r: Float_or_ArrayLike,
+        out: tuple[Array, Array] | None = None,
+        backend: Backend | None = None,
+    ) -> tuple[Array, Array]:
+        """
+        Values of `phi` and `dphi` at `r`.
 
-        s = r * r
-        left = s <= self.smin
-        right = s >= self.smax
-        mid = (~left) & (~right)
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : tuple of ndarray, optional
+            Arrays of ``dtype`` with same shape as ``r`` to store ``phi`` and
+            ``dphi`` in.
+        {backend}
 
-        v[left] = self.phi_left
-        dv[right] = self.dphi_left
+        Returns
+        -------
+        phi : ndarray
+            Pair potential.
+        dphi : ndarray
+            Value of ``-1/r * dphi/dr``.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.cubic_table_phidphi,
+                r,
+                *self._kernel_args,
+                out=out,
+                nout=2,
+                dtype=self.dtype,
+            )
+
+        index, xi = self._interval(r)
+        phi_out, dphi_out = (None, None) if out is None else out
+        return (
+            self._horner(_CUBIC_PHI_ROWS, index, xi, phi_out),
+            self._horner(_CUBIC_DPHI_ROWS, index, xi, dphi_out),
+        )
 
-        v[right] = self.phi_right
-        dv[right] = self.dphi_right
+    @docfiller.decorate
+    @override
+    def phi(
+        self,
+        r: Float_or_ArrayLike,
+        out: Array | None = None,
+        backend: Backend | None = None,
+    ) -> Array:
+        """
+        Pair potential.
 
-        if np.any(mid):
-            sds = (s[mid] - self.smin) * self._dsinv
-            k = sds.astype(int)
-            k[k < 0] = 0
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : ndarray, optional
+            Array of ``dtype`` with same shape as ``r`` to store output in.
+        {backend}
 
-            xi = sds - k
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.cubic_table_phi,
+                r,
+                *self._kernel_args,
+                out=out,
+                dtype=self.dtype,
+            )
+
+        index, xi = self._interval(r)
+        return self._horner(_CUBIC_PHI_ROWS, index, xi, out)
+
+    @docfiller.decorate
+    @override
+    def dphidr(
+        self,
+        r: Float_or_ArrayLike,
+        out: Array | None = None,
+        backend: Backend | None = None,
+    ) -> Array:
+        r"""
+        Derivative of pair potential.
 
-            # fmt: off
-            t: Array = np.take(self.phi_table, [k, k + 1, k + 2], mode="clip")
-            # fmt: on
-            dt = np.diff(t, axis=0)
-            ddt = np.diff(dt, axis=0)
+        This returns the value of :math:`d \phi(r) / dr`
 
-            v[mid] = t[0, :] + xi * (dt[0, :] + 0.5 * (xi - 1.0) * ddt[0, :])
-            dv[mid] = -2.0 * self._dsinv * (dt[0, :] + (xi - 0.5) * ddt[0, :])
-        return v, dv
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : ndarray, optional
+            Array of ``dtype`` with same shape as ``r`` to store output in.
+        {backend}
 
-    @_docfiller_phibase()
+        Returns
+        -------
+        dphidr : ndarray
+            Pair potential values.
+        """
+        if _backend.use_numba(backend, r):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.cubic_table_dphidr,
+                r,
+                *self._kernel_args,
+                out=out,
+                dtype=self.dtype,
+            )
+
+        r = np.asarray(r, dtype=self.dtype)
+        index, xi = self._interval(r)
+        out = self._horner(_CUBIC_DPHI_ROWS, index, xi, out)
+        np.multiply(out, r, out=out)
+        return np.negative(out, out=out)
+
+    @docfiller.decorate
     @override
-    def phi(self, r: Float_or_ArrayLike) -> Array:
-        return self.phidphi(r)[0]
+    def phi_and_dphidr(
+        self,
+        r: Float_or_ArrayLike,
+        out: tuple[Array, Array] | None = None,
+        backend: Backend | None = None,
+    ) -> tuple[Array, Array]:
+        """
+        Pair potential and its derivative.
 
-    @_docfiller_phibase()
-    @override
-    def dphidr(self, r: Float_or_ArrayLike) -> Array:
-        r = np.asarray(r)
-        return -r * self.phidphi(r)[1]
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : tuple of ndarray, optional
+            Arrays of ``dtype`` with same shape as ``r`` to store ``phi`` and
+            ``dphidr`` in.
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        r = np.asarray(r, dtype=self.dtype)
+        phi, dphi = self.phidphi(r, out=out, backend=backend)
+        np.multiply(dphi, r, out=dphi)
+        return phi, np.negative(dphi, out=dphi)
 
     @property
     def rsq_table(self) -> Array:
@@ -573,6 +1355,736 @@ class CubicTable(PhiBase):
         return np.sqrt(self.rsq_table)
 
 
+# rows of AdaptiveCubicTable._coefs for phi and -1/r * dphi/dr
+_HERMITE_PHI_ROWS = (0, 1, 2, 3)
+_HERMITE_DPHI_ROWS = (4, 5, 6)
+
+# fractional positions at which AdaptiveCubicTable.from_phi checks error
+_ADAPTIVE_TEST_XI = np.array([0.25, 0.5, 0.75])
+# maximum number of lookup cells per interval of AdaptiveCubicTable
+_ADAPTIVE_MAX_CELLS = 16
+
+
+def _hermite_coefs(s: Array, phi: Array, dphi: Array) -> Array:
+    """
+    Cubic Hermite coefficients of each interval of knots ``s``.
+
+    Returns array of shape ``(7, len(s) - 1)``.  Rows 0 to 3 are coefficients
+    of ``xi**i`` for ``phi``, and rows 4 to 6 for ``-1/r * dphi/dr``, where
+    ``dphi = -1/r * dphi/dr`` at knots.
+    """
+    h = np.diff(s)
+    p0, p1 = phi[:-1], phi[1:]
+    # d phi / d xi = h * d phi / ds = -h / 2 * dphi
+    m0, m1 = -0.5 * h * dphi[:-1], -0.5 * h * dphi[1:]
+
+    coefs = np.empty((7, len(h)), dtype=np.float64)
+    coefs[0] = p0
+    coefs[1] = m0
+    coefs[2] = 3.0 * (p1 - p0) - 2.0 * m0 - m1
+    coefs[3] = 2.0 * (p0 - p1) + m0 + m1
+    # -1/r dphi/dr = -2 dphi/ds = -2 / h * dphi/dxi
+    for i, n in enumerate((1, 2, 3)):
+        coefs[4 + i] = (-2.0 * n) * coefs[n] / h
+    return coefs
+
+
+def _adaptive_split(
+    values: Callable[[Array], tuple[Array, Array]],
+    s: Array,
+    phi: Array,
+    dphi: Array,
+    pending: BoolArray,
+    atol: float,
+    rtol: float,
+) -> BoolArray:
+    """Mask of ``pending`` intervals of knots ``s`` that fail error tolerance."""
+    (idx,) = np.nonzero(pending)
+    xi = np.broadcast_to(_ADAPTIVE_TEST_XI, (len(idx), len(_ADAPTIVE_TEST_XI)))
+    phi_test = values(s[idx, None] + (s[idx + 1] - s[idx])[:, None] * xi)[0]
+    phi_interp = _horner(
+        _hermite_coefs(s, phi, dphi),
+        _HERMITE_PHI_ROWS,
+        np.repeat(idx[:, None], xi.shape[1], axis=1),
+        xi,
+        None,
+    )
+    fail = np.any(
+        np.abs(phi_interp - phi_test) > atol + rtol * np.abs(phi_test), axis=1
+    )
+
+    split = np.zeros_like(pending)
+    split[idx[fail]] = True
+    return split
+
+
+@attrs.define(frozen=True)
+@docfiller.decorate
+class AdaptiveCubicTable(PhiBase):
+    """
+    Cubic interpolation table potential on a non-uniform grid.
+
+    The potential is interpolated with piecewise cubic Hermite polynomials in
+    ``s = r**2`` between knots ``rsq_table``.  Use :meth:`from_phi` to place
+    knots adaptively to meet an error tolerance.
+
+    Parameters
+    ----------
+    {r_min_exact}
+    {phi_min_exact}
+    rsq_table : array-like
+        Strictly increasing values of squared pair separation ``r**2``.
+    phi_table : array-like
+        Values of potential at ``rsq_table``.
+    dphi_table : array-like
+        Values of ``-1/r * dphi/dr`` at ``rsq_table``.
+    segments : sequence of float, optional
+        Integration segments.  Defaults to ``sqrt(bounds)``.
+    phi_left, phi_right, dphi_left, dphi_right : float, optional
+        Values to set for ``phi``/``-1/r dphidr`` if  (left) ``r < bounds[0]`` or (right) ``r > bounds[1]``.
+
+    See Also
+    --------
+    CubicTable
+    """
+
+    #: Values of squared pair separation :math:`r^2` (knots)
+    rsq_table: ArrayLike = field(  # ty:ignore[dataclass-field-order]
+        converter=np.asarray, repr=field_array_formatter()
+    )
+    #: Values of potential at knots
+    phi_table: ArrayLike = field(converter=np.asarray, repr=field_array_formatter())
+    #: Values of :math:`-1/r \, d\phi/dr` at knots
+    dphi_table: ArrayLike = field(converter=np.asarray, repr=field_array_formatter())
+    #: value of `phi` at left bound (`r < bounds[0]`)
+    phi_left: float = field(converter=float, default=np.inf)
+    #: value of `phi` at right bound (`r > bounds[1]`)
+    phi_right: float = field(converter=float, default=0.0)
+
+    #: value of `dphi` at left bound
+    dphi_left: float = field(converter=float, default=np.inf)
+    #: value of `dphi` at right bound
+    dphi_right: float = field(converter=float, default=0.0)
+
+    _coefs: Array = field(init=False, repr=False, eq=False)
+    _s_table: Array = field(init=False, repr=False, eq=False)
+    _lookup: IndexArray = field(init=False, repr=False, eq=False)
+    _dcellinv: float = field(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        s, phi, dphi = (
+            np.asarray(x, dtype=np.float64)
+            for x in (self.rsq_table, self.phi_table, self.dphi_table)
+        )
+        if s.ndim != 1 or len(s) < 2:  # noqa: PLR2004
+            msg = "rsq_table must be one dimensional with at least two values"
+            raise ValueError(msg)
+        if phi.shape != s.shape or dphi.shape != s.shape:
+            msg = "rsq_table, phi_table, and dphi_table must have the same shape"
+            raise ValueError(msg)
+        if np.any(np.diff(s) <= 0.0):
+            msg = "rsq_table must be strictly increasing"
+            raise ValueError(msg)
+
+        coefs = np.zeros((7, len(s) + 1), dtype=np.float64)
+        coefs[:, 1:-1] = _hermite_coefs(s, phi, dphi)
+        coefs[[0, 4], 0] = self.phi_left, self.dphi_left
+        coefs[[0, 4], -1] = self.phi_right, self.dphi_right
+
+        # Uniform cells in s, each mapped to the interval containing its left
+        # edge.  Knots from bisection of even intervals (from_phi) are on the
+        # grid with the smallest interval width, so each cell lies within a
+        # single interval, and lookup is a single step.  Cap the number of
+        # cells for general knots.
+        ncells = int(
+            min(
+                round((s[-1] - s[0]) / np.diff(s).min()),
+                _ADAPTIVE_MAX_CELLS * (len(s) - 1),
+            )
+        )
+        cells = s[0] + np.arange(ncells) * ((s[-1] - s[0]) / ncells)
+        lookup = np.searchsorted(s, cells, side="right").clip(1, len(s) - 1)
+
+        self._immutable_setattrs(
+            _coefs=coefs,
+            _s_table=np.append(s, np.inf),
+            _lookup=lookup,
+            _dcellinv=ncells / (s[-1] - s[0]),
+        )
+
+        if self.segments is None:  # pyright: ignore[reportUnnecessaryComparison]
+            self._immutable_setattrs(segments=tuple(np.sqrt(x) for x in self.bounds))  # type: ignore[unreachable]
+
+    @classmethod
+    def from_phi(
+        cls,
+        phi: Phi_Signature,
+        rmin: float,
+        rmax: float,
+        atol: float = 1e-8,
+        rtol: float = 1e-6,
+        dphidr: Phi_Signature | None = None,
+        size_init: int = 16,
+        max_size: int = 100_000,
+        **kws: Any,
+    ) -> Self:
+        """
+        Create object from callable pair potential function with error control.
+
+        Starting from ``size_init`` even intervals in ``s = r**2``, intervals
+        are bisected until the interpolated potential at the quarter points of
+        every interval satisfies
+        ``abs(table.phi(r) - phi(r)) <= atol + rtol * abs(phi(r))``.
+
+        Parameters
+        ----------
+        phi : callable
+            pair potential function
+        rmin : float
+            minimum pair separation `r` to evaluate at.
+        rmax : float
+            Maximum pair separation `r` to evaluate at.
+        atol, rtol : float
+            Absolute and relative tolerance of interpolated potential.
+        dphidr : callable, optional
+            Derivative of ``phi``.  If not passed, use central finite
+            differences of ``phi``.
+        size_init : int, default=16
+            Initial number of intervals.
+        max_size : int, default=100_000
+            Maximum number of intervals.
+        **kws :
+            Extra arguments to constructor.
+
+        Returns
+        -------
+        table : AdaptiveCubicTable
+
+        See Also
+        --------
+        CubicTable.from_phi
+        """
+        if dphidr is None:
+
+            def dphidr(r: Float_or_ArrayLike) -> Array:
+                r = np.asarray(r, dtype=np.float64)
+                h = 1e-5 * r
+                return (phi(r + h) - phi(r - h)) / (2.0 * h)
+
+        def values(s: Array) -> tuple[Array, Array]:
+            r = np.sqrt(s)
+            return (
+                np.asarray(phi(r), dtype=np.float64),
+                -np.asarray(dphidr(r), dtype=np.float64) / r,
+            )
+
+        s: Array = np.linspace(rmin * rmin, rmax * rmax, size_init + 1)
+        p, d = values(s)
+        pending = np.ones(size_init, dtype=bool)
+
+        while pending.any():
+            if not (np.all(np.isfinite(p)) and np.all(np.isfinite(d))):
+                msg = "phi and dphidr must be finite on [rmin, rmax]"
+                raise ValueError(msg)
+
+            split = _adaptive_split(values, s, p, d, pending, atol, rtol)
+            if len(s) - 1 + split.sum() > max_size:
+                msg = f"Could not reach tolerance with max_size={max_size} intervals"
+                raise ValueError(msg)
+
+            (isplit,) = np.nonzero(split)
+            s_new = s[isplit] + 0.5 * (s[isplit + 1] - s[isplit])
+            p_new, d_new = values(s_new)
+            s, p, d = (
+                np.insert(x, isplit + 1, y)
+                for x, y in ((s, s_new), (p, p_new), (d, d_new))
+            )
+            pending = np.repeat(split, split + 1)
+
+        return cls(rsq_table=s, phi_table=p, dphi_table=d, **kws)
+
+    def __len__(self) -> int:
+        return len(self.phi_table)
+
+    @property
+    def size(self) -> int:
+        """Number of intervals."""
+        return len(self) - 1
+
+    @property
+    def bounds(self) -> tuple[float, float]:
+        """Minimum and maximum values of squared pair separation :math:`r^2`."""
+        return float(self._s_table[0]), float(self._s_table[-2])
+
+    @property
+    def smin(self) -> float:
+        """Minimum value of `s = r**2`."""
+        return self.bounds[0]
+
+    @property
+    def smax(self) -> float:
+        """Maximum value of `s = r**2`."""
+        return self.bounds[1]
+
+    @property
+    def r_table(self) -> Array:
+        """Values of ``r`` where potential is defined."""
+        return np.sqrt(self.rsq_table)
+
+    def _interval(self, r: Float_or_ArrayLike) -> tuple[IndexArray, Array]:
+        """Index into columns of ``_coefs`` and fractional position for each ``r``."""
+        s_table = self._s_table
+        r = np.asarray(r, dtype=np.float64)
+
+        s = np.multiply(r, r, out=np.empty_like(r))
+        xi = np.subtract(s, self.smin, out=np.empty_like(r))
+        np.multiply(xi, self._dcellinv, out=xi)
+        np.clip(xi, 0.0, len(self._lookup) - 1, out=xi)
+        # nan r -> nan xi (and output), with any valid index
+        cell = np.zeros(xi.shape, dtype=np.intp)
+        np.floor(xi, out=cell, casting="unsafe", where=~np.isnan(xi))
+
+        # first guess from lookup, then step forward to s <= s_table[index].
+        # Knots past the end of s_table are inf.
+        index = np.take(self._lookup, cell, out=np.empty_like(cell), mode="clip")
+        forward = np.greater(s, s_table.take(index), out=np.empty(s.shape, dtype=bool))
+        while forward.any():
+            index += forward
+            np.greater(s, s_table.take(index), out=forward)
+        np.clip(index, 1, self.size, out=index)
+
+        lower = s_table.take(index - 1)
+        np.subtract(s, lower, out=xi)
+        np.divide(xi, s_table.take(index) - lower, out=xi)
+        np.putmask(index, s <= self.smin, 0)
+        np.putmask(index, s >= self.smax, self.size + 1)
+        np.clip(xi, 0.0, 1.0, out=xi)
+        return index, xi
+
+    def phidphi(
+        self,
+        r: Float_or_ArrayLike,
+        out: tuple[Array, Array] | None = None,
+    ) -> tuple[Array, Array]:
+        """
+        Values of `phi` and `dphi` at `r`.
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : tuple of ndarray, optional
+            Arrays of ``float64`` with same shape as ``r`` to store ``phi`` and
+            ``dphi`` in.
+
+        Returns
+        -------
+        phi : ndarray
+            Pair potential.
+        dphi : ndarray
+            Value of ``-1/r * dphi/dr``.
+        """
+        index, xi = self._interval(r)
+        phi_out, dphi_out = (None, None) if out is None else out
+        return (
+            _horner(self._coefs, _HERMITE_PHI_ROWS, index, xi, phi_out),
+            _horner(self._coefs, _HERMITE_DPHI_ROWS, index, xi, dphi_out),
+        )
+
+    @override
+    def phi(self, r: Float_or_ArrayLike, out: Array | None = None) -> Array:
+        """
+        Pair potential.
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : ndarray, optional
+            Array of ``float64`` with same shape as ``r`` to store output in.
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
+        index, xi = self._interval(r)
+        return _horner(self._coefs, _HERMITE_PHI_ROWS, index, xi, out)
+
+    @override
+    def dphidr(self, r: Float_or_ArrayLike, out: Array | None = None) -> Array:
+        r"""
+        Derivative of pair potential.
+
+        This returns the value of :math:`d \phi(r) / dr`
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : ndarray, optional
+            Array of ``float64`` with same shape as ``r`` to store output in.
+
+        Returns
+        -------
+        dphidr : ndarray
+            Pair potential values.
+        """
+        r = np.asarray(r, dtype=np.float64)
+        index, xi = self._interval(r)
+        out = _horner(self._coefs, _HERMITE_DPHI_ROWS, index, xi, out)
+        np.multiply(out, r, out=out)
+        return np.negative(out, out=out)
+
+    @override
+    def phi_and_dphidr(
+        self, r: Float_or_ArrayLike, out: tuple[Array, Array] | None = None
+    ) -> tuple[Array, Array]:
+        """
+        Pair potential and its derivative.
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        out : tuple of ndarray, optional
+            Arrays of ``float64`` with same shape as ``r`` to store ``phi`` and
+            ``dphidr`` in.
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        r = np.asarray(r, dtype=np.float64)
+        phi, dphi = self.phidphi(r, out=out)
+        np.multiply(dphi, r, out=dphi)
+        return phi, np.negative(dphi, out=dphi)
+
+
+def _convert_tables(tables: Sequence[Any]) -> tuple[CubicTable, ...]:
+    if not tables:
+        msg = "Must pass at least one table"
+        raise ValueError(msg)
+    for table in tables:
+        if not isinstance(table, CubicTable):
+            msg = f"tables must be CubicTable instances, not {type(table)}"
+            raise TypeError(msg)
+    return tuple(tables)
+
+
+@attrs.define(frozen=True)
+@docfiller.decorate
+class CubicTableBank:
+    """
+    Collection of :class:`CubicTable` objects evaluated together.
+
+    Interpolation coefficients of all tables are stored in a single
+    contiguous array, so that potentials for many pairs (for example, all
+    species pairs of a mixture) are evaluated in one vectorized call.  Tables
+    may have different bounds and sizes.  Evaluation uses the common
+    ``dtype`` of the tables (``float32`` only if all tables are ``float32``).
+
+    Parameters
+    ----------
+    tables : sequence of CubicTable
+        Table for each pair.  ``index`` in evaluation methods refers to
+        position in ``tables``.
+    """
+
+    #: Table for each pair
+    tables: tuple[CubicTable, ...] = field(converter=_convert_tables)
+
+    _smin: Array = field(init=False, repr=False, eq=False)
+    _dsinv: Array = field(init=False, repr=False, eq=False)
+    _size: IndexArray = field(init=False, repr=False, eq=False)
+    _offsets: IndexArray = field(init=False, repr=False, eq=False)
+    _coefs: Array = field(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        tables = self.tables
+        columns = np.array([table._coefs.shape[1] for table in tables])  # noqa: SLF001
+        offsets = np.zeros(len(tables), dtype=np.intp)
+        np.cumsum(columns[:-1], out=offsets[1:])
+
+        dtype = np.result_type(*(table.dtype for table in tables))
+        derived = {
+            "_smin": np.array([table.smin for table in tables], dtype=dtype),
+            "_dsinv": np.array([table._dsinv for table in tables], dtype=dtype),  # noqa: SLF001
+            "_size": np.array([table.size for table in tables], dtype=np.intp),
+            "_offsets": offsets,
+            "_coefs": np.concatenate(
+                [table._coefs for table in tables],  # noqa: SLF001
+                axis=1,
+                dtype=dtype,
+            ),
+        }
+        for key, value in derived.items():
+            object.__setattr__(self, key, value)
+
+    @classmethod
+    def from_phis(
+        cls,
+        phis: Sequence[Phi_Signature],
+        rmin: float | Sequence[float],
+        rmax: float | Sequence[float],
+        ds: float,
+        **kws: Any,
+    ) -> Self:
+        """
+        Create object from callable pair potential functions.
+
+        Parameters
+        ----------
+        phis : sequence of callable
+            Pair potential function for each pair.
+        rmin, rmax : float or sequence of float
+            Minimum and maximum pair separation to evaluate at.  Pass a
+            sequence for per-pair bounds.
+        ds : float
+            Spacing in ``s = r ** 2``.
+        **kws :
+            Extra arguments to :class:`CubicTable` constructor.
+
+        Returns
+        -------
+        bank : CubicTableBank
+
+        See Also
+        --------
+        CubicTable.from_phi
+        """
+        rmins, rmaxs = (np.broadcast_to(x, len(phis)) for x in (rmin, rmax))
+        return cls(
+            tables=[
+                CubicTable.from_phi(phi, rmin=float(lo), rmax=float(hi), ds=ds, **kws)
+                for phi, lo, hi in zip(phis, rmins, rmaxs, strict=True)
+            ]
+        )
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def __getitem__(self, index: int) -> CubicTable:
+        return self.tables[index]
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Floating point type of evaluation."""
+        return self._coefs.dtype
+
+    def _broadcast(
+        self, r: Float_or_ArrayLike, index: int | ArrayLike
+    ) -> tuple[Array, IndexArray]:
+        r_array: Array = np.asarray(r, dtype=self.dtype)
+        index_array: IndexArray = np.asarray(index, dtype=np.intp)
+        if index_array.size and (
+            index_array.min() < 0 or index_array.max() >= len(self)
+        ):
+            msg = f"index must be in range [0, {len(self)})"
+            raise IndexError(msg)
+        shape = np.broadcast_shapes(r_array.shape, index_array.shape)
+        return np.broadcast_to(r_array, shape), np.broadcast_to(index_array, shape)
+
+    def _interval(self, r: Array, index: IndexArray) -> tuple[IndexArray, Array]:
+        """Column of ``_coefs`` and fractional position for each ``(r, index)``."""
+        offsets = self._offsets.take(index)
+
+        xi = np.multiply(r, r, out=np.empty_like(r))
+        np.subtract(xi, self._smin.take(index), out=xi)
+        np.multiply(xi, self._dsinv.take(index), out=xi)
+        # r <= bounds[0] -> left
+        left = xi <= 0.0
+        np.clip(xi, -1.0, self._size.take(index), out=xi)
+
+        # nan r -> nan xi (and output), with any valid index
+        column = np.zeros(xi.shape, dtype=np.intp)
+        np.floor(xi, out=column, casting="unsafe", where=~np.isnan(xi))
+        np.subtract(xi, column, out=xi)
+        np.add(column, 1, out=column)
+        np.putmask(column, left, 0)
+        np.add(column, offsets, out=column)
+        return column, xi
+
+    def _kernel_args(
+        self, index: IndexArray
+    ) -> tuple[IndexArray, Array, Array, IndexArray, IndexArray, Array]:
+        return (
+            np.ascontiguousarray(index).reshape(-1),
+            self._smin,
+            self._dsinv,
+            self._size,
+            self._offsets,
+            self._coefs,
+        )
+
+    @docfiller.decorate
+    def phidphi(
+        self,
+        r: Float_or_ArrayLike,
+        index: int | ArrayLike,
+        out: tuple[Array, Array] | None = None,
+        backend: Backend | None = None,
+    ) -> tuple[Array, Array]:
+        """
+        Values of `phi` and `dphi` at `r` for pairs `index`.
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        index : int or array-like of int
+            Index of table for each value of ``r``.  Broadcast against ``r``.
+        out : tuple of ndarray, optional
+            Arrays of ``dtype`` with the broadcast shape of ``r`` and
+            ``index`` to store ``phi`` and ``dphi`` in.
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Pair potential.
+        dphi : ndarray
+            Value of ``-1/r * dphi/dr``.
+        """
+        r_array, index_array = self._broadcast(r, index)
+        if _backend.use_numba(backend, r_array):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.cubic_bank_phidphi,
+                r_array,
+                *self._kernel_args(index_array),
+                out=out,
+                nout=2,
+                dtype=self.dtype,
+            )
+
+        column, xi = self._interval(r_array, index_array)
+        phi_out, dphi_out = (None, None) if out is None else out
+        return (
+            _horner(self._coefs, _CUBIC_PHI_ROWS, column, xi, phi_out),
+            _horner(self._coefs, _CUBIC_DPHI_ROWS, column, xi, dphi_out),
+        )
+
+    @docfiller.decorate
+    def phi(
+        self,
+        r: Float_or_ArrayLike,
+        index: int | ArrayLike,
+        out: Array | None = None,
+        backend: Backend | None = None,
+    ) -> Array:
+        """
+        Pair potential.
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        index : int or array-like of int
+            Index of table for each value of ``r``.  Broadcast against ``r``.
+        out : ndarray, optional
+            Array of ``dtype`` with the broadcast shape of ``r`` and
+            ``index`` to store output in.
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        """
+        r_array, index_array = self._broadcast(r, index)
+        if _backend.use_numba(backend, r_array):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.cubic_bank_phi,
+                r_array,
+                *self._kernel_args(index_array),
+                out=out,
+                dtype=self.dtype,
+            )
+
+        column, xi = self._interval(r_array, index_array)
+        return _horner(self._coefs, _CUBIC_PHI_ROWS, column, xi, out)
+
+    @docfiller.decorate
+    def dphidr(
+        self,
+        r: Float_or_ArrayLike,
+        index: int | ArrayLike,
+        out: Array | None = None,
+        backend: Backend | None = None,
+    ) -> Array:
+        r"""
+        Derivative of pair potential.
+
+        This returns the value of :math:`d \phi(r) / dr`
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        index : int or array-like of int
+            Index of table for each value of ``r``.  Broadcast against ``r``.
+        out : ndarray, optional
+            Array of ``dtype`` with the broadcast shape of ``r`` and
+            ``index`` to store output in.
+        {backend}
+
+        Returns
+        -------
+        dphidr : ndarray
+            Pair potential values.
+        """
+        r_array, index_array = self._broadcast(r, index)
+        if _backend.use_numba(backend, r_array):
+            return _backend.evaluate(  # type: ignore[no-any-return]
+                _backend.cubic_bank_dphidr,
+                r_array,
+                *self._kernel_args(index_array),
+                out=out,
+                dtype=self.dtype,
+            )
+
+        column, xi = self._interval(r_array, index_array)
+        out = _horner(self._coefs, _CUBIC_DPHI_ROWS, column, xi, out)
+        np.multiply(out, r_array, out=out)
+        return np.negative(out, out=out)
+
+    @docfiller.decorate
+    def phi_and_dphidr(
+        self,
+        r: Float_or_ArrayLike,
+        index: int | ArrayLike,
+        out: tuple[Array, Array] | None = None,
+        backend: Backend | None = None,
+    ) -> tuple[Array, Array]:
+        """
+        Pair potential and its derivative.
+
+        Parameters
+        ----------
+        r : array-like
+            Pair separation.
+        index : int or array-like of int
+            Index of table for each value of ``r``.  Broadcast against ``r``.
+        out : tuple of ndarray, optional
+            Arrays of ``dtype`` with the broadcast shape of ``r`` and
+            ``index`` to store ``phi`` and ``dphidr`` in.
+        {backend}
+
+        Returns
+        -------
+        phi : ndarray
+            Evaluated pair potential.
+        dphidr : ndarray
+            Pair potential derivative values.
+        """
+        phi, dphi = self.phidphi(r, index, out=out, backend=backend)
+        np.multiply(dphi, r, out=dphi)
+        return phi, np.negative(dphi, out=dphi)
+
+
 if TYPE_CHECKING:
     _PHI_NAMES = Literal["lj", "nm", "sw", "hs", "yk", "LJ", "NM", "SW", "HS", "YK"]
 
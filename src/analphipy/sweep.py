@@ -0,0 +1,282 @@
+"""
+Parameter sweeps over pair potentials (:mod:`analphipy.sweep`)
+==============================================================
+
+Routines to evaluate Noro-Frenkel and other measures for many pair potentials,
+optionally in parallel using a :class:`concurrent.futures.Executor`.
+"""
+
+from __future__ import annotations
+
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ._docstrings import docfiller
+from .base_potential import PhiAbstract
+from .norofrenkel import NoroFrenkelPair
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping, Sequence
+    from concurrent.futures import Executor
+    from typing import Any
+
+    from ._typing import ArrayLike
+
+
+__all__ = ["map_measures", "map_nf", "map_potentials"]
+
+
+_docfiller_sweep = docfiller.update(
+    potentials="""
+    potentials : iterable of PhiAbstract or mapping
+        Pair potentials to analyze. Each element is either an instance of
+        :class:`analphipy.base_potential.PhiAbstract`, or a mapping of
+        arguments to :func:`analphipy.potential.factory` (e.g.,
+        ``{"potential_name": "nm", "n": 12, "m": 6, "lfs": True, "rcut": 2.5}``).
+        Mappings are converted to potentials on the workers.
+    """,
+    betas="""
+    betas : array-like
+        Values of inverse temperature ``beta``. Shared by all potentials.
+    """,
+    executor="""
+    executor : concurrent.futures.Executor, optional
+        Executor used to distribute the work. If not passed, a
+        :class:`concurrent.futures.ProcessPoolExecutor` with ``max_workers``
+        workers is created and shut down on exit. Workers are started with the
+        ``"forkserver"`` method where available, as forking a process which
+        has run numba parallel kernels (``backend="numba"``) is not safe. Note
+        that ``executor`` is not shut down by this function.
+    """,
+    max_workers="""
+    max_workers : int, optional
+        Number of workers for default executor. If ``max_workers=1`` (and
+        ``executor`` is not passed), the evaluation is done serially in the
+        current process.
+    """,
+    chunksize="""
+    chunksize : int, default=1
+        Number of potentials sent to each worker at a time. Larger values
+        reduce the overhead of many quick evaluations. Only used by
+        :class:`concurrent.futures.ProcessPoolExecutor`.
+    """,
+    map_output="""
+    output : list of dict
+        Output for each element of ``potentials``, in the same order as
+        ``potentials``.
+    """,
+).dedent()
+
+
+def _mp_context() -> Any:
+    methods = mp.get_all_start_methods()
+    return mp.get_context("forkserver" if "forkserver" in methods else None)
+
+
+def _as_phi(potential: PhiAbstract | Mapping[str, Any]) -> PhiAbstract:
+    if isinstance(potential, PhiAbstract):
+        return potential
+
+    from .potential import factory
+
+    return factory(**potential)
+
+
+def _nf_worker(
+    potential: PhiAbstract | Mapping[str, Any],
+    betas: ArrayLike,
+    props: Sequence[str] | None,
+    key_format: str,
+    nf_kws: Mapping[str, Any],
+    kws: Mapping[str, Any],
+) -> dict[str, Any]:
+    nf = NoroFrenkelPair.from_phi_class(_as_phi(potential), **nf_kws)
+    return nf.table(betas, props=props, key_format=key_format, **kws)
+
+
+def _measures_worker(
+    potential: PhiAbstract | Mapping[str, Any],
+    betas: ArrayLike,
+    props: Sequence[str],
+    key_format: str,
+    measures_kws: Mapping[str, Any],
+    kws: Mapping[str, Any],
+) -> dict[str, Any]:
+    measures = _as_phi(potential).to_measures(**measures_kws)
+    table: dict[str, Any] = {"beta": betas}
+    for prop in props:
+        table[key_format.format(prop=prop)] = getattr(measures, prop)(beta=betas, **kws)
+    return table
+
+
+@_docfiller_sweep.decorate
+def map_potentials(
+    func: Callable[..., Any],
+    potentials: Iterable[PhiAbstract | Mapping[str, Any]],
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+) -> list[Any]:
+    """
+    Apply function to each potential, optionally in parallel.
+
+    Parameters
+    ----------
+    func : callable
+        Function with signature ``func(potential)``. To use a process pool,
+        ``func`` must be picklable (i.e., defined at module level, or a
+        :func:`functools.partial` of such a function).
+    {potentials}
+    {executor}
+    {max_workers}
+    {chunksize}
+
+    Returns
+    -------
+    output : list
+        ``[func(potential) for potential in potentials]``, in the same order as
+        ``potentials``.
+    """
+    if executor is not None:
+        return list(executor.map(func, potentials, chunksize=chunksize))
+
+    if max_workers == 1:
+        return list(map(func, potentials))
+
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=_mp_context()) as pool:
+        return list(pool.map(func, potentials, chunksize=chunksize))
+
+
+@_docfiller_sweep.decorate
+def map_nf(
+    potentials: Iterable[PhiAbstract | Mapping[str, Any]],
+    betas: ArrayLike,
+    props: Sequence[str] | None = None,
+    key_format: str = "{prop}",
+    nf_kws: Mapping[str, Any] | None = None,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    **kws: Any,
+) -> list[dict[str, Any]]:
+    """
+    Noro-Frenkel analysis of many potentials.
+
+    For each potential, this creates a
+    :class:`~analphipy.norofrenkel.NoroFrenkelPair` with
+    :meth:`~analphipy.norofrenkel.NoroFrenkelPair.from_phi_class`, and calls
+    :meth:`~analphipy.norofrenkel.NoroFrenkelPair.table`.
+
+    Parameters
+    ----------
+    {potentials}
+    {betas}
+    props : sequence of str, optional
+        Properties to calculate. See
+        :meth:`~analphipy.norofrenkel.NoroFrenkelPair.table`.
+    key_format : str, default="{{prop}}"
+        Format of keys in output.
+    nf_kws : mapping, optional
+        Extra arguments to
+        :meth:`~analphipy.norofrenkel.NoroFrenkelPair.from_phi_class` (e.g.,
+        ``bounds``, ``quad_kws``).
+    {executor}
+    {max_workers}
+    {chunksize}
+    **kws
+        Extra arguments to :meth:`~analphipy.norofrenkel.NoroFrenkelPair.table`.
+
+    Returns
+    -------
+    {map_output}
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> from analphipy.sweep import map_nf
+    >>> specs = [{{"potential_name": "nm", "n": n, "m": 6}} for n in (12, 18)]
+    >>> out = map_nf(specs, betas=[0.5, 1.0], props=["B2", "sig"], max_workers=1)
+    >>> pd.concat([pd.DataFrame(x).assign(n=spec["n"]) for x, spec in zip(out, specs)])
+       beta        B2       sig   n
+    0   0.5 -1.314495  0.988327  12
+    1   1.0 -5.315745  1.015605  12
+    0   0.5 -0.557076  0.991233  18
+    1   1.0 -3.658365  1.012203  18
+    """
+    func = partial(
+        _nf_worker,
+        betas=np.asarray(betas, dtype=np.float64),
+        props=props,
+        key_format=key_format,
+        nf_kws={} if nf_kws is None else nf_kws,
+        kws=kws,
+    )
+    return map_potentials(
+        func,
+        potentials,
+        executor=executor,
+        max_workers=max_workers,
+        chunksize=chunksize,
+    )
+
+
+@_docfiller_sweep.decorate
+def map_measures(
+    potentials: Iterable[PhiAbstract | Mapping[str, Any]],
+    betas: ArrayLike,
+    props: Sequence[str] = ("secondvirial",),
+    key_format: str = "{prop}",
+    measures_kws: Mapping[str, Any] | None = None,
+    executor: Executor | None = None,
+    max_workers: int | None = None,
+    chunksize: int = 1,
+    **kws: Any,
+) -> list[dict[str, Any]]:
+    """
+    Calculate measures of many potentials.
+
+    For each potential, this creates a :class:`~analphipy.measures.Measures`
+    object, and calls each method in ``props`` with the full array ``betas``.
+
+    Parameters
+    ----------
+    {potentials}
+    {betas}
+    props : sequence of str, default=("secondvirial",)
+        Names of :class:`~analphipy.measures.Measures` methods accepting an
+        array of ``beta`` values.
+    key_format : str, default="{{prop}}"
+        Format of keys in output.
+    measures_kws : mapping, optional
+        Extra arguments to
+        :meth:`~analphipy.base_potential.PhiAbstract.to_measures` (e.g.,
+        ``quad_kws``).
+    {executor}
+    {max_workers}
+    {chunksize}
+    **kws
+        Extra arguments to methods.
+
+    Returns
+    -------
+    {map_output}
+    """
+    func = partial(
+        _measures_worker,
+        betas=np.asarray(betas, dtype=np.float64),
+        props=props,
+        key_format=key_format,
+        measures_kws={} if measures_kws is None else measures_kws,
+        kws=kws,
+    )
+    return map_potentials(
+        func,
+        potentials,
+        executor=executor,
+        max_workers=max_workers,
+        chunksize=chunksize,
+    )
@@ -5,7 +5,7 @@ Utilities module (:mod:`analphipy.utils`)
 
 from __future__ import annotations
 
-from functools import wraps
+from functools import lru_cache, wraps
 from itertools import pairwise
 from typing import TYPE_CHECKING, cast
 
@@ -15,9 +15,17 @@ from ._docstrings import docfiller
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable, Mapping, Sequence
-    from typing import Any, Protocol, TypeVar
-
-    from ._typing import ArrayLike, OptimizeResultInterface, P, QuadSegments, R
+    from typing import Any, Literal, Protocol, TypeVar
+
+    from ._typing import (
+        Array,
+        ArrayLike,
+        Float_or_ArrayLike,
+        OptimizeResultInterface,
+        P,
+        QuadSegments,
+        R,
+    )
     from ._typing_compat import Concatenate, TypeGuard
 
 
@@ -43,6 +51,37 @@ def combine_segmets(a: ArrayLike, b: ArrayLike) -> list[float]:
     return sorted(aa.union(bb))  # type: ignore[arg-type, unused-ignore]
 
 
+def split_segments(segments: ArrayLike, *points: float | None) -> list[float]:
+    """
+    Add break points to segments.
+
+    Parameters
+    ----------
+    segments : array-like
+        Integration limits.
+    *points : float or None
+        Break points to add. Values which are None, or not strictly inside
+        ``segments``, are ignored.
+
+    Returns
+    -------
+    segments : list of float
+        Sorted unique values of ``segments`` and ``points``.
+
+    Examples
+    --------
+    >>> split_segments([0.0, np.inf], 1.1, None, 5.0)
+    [0.0, 1.1, 5.0, inf]
+    >>> split_segments([0.0, 2.5], 3.0)
+    [0.0, 2.5]
+    """
+    out = [float(x) for x in segments]
+    lower, upper = min(out), max(out)
+    return sorted(
+        {*out, *(float(x) for x in points if x is not None and lower < x < upper)}
+    )
+
+
 def is_float(val: Any) -> TypeGuard[float]:
     """
     Type guard for float.
@@ -52,6 +91,96 @@ def is_float(val: Any) -> TypeGuard[float]:
     return isinstance(val, float)
 
 
+@lru_cache(maxsize=32)
+def _leggauss(order: int) -> tuple[Array, Array]:
+    """Cached Gauss-Legendre nodes and weights on ``(-1, 1)``."""
+    x, w = np.polynomial.legendre.leggauss(order)
+    x.flags.writeable = False
+    w.flags.writeable = False
+    return x, w
+
+
+def gauss_legendre_nodes(a: float, b: float, order: int = 200) -> tuple[Array, Array]:
+    r"""
+    Gauss-Legendre nodes and weights over the interval ``(a, b)``.
+
+    Infinite limits are handled with a change of variables.  For example, for
+    ``b = inf``, the nodes are mapped using :math:`r = a + t / (1 - t)` with
+    :math:`t \in (0, 1)`.
+
+    Parameters
+    ----------
+    a, b : float
+        Lower and upper limits of integration.  These can be infinite.
+    order : int, default=200
+        Number of quadrature nodes.
+
+    Returns
+    -------
+    nodes : ndarray
+        Quadrature nodes.
+    weights : ndarray
+        Quadrature weights (including the Jacobian of any variable mapping).
+
+    Examples
+    --------
+    >>> x, w = gauss_legendre_nodes(0.0, np.inf, order=50)
+    >>> print(f"{np.sum(w * np.exp(-x)):.6f}")
+    1.000000
+    """
+    x, w = _leggauss(order)
+
+    a_inf, b_inf = np.isinf(a), np.isinf(b)
+    if not (a_inf or b_inf):
+        half = 0.5 * (b - a)
+        return half * x + 0.5 * (a + b), half * w
+
+    if a_inf and b_inf:
+        # map t in (-1, 1) to (-inf, inf)
+        tsq = x * x
+        return x / (1.0 - tsq), w * (1.0 + tsq) / (1.0 - tsq) ** 2
+
+    # map t in (0, 1) to semi-infinite interval
+    t = 0.5 * (x + 1.0)
+    wt = 0.5 * w
+    if b_inf:
+        return a + t / (1.0 - t), wt / (1.0 - t) ** 2
+    return b - (1.0 - t) / t, wt / (t * t)
+
+
+def _quad_full_output(out: tuple[Any, ...]) -> tuple[float, float, dict[str, Any]]:
+    """Output of ``quad(..., full_output=True)`` as ``(integral, error, info)``."""
+    integral, error, info, *message = out
+    if message:
+        # quad returns extra message (and explanation) on issues
+        info = {**info, "message": message[0]}
+    return integral, error, info
+
+
+def _quad_gauss(
+    func: Callable[..., Any],
+    a: float,
+    b: float,
+    args: tuple[Any, ...],
+    order: int,
+    err: bool,
+) -> tuple[Any, Any, dict[str, Any]]:
+    """Vectorized fixed order Gauss-Legendre quadrature over single segment."""
+    x, w = gauss_legendre_nodes(a, b, order)
+    integral = np.sum(func(x, *args) * w, axis=-1)
+
+    neval = order
+    if err:
+        # Error estimate from comparison to lower order rule.
+        x, w = gauss_legendre_nodes(a, b, order // 2)
+        error = np.abs(integral - np.sum(func(x, *args) * w, axis=-1))
+        neval += order // 2
+    else:
+        error = np.nan * integral
+
+    return integral, error, {"neval": neval, "order": order}
+
+
 @docfiller.decorate
 def quad_segments(
     func: Callable[..., Any],
@@ -61,6 +190,8 @@ def quad_segments(
     sum_integrals: bool = True,
     sum_errors: bool = False,
     err: bool = True,
+    method: Literal["quad", "gauss"] = "quad",
+    order: int = 200,
     **kws: Any,
 ) -> QuadSegments:
     """
@@ -81,6 +212,21 @@ def quad_segments(
         If True and returning `error` sum errors.
     err : bool, default=True
         If True, return error.
+    method : {{"quad", "gauss"}}
+        Integration engine.  If ``"quad"``, use adaptive
+        :func:`scipy.integrate.quad` over each segment.  If ``"gauss"``, use
+        fixed order Gauss-Legendre quadrature (see
+        :func:`gauss_legendre_nodes`), where ``func`` is called once per
+        segment with an array of nodes.  In this case, ``func`` must be
+        vectorized, and may return an array of shape ``(..., order)``, in
+        which case the integration is performed over the last axis.  The
+        error estimate is the difference from a rule of order ``order // 2``.
+        Semi-infinite segments are mapped to a finite interval, which can
+        under-resolve narrow features (e.g., the well of a steep potential).
+        Add a break point at the length scale of the integrand (e.g., with
+        :func:`split_segments` at ``r_min``) in this case.
+    order : int, default=200
+        Number of nodes per segment if ``method="gauss"``.
     **kws :
         Extra arguments to :func:`scipy.integrate.quad`
 
@@ -98,14 +244,29 @@ def quad_segments(
     See Also
     --------
     scipy.integrate.quad
+    gauss_legendre_nodes
 
     """
-    from scipy.integrate import quad
+    if method not in {"quad", "gauss"}:
+        msg = f"Unknown method {method}"
+        raise ValueError(msg)
 
-    out: list[tuple[float, float, dict[str, Any]]] = [
-        quad(func, a=a, b=b, args=args, full_output=True, **kws)
-        for a, b in pairwise(segments)
-    ]
+    out: list[tuple[Any, Any, dict[str, Any]]]
+    if method == "gauss":
+        if kws:
+            msg = f"Unknown arguments {list(kws)} for method='gauss'"
+            raise ValueError(msg)
+        out = [
+            _quad_gauss(func, a=a, b=b, args=args, order=order, err=err or full_output)
+            for a, b in pairwise(segments)
+        ]
+    else:
+        from scipy.integrate import quad
+
+        out = [
+            _quad_full_output(quad(func, a=a, b=b, args=args, full_output=True, **kws))
+            for a, b in pairwise(segments)
+        ]
 
     integrals: float | list[float]
     errors: float | list[float]
@@ -124,10 +285,14 @@ def quad_segments(
             outputs_list.append(o)
 
         integrals = (
-            cast("float", np.sum(integrals_list)) if sum_integrals else integrals_list
+            cast("float", np.sum(integrals_list, axis=0))
+            if sum_integrals
+            else integrals_list
         )
 
-        errors = np.sum(errors_list) if sum_errors else errors_list
+        errors = (
+            cast("float", np.sum(errors_list, axis=0)) if sum_errors else errors_list
+        )
 
         outputs = outputs_list
 
@@ -141,6 +306,82 @@ def quad_segments(
     return integrals
 
 
+@docfiller.decorate
+def quad_segments_beta(
+    func: Callable[..., Any],
+    beta: Float_or_ArrayLike,
+    segments: ArrayLike,
+    err: bool = False,
+    full_output: bool = False,
+    **kws: Any,
+) -> QuadSegments:
+    """
+    Perform quadrature of ``func(r, beta)`` over one or many values of ``beta``.
+
+    Integrals (and errors) are summed over segments.
+
+    Parameters
+    ----------
+    func : callable
+        Integrand with signature ``func(r, beta)``.
+    beta : float or array-like
+        Inverse temperature(s).
+    {segments}
+    {err}
+    {full_output}
+    **kws :
+        Extra arguments to :func:`quad_segments`
+
+    Returns
+    -------
+    integral : float or ndarray
+        Value of integral.  If ``beta`` is an array, this is an array of the same
+        shape.
+    errors : float or ndarray, optional
+        Integration error(s).  Returned if ``err`` is True.
+    outputs : object
+        Output from :func:`quad_segments`.  If ``beta`` is an array and using
+        ``method="quad"``, this is a list of outputs for each value of
+        ``beta``.
+
+    Notes
+    -----
+    For array ``beta`` and ``method="gauss"``, ``func`` is called (once per
+    segment) with ``beta`` of shape ``(*beta.shape, 1)`` so that it broadcasts
+    against the nodes ``r``.  That is, any ``beta`` independent quantities
+    (e.g., the potential) are evaluated once per node.  For ``method="quad"``,
+    the integration is performed separately for each value of ``beta``.
+
+    See Also
+    --------
+    quad_segments
+
+    """
+    kws.update(sum_integrals=True, sum_errors=True, err=err, full_output=full_output)
+
+    if np.ndim(beta) == 0:
+        return quad_segments(func, segments=segments, args=(beta,), **kws)
+
+    betas = np.asarray(beta, dtype=np.float64)
+    if kws.get("method", "quad") == "gauss":
+        return quad_segments(func, segments=segments, args=(betas[..., None],), **kws)
+
+    out: list[Any] = [
+        quad_segments(func, segments=segments, args=(b,), **kws) for b in betas.flat
+    ]
+    if not (err or full_output):
+        return np.reshape(out, betas.shape)
+
+    columns = list(zip(*out, strict=True))
+    integrals = np.reshape(columns[0], betas.shape)
+    outputs = list(columns[-1])
+    if err and full_output:
+        return integrals, np.reshape(columns[1], betas.shape), outputs
+    if err:
+        return integrals, np.reshape(columns[1], betas.shape)
+    return integrals, outputs
+
+
 def minimize_phi(
     phi: Callable[..., Any],
     r0: float,
@@ -0,0 +1,147 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+import asyncio
+import multiprocessing as mp
+import pickle  # noqa: S403
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import analphipy.potential as pots
+from analphipy import _async  # noqa: PLC2701
+from analphipy.norofrenkel import NoroFrenkelPair
+
+betas = [0.5, 1.0, 1.5]
+
+
+def test_async_matches_sync() -> None:
+    nf = pots.LennardJones().to_nf()
+    m = pots.LennardJones().to_measures()
+    ref = pots.LennardJones().to_nf()
+
+    async def run():
+        return await asyncio.gather(
+            nf.atable(betas, props=["B2", "sig", "lam"]),
+            nf.asecondvirial(1.0),
+            nf.asig(1.0),
+            nf.alam(1.0),
+            m.asecondvirial(np.array(betas)),
+            m.asecondvirial_dbeta(1.0, err=True),
+        )
+
+    table, b2, sig, lam, m_b2, m_b2_dbeta = asyncio.run(run())
+
+    expected = ref.table(betas, props=["B2", "sig", "lam"])
+    for key, value in expected.items():
+        np.testing.assert_allclose(table[key], value)
+    assert b2 == ref.secondvirial(1.0)
+    assert sig == ref.sig(1.0)
+    assert lam == ref.lam(1.0)
+    np.testing.assert_allclose(m_b2, [ref.secondvirial(beta) for beta in betas])
+    assert m_b2_dbeta == pots.LennardJones().to_measures().secondvirial_dbeta(
+        1.0, err=True
+    )
+
+
+def test_async_coalesce() -> None:
+    a = pots.LennardJones().to_nf()
+    b = pots.LennardJones().to_nf()
+
+    async def run(*objs):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await asyncio.gather(*(x.alam(1.0, executor=executor) for x in objs))
+
+    # equivalent objects share a single calculation
+    out = asyncio.run(run(a, a, b))
+    assert out[0] == out[1] == out[2]
+    assert a.cache_info("lam").misses + b.cache_info("lam").misses == 1
+    assert a.cache_info("lam").hits + b.cache_info("lam").hits == 0
+
+    # without stable hash, only share calculations on the same object
+    c, d = (
+        NoroFrenkelPair(
+            phi=lambda r: 4 * (r**-12 - r**-6),
+            segments=[0.0, np.inf],
+            r_min=2 ** (1 / 6),
+            phi_min=-1.0,
+        )
+        for _ in range(2)
+    )
+    out = asyncio.run(run(c, c, d))
+    np.testing.assert_allclose(out, out[0])
+    assert c.cache_info("lam").misses == d.cache_info("lam").misses == 1
+
+    assert not any(_async._IN_FLIGHT.values())  # noqa: SLF001
+
+
+def test_async_cancel() -> None:
+    nf = pots.LennardJones().to_nf()
+    release = threading.Event()
+
+    async def run(cancel_all: bool):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # occupy the worker, so that the calculation is queued
+            blocker = asyncio.get_running_loop().run_in_executor(executor, release.wait)
+            first = asyncio.ensure_future(nf.asig(1.0, executor=executor))
+            second = asyncio.ensure_future(nf.asig(1.0, executor=executor))
+            await asyncio.sleep(0)
+
+            first.cancel()
+            if cancel_all:
+                second.cancel()
+                await asyncio.wait([first, second])
+            else:
+                await asyncio.wait([first])
+            # let cancellation reach the executor
+            await asyncio.sleep(0)
+            release.set()
+            await blocker
+
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            if cancel_all:
+                with pytest.raises(asyncio.CancelledError):
+                    await second
+                return None
+            return await second
+
+    # other request is not cancelled
+    assert asyncio.run(run(cancel_all=False)) == nf.sig(1.0)
+    nf.cache_clear()
+    release.clear()
+
+    # calculation is cancelled with the last request
+    assert asyncio.run(run(cancel_all=True)) is None
+    assert nf.cache_info("sig").currsize == 0
+
+
+def test_async_error() -> None:
+    nf = pots.LennardJones().to_nf()
+
+    async def run():
+        return await asyncio.gather(
+            nf.atable(betas, props=["bad"]), nf.atable(betas, props=["bad"])
+        )
+
+    with pytest.raises(AttributeError):
+        asyncio.run(run())
+
+
+def test_async_process() -> None:
+    nf = pots.LennardJones().to_nf()
+    nf.sig(1.0)
+
+    # in-memory cache is not pickled
+    other = pickle.loads(pickle.dumps(nf))  # noqa: S301
+    assert other.cache_info().currsize == 0
+    assert other.sig(1.0) == nf.sig(1.0)
+
+    async def run():
+        with ProcessPoolExecutor(
+            max_workers=1, mp_context=mp.get_context("spawn")
+        ) as executor:
+            return await nf.atable(betas, props=["lam"], executor=executor)
+
+    out = asyncio.run(run())
+    np.testing.assert_allclose(out["lam"], nf.table(betas, props=["lam"])["lam"])
@@ -0,0 +1,155 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+import numpy as np
+import pytest
+
+from analphipy import _backend  # noqa: PLC2701
+from analphipy import potential as pots
+
+_table = pots.CubicTable.from_phi(
+    pots.LennardJones().phi, rmin=0.8, rmax=2.5, ds=0.01, dphi_left=5.0
+)
+
+POTENTIALS = [
+    (pots.LennardJones(sig=1.1, eps=0.9), ["phi", "dphidr", "phi_and_dphidr"]),
+    (pots.LennardJonesNM(n=18, m=9), ["phi", "dphidr", "phi_and_dphidr"]),
+    (
+        pots.LennardJonesNM(n=10.5, m=4.5, sig=0.9),
+        ["phi", "dphidr", "phi_and_dphidr"],
+    ),
+    (pots.Yukawa(z=2.0), ["phi", "dphidr", "phi_and_dphidr"]),
+    (pots.SquareWell(sig=1.1, eps=-0.5, lam=1.4), ["phi"]),
+    (_table, ["phi", "dphidr", "phidphi", "phi_and_dphidr"]),
+]
+
+
+def _get_r():
+    r = np.random.default_rng().uniform(0.5, 3.0, 1000)
+    # boundaries
+    r[:6] = [0.8, 1.0, 1.1, 1.1 * 1.4, 2.5, _table.r_table[10]]
+    return r.reshape(10, 100)
+
+
+@pytest.mark.skipif(not _backend.HAS_NUMBA, reason="numba not installed")
+@pytest.mark.parametrize(("p", "methods"), POTENTIALS)
+def test_backend_numba(p, methods) -> None:
+    r = _get_r()
+    for name in methods:
+        meth = getattr(p, name)
+        expected = meth(r, backend="numpy")
+        out = meth(r, backend="numba")
+        np.testing.assert_allclose(out, expected, rtol=1e-12, atol=1e-14)
+
+        # scalars
+        scalar = meth(1.2, backend="numba")
+        np.testing.assert_allclose(scalar, meth(1.2, backend="numpy"), rtol=1e-12)
+        assert np.shape(scalar) == np.shape(meth(1.2, backend="numpy"))
+
+
+def test_kernels() -> None:
+    # compiled or pure python kernels
+    r = _get_r()[0]
+    p = pots.LennardJones()
+    np.testing.assert_allclose(
+        _backend.evaluate(_backend.lj_phi, r, 1.0, 4.0), p.phi(r), rtol=1e-12
+    )
+
+    y = pots.Yukawa(z=2.0)
+    for a, b in zip(
+        _backend.evaluate(_backend.yukawa_phi_dphidr, r, 1.0, 1.0, 2.0, nout=2),
+        y.phi_and_dphidr(r, backend="numpy"),
+        strict=True,
+    ):
+        np.testing.assert_allclose(a, b, rtol=1e-12)
+    np.testing.assert_allclose(
+        _backend.evaluate(_backend.yukawa_dphidr, r, 1.0, 1.0, 2.0),
+        y.dphidr(r, backend="numpy"),
+        rtol=1e-12,
+    )
+
+    phi, dphi = _backend.evaluate(
+        _backend.cubic_table_phidphi,
+        r,
+        *_table._kernel_args,  # noqa: SLF001
+        nout=2,
+    )
+    expected = _table.phidphi(r, backend="numpy")
+    np.testing.assert_allclose(phi, expected[0], rtol=1e-12)
+    np.testing.assert_allclose(dphi, expected[1], rtol=1e-12)
+
+    # nan propagates in both backends
+    r_nan = np.array([np.nan, 1.2])
+    for a, b in zip(
+        _backend.evaluate(
+            _backend.cubic_table_phidphi,
+            r_nan,
+            *_table._kernel_args,  # noqa: SLF001
+            nout=2,
+        ),
+        _table.phidphi(r_nan, backend="numpy"),
+        strict=True,
+    ):
+        np.testing.assert_allclose(a, b, rtol=1e-12)
+        assert np.isnan(a[0])
+
+    out = np.empty_like(r)
+    assert _backend.evaluate(_backend.sw_phi, r, 1.0, -1.0, 1.5, out=out) is out
+    np.testing.assert_allclose(out, pots.SquareWell(eps=-1.0).phi(r))
+
+    with pytest.raises(ValueError, match="C-contiguous"):
+        _backend.evaluate(_backend.sw_phi, r, 1.0, -1.0, 1.5, out=out[::2])
+
+    # float32 in, float32 out
+    r32 = r.astype(np.float32)
+    out32 = _backend.evaluate(_backend.lj_phi, r32, 1.0, 4.0)
+    assert out32.dtype == np.float32
+    np.testing.assert_allclose(out32, p.phi(r), rtol=1e-5, atol=1e-5)
+    with pytest.raises(ValueError, match="float32"):
+        _backend.evaluate(_backend.lj_phi, r32, 1.0, 4.0, out=out)
+
+
+def test_use_numba(monkeypatch) -> None:
+    small, large = np.zeros(10), np.zeros(_backend.AUTO_MIN_SIZE)
+
+    assert not _backend.use_numba("numpy", large)
+    assert not _backend.use_numba(None, large)
+    assert not _backend.use_numba("auto", small)
+    assert _backend.use_numba("auto", large) == _backend.HAS_NUMBA
+
+    with pytest.raises(ValueError, match="backend"):
+        _backend.use_numba("cython", small)
+
+    monkeypatch.setattr(_backend, "HAS_NUMBA", False)
+    assert not _backend.use_numba("auto", large)
+    with pytest.raises(ImportError, match="numba"):
+        pots.LennardJones().phi(1.0, backend="numba")
+
+
+@pytest.mark.skipif(not _backend.HAS_NUMBA, reason="numba not installed")
+def test_cubic_table_bank_numba() -> None:
+    bank = pots.CubicTableBank.from_phis(
+        [pots.LennardJones().phi, pots.Yukawa(z=2.0).phi],
+        rmin=[0.8, 1.0],
+        rmax=3.0,
+        ds=0.001,
+    )
+    r = np.linspace(0.5, 3.5, 1001)
+    r[1] = np.nan
+    index = np.arange(r.size) % 2
+    for method in ("phi", "dphidr"):
+        np.testing.assert_allclose(
+            getattr(bank, method)(r, index, backend="numba"),
+            getattr(bank, method)(r, index, backend="numpy"),
+            rtol=1e-12,
+        )
+    for a, b in zip(
+        bank.phidphi(r, index, backend="numba"),
+        bank.phidphi(r, index, backend="numpy"),
+        strict=True,
+    ):
+        np.testing.assert_allclose(a, b, rtol=1e-12)
+    # broadcast index
+    np.testing.assert_allclose(
+        bank.phidphi(r, np.array([[0], [1]]), backend="numba")[1],
+        bank.phidphi(r, np.array([[0], [1]]), backend="numpy")[1],
+        rtol=1e-12,
+    )
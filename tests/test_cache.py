@@ -0,0 +1,372 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+import pickle  # noqa: S403
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import cast
+
+import numpy as np
+import pytest
+
+import analphipy.measures
+import analphipy.norofrenkel
+import analphipy.potential as pots
+from analphipy.cache import InstanceCache, PersistentCache, stable_hash
+from analphipy.measures import Measures
+from analphipy.norofrenkel import NoroFrenkelPair
+from analphipy.sweep import map_nf
+
+
+@pytest.fixture
+def store(tmp_path):
+    out = PersistentCache(tmp_path / "cache.sqlite")
+    yield out
+    out.close()
+
+
+def test_stable_hash() -> None:
+    a = pots.LennardJones().lfs(rcut=2.5)
+
+    assert stable_hash(a) == stable_hash(pots.LennardJones().lfs(rcut=2.5))
+    b = pickle.loads(pickle.dumps(a))  # noqa: S301
+    assert stable_hash(a.phi) == stable_hash(b.phi)
+    assert stable_hash(a) != stable_hash(pots.LennardJones().lfs(rcut=3.0))
+    assert stable_hash(a) != stable_hash(pots.LennardJones().cut(rcut=2.5))
+    assert stable_hash(a.phi) != stable_hash(a.dphidr)
+
+    assert stable_hash({"a": 1, "b": np.float64(0.5)}) == stable_hash(
+        {"b": 0.5, "a": 1}
+    )
+    assert stable_hash(np.arange(3.0)) != stable_hash(np.arange(3))
+
+    with pytest.raises(TypeError):
+        stable_hash(lambda x: x)
+
+    with pytest.raises(TypeError):
+        stable_hash(pots.Generic(phi_func=lambda x: x))
+
+
+def test_persistent_cache(tmp_path) -> None:
+    store = PersistentCache(tmp_path / "a" / "cache.sqlite", maxsize=2)
+
+    assert store.get("a") is None
+    store.set("a", 1)
+    store.set("b", {"x": [1, 2]})
+    assert "a" in store
+    assert store.get("b") == {"x": [1, 2]}
+    assert len(store) == 2  # noqa: PLR2004
+
+    # "a" is least recently used.
+    store.set("c", 3)
+    assert "a" not in store
+    assert "b" in store
+    assert len(store) == 2  # noqa: PLR2004
+
+    other = pickle.loads(pickle.dumps(store))  # noqa: S301
+    assert other.get("c") == 3  # noqa: PLR2004
+    assert other.maxsize == store.maxsize
+
+    other.clear()
+    assert len(store) == 0
+    other.close()
+    store.close()
+
+    with pytest.raises(ValueError):
+        PersistentCache(tmp_path / "cache.sqlite", maxsize=0)
+
+
+def test_nf_persistent(store, monkeypatch) -> None:
+    p = pots.LennardJones()
+    beta = 1.0
+    expected = p.to_nf().table([beta], ["sig", "B2", "lam"])
+
+    nf = p.to_nf(persistent_cache=store)
+    lam = nf.lam(beta)
+    assert len(store) == 3  # noqa: PLR2004
+
+    # new instance does not recompute
+    def bad(*_args, **_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(analphipy.norofrenkel, "sig_nf", bad)
+    monkeypatch.setattr(analphipy.norofrenkel, "secondvirial", bad)
+
+    other = pots.LennardJones().to_nf(persistent_cache=store.path)
+    assert other.lam(beta) == lam
+    np.testing.assert_allclose(other.sig(beta), expected["sig"][0])
+    np.testing.assert_allclose(other.secondvirial(beta), expected["B2"][0])
+
+    # different parameters are separate entries
+    for nf in [
+        pots.LennardJones(sig=1.1).to_nf(persistent_cache=store),
+        p.to_nf(persistent_cache=store, quad_kws={"limit": 100}),
+    ]:
+        with pytest.raises(AssertionError):
+            nf.lam(beta)
+
+
+def test_measures_persistent(store, monkeypatch) -> None:
+    p = pots.LennardJones().lfs(rcut=2.5)
+    out = p.to_measures(persistent_cache=store).secondvirial(1.0)
+
+    def bad(*_args, **_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(analphipy.measures, "secondvirial", bad)
+    assert p.to_measures(persistent_cache=store).secondvirial(1.0) == out
+
+    # arrays are not stored
+    with pytest.raises(AssertionError):
+        p.to_measures(persistent_cache=store).secondvirial([1.0, 2.0])
+
+
+def test_table_persistent(store, monkeypatch) -> None:
+    p = pots.LennardJones()
+    table = pots.CubicTable.from_phi(p.phi, rmin=0.8, rmax=2.5, ds=0.01)
+    tables = [table, table.new_like(dtype="float32")]
+    assert stable_hash(tables[0].phi) != stable_hash(tables[1].phi)
+
+    out = [
+        Measures(phi=t.phi, segments=t.segments, persistent_cache=store).secondvirial(
+            1.0
+        )
+        for t in tables
+    ]
+
+    def bad(*_args, **_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(analphipy.measures, "secondvirial", bad)
+    for t, expected in zip(tables, out, strict=True):
+        assert t.to_measures(persistent_cache=store).secondvirial(1.0) == expected
+
+
+def test_persistent_token(store) -> None:
+    p = pots.Generic(phi_func=lambda r: 4.0 * (r**-12 - r**-6), segments=[0.5, 3.0])
+
+    with pytest.raises(ValueError, match="cache_token"):
+        Measures(phi=p.phi, segments=p.segments, persistent_cache=store)
+
+    with pytest.raises(ValueError, match="cache_token"):
+        NoroFrenkelPair.from_phi(
+            p.phi, p.segments, bounds=[1.0, 1.5], persistent_cache=store
+        )
+
+    nf = NoroFrenkelPair.from_phi(
+        p.phi,
+        p.segments,
+        bounds=[1.0, 1.5],
+        persistent_cache=store,
+        cache_token="lj",  # noqa: S106
+    )
+    nf.sig(1.0)
+    assert len(store) == 1
+
+
+def test_map_nf_persistent(store) -> None:
+    potentials = [pots.LennardJonesNM(n=n, m=6) for n in (12, 18)]
+    betas = [0.5, 1.0]
+
+    out = map_nf(
+        potentials,
+        betas,
+        props=["sig", "lam"],
+        nf_kws={"persistent_cache": store},
+        max_workers=2,
+    )
+    # values of sig are stored (batched secondvirial uses closed form)
+    assert len(store) == len(potentials) * len(betas)
+
+    for x, p in zip(out, potentials, strict=True):
+        nf = p.to_nf(persistent_cache=store)
+        np.testing.assert_allclose(x["lam"], [nf.lam(beta) for beta in betas])
+    assert len(store) == 3 * len(potentials) * len(betas)
+
+
+def test_table_cache(monkeypatch) -> None:
+    nf = pots.LennardJones().to_nf()
+    betas = np.linspace(0.5, 1.5, 5)
+
+    a = nf.table(betas[:3], ["sig", "B2"])
+
+    calls = []
+    sig_nf = analphipy.norofrenkel.sig_nf
+
+    def counted(phi_rep, beta, *args, **kwargs):
+        calls.append(np.asarray(beta))
+        return sig_nf(phi_rep, beta, *args, **kwargs)
+
+    monkeypatch.setattr(analphipy.norofrenkel, "sig_nf", counted)
+
+    b = nf.table(betas, ["sig", "B2"])
+    assert len(calls) == 1
+    np.testing.assert_allclose(calls[0], betas[3:])
+    np.testing.assert_allclose(b["sig"][:3], a["sig"])
+
+    # shared with method cache
+    assert nf.sig(betas[-1]) == b["sig"][-1]
+    assert len(calls) == 1
+
+
+def test_cache_maxsize() -> None:
+    nf = pots.LennardJones().to_nf(cache_maxsize=2)
+    assert nf.cache_info() == (0, 0, 2, 0)
+
+    nf.sig(1.0)
+    nf.sig(2.0)
+    nf.sig(1.0)
+    assert nf.cache_info("sig") == (1, 2, 2, 2)
+
+    # discards least recently used (2.0)
+    nf.sig(3.0)
+    nf.sig(1.0)
+    assert nf.cache_info("sig") == (2, 3, 2, 2)
+    nf.sig(2.0)
+    assert nf.cache_info("sig") == (2, 4, 2, 2)
+
+    # lam uses cached sig and secondvirial
+    nf.lam(2.0)
+    assert nf.cache_info("lam") == (0, 1, 2, 1)
+    assert nf.cache_info("sig") == (3, 4, 2, 2)
+    assert nf.cache_info() == (3, 6, 2, 4)
+
+    nf.cache_clear()
+    assert nf.cache_info() == (0, 0, 2, 0)
+
+    m = pots.LennardJones().to_measures(cache_maxsize=1)
+    for beta in [1.0, 2.0, 2.0]:
+        m.secondvirial(beta)
+    assert m.cache_info() == (1, 2, 1, 1)
+    m.cache_clear()
+    assert m.cache_info() == (0, 0, 1, 0)
+
+    with pytest.raises(ValueError):
+        pots.LennardJones().to_measures(cache_maxsize=-1)
+
+
+def test_cache_info_persistent(store) -> None:
+    pots.LennardJones().to_nf(persistent_cache=store).sig(1.0)
+
+    nf = pots.LennardJones().to_nf(persistent_cache=store)
+    nf.sig(1.0)
+    nf.sig(1.0)
+    assert nf.cache_info() == (2, 0, None, 1)
+
+    # unbounded by default
+    nf = pots.LennardJones().to_nf()
+    for beta in np.linspace(0.5, 1.5, 10):
+        nf.sig(beta)
+    assert nf.cache_info() == (0, 10, None, 10)
+
+
+def test_cache_key_digits(store) -> None:
+    b0, b1 = 0.7692307692307692, 0.7692307692307693
+
+    nf = pots.LennardJones().to_nf()
+    nf.lam(b0)
+    nf.lam(b1)
+    assert nf.cache_info("lam") == (0, 2, None, 2)
+
+    nf = pots.LennardJones().to_nf(cache_key_digits=12, persistent_cache=store)
+    lam = nf.lam(b0)
+    assert nf.lam(b1) == lam
+    assert nf.lam(1.0 / 1.3) == lam
+    assert nf.cache_info("lam") == (2, 1, None, 1)
+    assert nf.lam(0.77) != lam
+
+    # persistent keys use rounded values
+    other = pots.LennardJones().to_nf(cache_key_digits=12, persistent_cache=store)
+    assert other.sig(b1) == nf.sig(b0)
+    assert other.cache_info("sig") == (1, 0, None, 1)
+
+    # table uses rounded keys
+    out = nf.table([b1, 0.77], ["lam"])
+    np.testing.assert_allclose(out["lam"], [lam, nf.lam(0.77)])
+
+    m = pots.LennardJones().to_measures(cache_key_digits=8)
+    m.secondvirial(1.0)
+    m.secondvirial(1.0 + 1e-10)
+    assert m.cache_info() == (1, 1, None, 1)
+
+    with pytest.raises(ValueError):
+        pots.LennardJones().to_measures(cache_key_digits=0)
+
+
+def _blocking_nf(release: threading.Event, error: bool = False) -> NoroFrenkelPair:
+    """Pair whose ``phi`` blocks until ``release`` is set."""
+    phi = pots.LennardJones().phi
+
+    def blocking_phi(r):
+        release.wait()
+        if error:
+            msg = "bad phi"
+            raise ValueError(msg)
+        return phi(r)
+
+    return NoroFrenkelPair(
+        phi=blocking_phi, segments=[0.0, np.inf], r_min=2 ** (1 / 6), phi_min=-1.0
+    )
+
+
+@pytest.mark.parametrize("error", [False, True])
+def test_single_flight(error) -> None:
+    release = threading.Event()
+    nf = _blocking_nf(release, error=error)
+    flights = cast("InstanceCache", nf._cache)._flights  # noqa: SLF001
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(nf.lam, 1.0) for _ in range(4)]
+        # wait until other threads wait on the first calculation
+        for _ in range(5000):
+            if getattr(flights.get(("lam", (1.0,), None)), "future", None):
+                break
+            release.wait(0.001)
+        release.wait(0.05)
+        release.set()
+
+        if error:
+            for future in futures:
+                with pytest.raises(ValueError, match="bad phi"):
+                    future.result()
+        else:
+            out = [future.result() for future in futures]
+            assert out == [out[0]] * len(futures)
+            assert nf.cache_info("lam").misses == 1
+            assert nf.cache_info("sig").misses == 1
+
+    assert not flights
+
+
+def test_call_once_nested() -> None:
+    cache = InstanceCache()
+
+    def func(depth: int) -> int:
+        if depth == 0:
+            return 0
+        return 1 + int(cache.call_once("key", func, depth - 1))
+
+    depth = 3
+    assert cache.call_once("key", func, depth) == depth
+    assert not cache._flights  # noqa: SLF001
+
+
+def test_persistent_get_without_lock(store, monkeypatch) -> None:
+    nf = pots.LennardJones().to_nf(persistent_cache=store)
+    entered, release = threading.Event(), threading.Event()
+    get = store.get
+
+    def slow_get(key, default=None):
+        entered.set()
+        release.wait()
+        return get(key, default)
+
+    monkeypatch.setattr(store, "get", slow_get)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        try:
+            future = executor.submit(nf.sig, 1.0)
+            assert entered.wait(10)
+            # cache is usable while waiting on persistent cache
+            assert executor.submit(nf.cache_info).result(timeout=10).misses == 0
+        finally:
+            release.set()
+        assert future.result() == nf.sig(1.0)
+    assert nf.cache_info("sig").misses == 1
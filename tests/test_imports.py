@@ -0,0 +1,94 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+"""Tests of lazy imports."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import analphipy
+
+
+def _run(code: str, *options: str) -> str:
+    """Output of ``code`` run in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, *options, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout
+
+
+def _modules_after(statement: str) -> set[str]:
+    """Names of modules loaded in a fresh interpreter after ``statement``."""
+    return set(_run(f"import sys; {statement}; print(' '.join(sys.modules))").split())
+
+
+@pytest.mark.parametrize(
+    "statement", ["import analphipy", "import analphipy.potential"]
+)
+def test_import_is_lazy(statement) -> None:
+    modules = _modules_after(statement)
+    for name in (
+        "numba",
+        "scipy",
+        "analphipy.measures",
+        "analphipy.norofrenkel",
+        "analphipy.sweep",
+    ):
+        assert name not in modules
+
+
+def test_lazy_submodules() -> None:
+    assert set(analphipy.__all__) <= set(dir(analphipy))
+    for name in analphipy.__all__:
+        assert getattr(analphipy, name) is not None
+    assert analphipy.potential.LennardJones().phi(1.0) == 0.0
+
+    with pytest.raises(AttributeError, match="no attribute"):
+        _ = analphipy.not_a_module
+
+
+_DOCS_CODE = """
+import json, sys
+import analphipy._docstrings as d
+if {eager}:
+    d._FILLED.clear()
+modules = [f"analphipy.{{name}}" for name in d._MODULES]
+for name in modules:
+    __import__(name)
+docs = {{"filled": d.docfiller._filler is not None}}
+for name in modules:
+    for key, obj in vars(sys.modules[name]).items():
+        docs[f"{{name}}.{{key}}"] = getattr(obj, "__doc__", None)
+        if isinstance(obj, type):
+            for attr, value in vars(obj).items():
+                if attr == "_docstring_components":
+                    # cache of docstring_inheritance
+                    continue
+                docs[f"{{name}}.{{key}}.{{attr}}"] = getattr(value, "__doc__", None)
+print(json.dumps(docs))
+"""
+
+
+def test_precomputed_docstrings() -> None:
+    # regenerate with ``python -m analphipy._docstrings`` if this fails
+    precomputed = json.loads(_run(_DOCS_CODE.format(eager=False)))
+    assert not precomputed.pop("filled")
+
+    eager = json.loads(_run(_DOCS_CODE.format(eager=True)))
+    assert eager.pop("filled")
+    assert precomputed == eager
+    assert "{r}" not in eager["analphipy.potential.LennardJones.phi"]
+    assert "Pair separation" in eager["analphipy.potential.LennardJones.phi"]
+    assert "{" not in eager["analphipy.norofrenkel.__doc__"]
+
+
+def test_import_without_docstrings() -> None:
+    code = (
+        "import analphipy.measures, analphipy.potential, analphipy.sweep; "
+        "import analphipy.norofrenkel as nf; print(nf.NoroFrenkelPair.__doc__)"
+    )
+    assert _run(code, "-OO").strip() == "None"
@@ -2,11 +2,22 @@
 # pylint: disable=unnecessary-lambda-assignment
 """Simple tests for js divergence..."""
 
+import itertools
+
 import numpy as np
 import pytest
 
 import analphipy
-from analphipy.measures import diverg_js_cont
+from analphipy.measures import (
+    diverg_js_cont,
+    diverg_js_disc,
+    diverg_js_disc_chunked,
+    diverg_js_integrand,
+    diverg_js_matrix,
+    diverg_kl_disc,
+    diverg_kl_disc_chunked,
+)
+from analphipy.utils import split_segments
 
 
 @pytest.mark.parametrize("beta", [0.5, 1.0, 2.0])
@@ -26,3 +37,156 @@ def test_boltz_js_lj(beta, beta_other) -> None:
 
     # pyrefly: ignore [no-matching-overload]
     np.testing.assert_allclose(v0, v1)  # pyright: ignore[reportCallIssue]  # ty:ignore[no-matching-overload]
+
+
+def test_diverg_js_matrix() -> None:
+    pots = analphipy.potential
+    potentials = [
+        pots.LennardJones(),
+        pots.LennardJonesNM(n=14, m=7),
+        pots.LennardJones().cut(2.5),
+        pots.Yukawa(z=2.0),
+    ]
+    betas = np.array([[0.5], [1.0]])
+
+    # Mayer functions of cut potentials change sign at different r than the
+    # uncut ones, giving an undefined divergence.
+    for kind, phis in [
+        ("boltz", potentials),
+        ("mayer", potentials[:2] + potentials[3:]),
+    ]:
+        n = len(phis)
+        out = diverg_js_matrix(phis, betas, kind=kind)
+        assert out.shape == (2, 1, n, n)
+        np.testing.assert_array_equal(out, np.swapaxes(out, -1, -2))
+        np.testing.assert_array_equal(np.diagonal(out, axis1=-2, axis2=-1), 0.0)
+
+        for (i, j), (k, beta) in itertools.product(
+            itertools.combinations(range(n), 2), enumerate(betas.flat)
+        ):
+            m = phis[i].to_measures()
+            func = m.boltz_diverg_js if kind == "boltz" else m.mayer_diverg_js
+            expected = func(phis[j], beta=beta)
+            np.testing.assert_allclose(out[k, 0, i, j], expected, rtol=1e-3)
+
+    # with same nodes, matches fixed order quadrature
+    out = diverg_js_matrix(potentials[:2], 1.0)
+    expected = diverg_js_cont(
+        p=lambda x: np.exp(-potentials[0].phi(x)),
+        q=lambda x: np.exp(-potentials[1].phi(x)),
+        segments=split_segments(
+            [0.0, np.inf], *(potential.r_min for potential in potentials[:2])
+        ),
+        volume="3d",
+        method="gauss",
+        order=200,
+    )
+    np.testing.assert_allclose(out[0, 1], expected, rtol=1e-12)
+
+    # semi-infinite segments are split at r_min, resolving steep potentials
+    steep = [pots.LennardJones(), pots.LennardJonesNM(n=48, m=24)]
+    out = diverg_js_matrix(steep, 5.0)
+    expected = steep[0].to_measures().boltz_diverg_js(steep[1], beta=5.0)
+    np.testing.assert_allclose(out[0, 1], expected, rtol=1e-6)
+
+    with pytest.raises(ValueError, match="kind"):
+        diverg_js_matrix(potentials, 1.0, kind="other")
+
+
+def test_diverg_js_integrand_denormal() -> None:
+    p = np.array([5e-324, 0.0, 1.0])
+    q = np.array([0.0, 0.0, 1.0])
+    out = diverg_js_integrand(p, q)
+    assert np.all(np.isfinite(out))
+    np.testing.assert_allclose(out, [0.5 * 5e-324 * np.log(2.0), 0.0, 0.0])
+
+
+def test_diverg_js_integrand() -> None:
+    rng = np.random.default_rng(0)
+    p, q = rng.random((2, 5, 10))
+    p[:, ::3] = 0.0
+    q[:, ::4] = 0.0
+    volume = rng.random(10)
+
+    m = 0.5 * (p + q)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = 0.5 * (
+            np.where(p == 0.0, 0.0, p * np.log(p / m))
+            + np.where(q == 0.0, 0.0, q * np.log(q / m))
+        )
+
+    np.testing.assert_allclose(diverg_js_integrand(p, q), expected, rtol=1e-14)
+    np.testing.assert_allclose(
+        diverg_js_integrand(p, q, volume), expected * volume, rtol=1e-14
+    )
+    # broadcasting
+    np.testing.assert_allclose(
+        diverg_js_integrand(p[:, :1], q), diverg_js_integrand(p[:, [0] * 10], q)
+    )
+    # scalars
+    for i, j in [(0, 0), (0, 1), (1, 3)]:
+        np.testing.assert_allclose(
+            diverg_js_integrand(p[i, j], q[i, j], 2.0),
+            2.0 * expected[i, j],
+            rtol=1e-14,
+        )
+
+    np.testing.assert_allclose(diverg_js_disc(p, q, axis=-1), expected.sum(axis=-1))
+
+
+@pytest.mark.parametrize("axis", [None, 0, 1, -1])
+@pytest.mark.parametrize(
+    ("func", "func_chunked"),
+    [
+        (diverg_kl_disc, diverg_kl_disc_chunked),
+        (diverg_js_disc, diverg_js_disc_chunked),
+    ],
+)
+def test_diverg_disc_chunked(tmp_path, func, func_chunked, axis) -> None:
+    rng = np.random.default_rng(0)
+    p, q = rng.random((2, 50, 7))
+    p[::5, ::2] = 0.0
+    p /= p.sum()
+    q /= q.sum()
+    expected = func(p, q, axis=axis)
+
+    for chunksize in (1, 30, 10_000):
+        np.testing.assert_allclose(
+            func_chunked(p, q, axis=axis, chunksize=chunksize), expected, rtol=1e-12
+        )
+
+    # memory-mapped
+    pm, qm = (
+        np.memmap(tmp_path / name, dtype=np.float64, mode="w+", shape=x.shape)
+        for name, x in [("p.dat", p), ("q.dat", q)]
+    )
+    pm[...], qm[...] = p, q
+    np.testing.assert_allclose(
+        func_chunked(pm, qm, axis=axis, chunksize=20), expected, rtol=1e-12
+    )
+
+    # nested lists are arrays, not blocks
+    np.testing.assert_allclose(
+        func_chunked(p.tolist(), q.tolist(), axis=axis, chunksize=30),
+        expected,
+        rtol=1e-12,
+    )
+
+    # iterators of blocks
+    split_axis = 0 if axis is None else axis
+    splits = [3, 4, 6] if split_axis in {1, -1} else [10, 11, 35]
+    blocks_p = iter(np.split(p, splits, axis=split_axis))
+    blocks_q = (x for x in np.split(q, splits, axis=split_axis))
+    np.testing.assert_allclose(
+        func_chunked(blocks_p, blocks_q, axis=axis), expected, rtol=1e-12
+    )
+
+
+def test_diverg_disc_chunked_errors() -> None:
+    p = np.full(4, 0.25)
+    with pytest.raises(ValueError, match="chunksize"):
+        diverg_js_disc_chunked(p, p, chunksize=0)
+    with pytest.raises(ValueError, match="at least one block"):
+        diverg_js_disc_chunked([], [])
+    with pytest.raises(ValueError, match="zip"):
+        diverg_js_disc_chunked(iter([p, p]), iter([p]))
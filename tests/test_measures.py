@@ -4,6 +4,7 @@ from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 
 import analphipy.potential as pots
 from analphipy import measures
@@ -121,3 +122,120 @@ def test_B2_hs() -> None:
     assert isinstance(B2_dbeta, float)
 
     np.testing.assert_allclose(0.0, B2_dbeta)
+
+
+def test_B2_gauss() -> None:
+    for p in [
+        pots.LennardJones(),
+        pots.LennardJones().cut(2.5),
+        pots.LennardJones().lfs(2.5),
+        pots.LennardJonesNM(n=18, m=9),
+        pots.Yukawa(z=2.0),
+        pots.SquareWell(eps=-1.0),
+        pots.HardSphere(),
+    ]:
+        for beta in [0.5, 1.0, 2.0]:
+            for func in [measures.secondvirial, measures.secondvirial_dbeta]:
+                a = func(p.phi, beta=beta, segments=p.segments)
+                b = func(p.phi, beta=beta, segments=p.segments, method="gauss")
+                np.testing.assert_allclose(a, b, rtol=2e-5, atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["quad", "gauss"])
+def test_B2_beta_array(method) -> None:
+    betas = np.linspace(0.2, 2.0, 7)
+
+    for p in [pots.LennardJones(), pots.Yukawa(z=2.0), pots.LennardJones().lfs(2.5)]:
+        m = p.to_measures(quad_kws={"method": method})
+        for func, meth in [
+            (measures.secondvirial, m.secondvirial),
+            (measures.secondvirial_dbeta, m.secondvirial_dbeta),
+        ]:
+            expected = [func(p.phi, beta=beta, segments=p.segments) for beta in betas]
+
+            out = func(p.phi, beta=betas, segments=p.segments, method=method)
+            assert isinstance(out, np.ndarray)
+            assert out.shape == betas.shape
+            np.testing.assert_allclose(out, expected, rtol=2e-6)
+
+            np.testing.assert_allclose(meth(betas), out)
+
+            out_err = func(
+                p.phi, beta=betas.reshape(-1, 1), segments=p.segments, err=True
+            )
+            assert isinstance(out_err, tuple)
+            assert len(out_err) == 2  # noqa: PLR2004
+            integral, error = out_err
+            assert isinstance(integral, np.ndarray)
+            assert isinstance(error, np.ndarray)
+            assert integral.shape == error.shape == (len(betas), 1)
+            np.testing.assert_allclose(integral[:, 0], expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    ("p", "rtol"),
+    [
+        (pots.LennardJones(), 1e-6),
+        (pots.LennardJones(sig=1.2, eps=0.8), 1e-6),
+        (pots.LennardJonesNM(n=18, m=9), 1e-6),
+        # quadrature is less accurate for slowly decaying tail
+        (pots.LennardJonesNM(n=10, m=5, sig=0.9), 1e-5),
+        (pots.SquareWell(eps=-1.0, lam=1.5), 1e-10),
+        (pots.SquareWell(eps=-1.0, lam=1.5).cut(2.0), 1e-10),
+        (pots.HardSphere(sig=1.2), 1e-10),
+    ],
+)
+def test_B2_analytic(p, rtol) -> None:
+    betas = np.linspace(0.2, 2.0, 5)
+
+    for func, name in [
+        (measures.secondvirial, "secondvirial_analytic"),
+        (measures.secondvirial_dbeta, "secondvirial_dbeta_analytic"),
+    ]:
+        expected = [func(p.phi, beta=beta, segments=p.segments) for beta in betas]
+        out = getattr(p, name)(betas)
+        np.testing.assert_allclose(out, expected, rtol=rtol, atol=1e-12)
+
+        scalar = getattr(p, name)(betas[0])
+        assert isinstance(scalar, float)
+        np.testing.assert_allclose(scalar, expected[0], rtol=rtol, atol=1e-12)
+
+
+def test_B2_analytic_missing() -> None:
+    for p in [
+        pots.LennardJones().cut(2.5),
+        pots.LennardJones().lfs(2.5),
+        pots.SquareWell(eps=-1.0, lam=1.5).cut(1.2),
+        pots.Yukawa(z=2.0),
+        pots.LennardJonesNM(n=6, m=3),
+    ]:
+        assert p.secondvirial_analytic(1.0) is None
+        assert p.secondvirial_dbeta_analytic(1.0) is None
+
+
+def test_measures_analytic(monkeypatch) -> None:
+    p = pots.LennardJones()
+    expected = p.to_measures().secondvirial(1.0)
+
+    def bad(*_args, **_kwargs):
+        raise AssertionError
+
+    monkeypatch.setattr(measures, "secondvirial", bad)
+    monkeypatch.setattr(measures, "secondvirial_dbeta", bad)
+
+    m = p.to_measures()
+    assert m.secondvirial(1.0) == expected
+    assert m.secondvirial(1.0) == p.secondvirial_analytic(1.0)
+    np.testing.assert_allclose(
+        m.secondvirial_dbeta([0.5, 1.0]), p.secondvirial_dbeta_analytic([0.5, 1.0])
+    )
+
+    # errors and other ranges use quadrature
+    for meth, kws in [
+        (m.secondvirial, {"err": True}),
+        (m.secondvirial, {"full_output": True}),
+        (measures.Measures(p.phi, segments=[0.5, 3.0]).secondvirial, {}),
+        (pots.LennardJones().lfs(2.5).to_measures().secondvirial, {}),
+    ]:
+        with pytest.raises(AssertionError):
+            meth(1.0, **kws)
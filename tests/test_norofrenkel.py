@@ -6,6 +6,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import analphipy.norofrenkel
 import analphipy.potential as pots
 from analphipy.norofrenkel import NoroFrenkelPair
 
@@ -136,3 +137,152 @@ def test_nf_yk() -> None:
         for col in cols:
             left = col + "_eff"
             np.testing.assert_allclose(g[left], out[col], rtol=1e-3)
+
+
+@pytest.mark.parametrize("method", ["quad", "gauss"])
+def test_table_batched(method) -> None:
+    p = pots.LennardJones().lfs(rcut=2.5)
+    a = NoroFrenkelPair.from_phi(
+        phi=p.phi,
+        segments=p.segments,
+        r_min=1.0,
+        bounds=[0.5, 1.5],
+        quad_kws={"method": method},
+    )
+    betas = np.linspace(0.5, 2.0, 5)
+    props = ["B2", "B2_dbeta", "sig", "sig_dbeta", "eps", "lam", "lam_dbeta", "B2_sw"]
+
+    out = a.table(betas, props)
+    np.testing.assert_allclose(out["beta"], betas)
+
+    for prop in props:
+        assert out[prop].shape == betas.shape
+
+    for beta, *values in zip(betas, *(out[prop] for prop in props), strict=True):
+        for prop, value in zip(props, values, strict=True):
+            np.testing.assert_allclose(value, getattr(a, prop)(beta), rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "phi", [pots.LennardJones(), pots.LennardJones().lfs(rcut=2.5)]
+)
+def test_table_dbeta_gauss(phi) -> None:
+    # derivatives with gauss quadrature match adaptive quadrature
+    betas = np.array([0.5, 1.0, 2.0])
+    props = ["B2_dbeta", "sig_dbeta", "lam_dbeta"]
+    quad, gauss = (
+        NoroFrenkelPair.from_phi_class(
+            phi, r_min=1.1, bounds=[0.5, 1.5], quad_kws={"method": method}
+        ).table(betas, props)
+        for method in ("quad", "gauss")
+    )
+    for prop in props:
+        np.testing.assert_allclose(gauss[prop], quad[prop], rtol=1e-6)
+
+
+def test_table_gauss_steep() -> None:
+    # gauss quadrature resolves narrow well of steep potential
+    p = pots.LennardJonesNM(n=48, m=24)
+    betas = np.array([1.0, 5.0])
+    props = ["B2", "B2_dbeta", "sig", "lam"]
+    quad, gauss = (
+        # wrap phi, so that closed forms are not used
+        p.to_nf(
+            phi=lambda r: p.phi(r),  # noqa: PLW0108
+            quad_kws={"method": method},
+        ).table(betas, props)
+        for method in ("quad", "gauss")
+    )
+    for prop in props:
+        np.testing.assert_allclose(gauss[prop], quad[prop], rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "phi",
+    [
+        pots.LennardJones(),
+        pots.LennardJones().lfs(rcut=2.5),
+        pots.LennardJonesNM(n=18, m=9),
+    ],
+)
+def test_interpolator(phi) -> None:
+    a = NoroFrenkelPair.from_phi_class(
+        phi, r_min=1.1, bounds=[0.5, 1.5], quad_kws={"method": "gauss"}
+    )
+    rtol, atol = 1e-6, 1e-8
+    f = a.interpolator(0.5, 2.0, rtol=rtol, atol=atol)
+
+    assert f.props == ("secondvirial", "sig", "eps", "lam")
+    np.testing.assert_allclose([f.beta_min, f.beta_max], [0.5, 2.0])
+
+    betas = np.linspace(0.5, 2.0, 101)
+    expected = a.table(betas, ["B2", "sig", "eps", "lam"])
+    out = f(betas)
+    for prop in ["B2", "sig", "eps", "lam"]:
+        np.testing.assert_allclose(
+            f[prop](betas), expected[prop], rtol=10 * rtol, atol=10 * atol
+        )
+    np.testing.assert_allclose(out["secondvirial"], expected["B2"], rtol=10 * rtol)
+
+    # tolerance holds at interior check points of every interval
+    nodes = f.splines["lam"].x
+    betas = (nodes[:-1, None] + np.diff(nodes)[:, None] * [0.25, 0.5, 0.75]).ravel()
+    expected = a.table(betas, ["B2", "sig", "eps", "lam"])
+    for prop in ["B2", "sig", "eps", "lam"]:
+        error = np.abs(f[prop](betas) - expected[prop])
+        assert np.all(error <= atol + rtol * np.abs(expected[prop]))
+
+    assert np.isnan(f["lam"](2.5))
+
+
+def test_interpolator_errors() -> None:
+    a = pots.LennardJones().to_nf(quad_kws={"method": "gauss"})
+
+    f = a.interpolator(0.5, 1.0, props=["lam"])
+    assert f.props == ("lam",)
+
+    with pytest.raises(ValueError, match="Cannot interpolate"):
+        a.interpolator(0.5, 1.0, props=["lam_dbeta"])
+
+    with pytest.raises(ValueError, match="beta_min < beta_max"):
+        a.interpolator(1.0, 0.5)
+
+    with pytest.raises(ValueError, match="n_check >= 1"):
+        a.interpolator(0.5, 1.0, n_check=0)
+
+    with pytest.raises(ValueError, match="did not converge"):
+        a.interpolator(0.5, 1.0, rtol=1e-14, atol=0.0, max_nodes=20)
+
+
+def test_nf_analytic(monkeypatch) -> None:
+    p = pots.SquareWell(sig=1.2, eps=-0.8, lam=1.4)
+    betas = np.array([0.5, 1.0, 2.0])
+    props = ["B2", "B2_dbeta", "sig", "sig_dbeta", "lam", "lam_dbeta"]
+    expected = NoroFrenkelPair(
+        phi=p.phi, segments=[0.0, 1.2, 1.4 * 1.2, 3.0], r_min=1.2, phi_min=-0.8
+    ).table(betas, props)
+
+    def bad(*_args, **_kwargs):
+        raise AssertionError
+
+    for name in ["secondvirial", "secondvirial_dbeta", "sig_nf", "sig_nf_dbeta"]:
+        monkeypatch.setattr(analphipy.norofrenkel, name, bad)
+
+    nf = p.to_nf()
+    out = nf.table(betas, props)
+    for prop in props:
+        np.testing.assert_allclose(out[prop], expected[prop], rtol=1e-8, atol=1e-12)
+        np.testing.assert_allclose(
+            [getattr(nf, prop)(beta) for beta in betas],
+            expected[prop],
+            rtol=1e-8,
+            atol=1e-12,
+        )
+    np.testing.assert_allclose(out["sig"], p.sig)
+    np.testing.assert_allclose(out["lam"], p.lam)
+
+    # errors and different reference use quadrature
+    with pytest.raises(AssertionError):
+        nf.secondvirial(1.0, err=True)
+    with pytest.raises(AssertionError):
+        NoroFrenkelPair(p.phi, p.segments, r_min=1.3, phi_min=-0.8).sig(1.0)
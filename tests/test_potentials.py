@@ -4,7 +4,9 @@ import numpy as np
 import pytest
 
 from analphipy import potential as pots
+from analphipy._backend import HAS_NUMBA  # noqa: PLC2701
 from analphipy.base_potential import PhiAbstract
+from analphipy.cache import stable_hash
 
 
 def test_asdict() -> None:
@@ -146,3 +148,378 @@ def test_yk(yk_params) -> None:
 
 def test_hs(hs_params) -> None:
     _do_test(hs_params, pots.HardSphere, phidphi=False)
+
+
+def _cubic_table_reference(table, r):
+    # direct evaluation of interpolation formula
+    ds = (table.smax - table.smin) / table.size
+    s = np.asarray(r) ** 2
+    sds = (s - table.smin) / ds
+    k = sds.astype(int)
+    xi = sds - k
+    t = np.take(table.phi_table, [k, k + 1, k + 2], mode="clip")
+    dt = np.diff(t, axis=0)
+    ddt = np.diff(dt, axis=0)
+    v = t[0] + xi * (dt[0] + 0.5 * (xi - 1.0) * ddt[0])
+    dv = -2.0 / ds * (dt[0] + (xi - 0.5) * ddt[0])
+    return v, dv
+
+
+def test_cubic_table() -> None:
+    rng = np.random.default_rng()
+    p = pots.LennardJones()
+    table = pots.CubicTable.from_phi(
+        p.phi, rmin=0.8, rmax=2.5, ds=0.001, dphi_left=5.0, dphi_right=-1.0
+    )
+
+    r = rng.uniform(0.81, 2.49, 1000)
+    r[:5] = table.r_table[1:6]
+
+    v, dv = table.phidphi(r)
+    v_ref, dv_ref = _cubic_table_reference(table, r)
+    np.testing.assert_allclose(v, v_ref, rtol=1e-12, atol=1e-12)
+    np.testing.assert_allclose(dv, dv_ref, rtol=1e-10, atol=1e-10)
+
+    np.testing.assert_allclose(table.phi(r), p.phi(r), rtol=1e-4, atol=1e-6)
+    np.testing.assert_allclose(table.dphidr(r), p.dphidr(r), rtol=1e-3, atol=1e-4)
+    np.testing.assert_allclose(table.dphidr(r), -r * dv)
+
+    # out of bounds
+    r_out = np.array([0.5, 0.8, 2.5, 3.0])
+    v, dv = table.phidphi(r_out)
+    np.testing.assert_array_equal(v, [np.inf, np.inf, 0.0, 0.0])
+    np.testing.assert_array_equal(dv, [5.0, 5.0, -1.0, -1.0])
+
+    # nan propagates
+    v, dv = table.phidphi(np.array([np.nan, 1.2]))
+    assert np.isnan(v[0])
+    assert np.isnan(dv[0])
+    np.testing.assert_allclose(v[1], table.phi(1.2))
+
+    # scalars and preallocated output
+    assert table.phi(1.2).shape == ()
+    np.testing.assert_allclose(table.phi(1.2), p.phi(1.2), rtol=1e-4)
+
+    r = r.reshape(10, 100)
+    out = np.empty_like(r), np.empty_like(r)
+    v, dv = table.phidphi(r, out=out)
+    assert v is out[0]
+    assert dv is out[1]
+    np.testing.assert_allclose(v, table.phi(r))
+    assert table.phi(r, out=out[0]) is out[0]
+    assert table.dphidr(r, out=out[1]) is out[1]
+    np.testing.assert_allclose(out[1], -r * table.phidphi(r)[1])
+
+
+def test_cubic_table_bank() -> None:
+    rng = np.random.default_rng()
+    phis = [
+        pots.LennardJones(sig=1.0, eps=1.0),
+        pots.LennardJones(sig=1.2, eps=0.8),
+        pots.Yukawa(sig=1.1, z=2.0),
+    ]
+    bank = pots.CubicTableBank.from_phis(
+        [p.phi for p in phis], rmin=[0.8, 0.9, 1.1], rmax=3.0, ds=0.001
+    )
+    assert len(bank) == len(phis)
+    assert bank[1].bounds == (0.81, 9.0)
+
+    r = rng.uniform(0.5, 3.5, (20, 50))
+    index = rng.integers(0, 3, r.shape)
+
+    v, dv = bank.phidphi(r, index)
+    for k, table in enumerate(bank.tables):
+        msk = index == k
+        np.testing.assert_allclose(v[msk], table.phi(r[msk]))
+        np.testing.assert_allclose(dv[msk], table.phidphi(r[msk])[1])
+        np.testing.assert_allclose(bank.phi(r[msk], k), table.phi(r[msk]))
+    np.testing.assert_allclose(bank.phi(r, index), v)
+    np.testing.assert_allclose(bank.dphidr(r, index), -r * dv)
+    phi, dphidr = bank.phi_and_dphidr(r, index)
+    np.testing.assert_allclose(phi, v)
+    np.testing.assert_allclose(dphidr, -r * dv)
+
+    # broadcasting
+    assert bank.phi(r[0], np.array([[0], [1], [2]])).shape == (3, 50)
+    np.testing.assert_allclose(
+        bank.phi(1.5, [0, 1, 2]), [t.phi(1.5) for t in bank.tables]
+    )
+
+    out = np.empty_like(r)
+    assert bank.phi(r, index, out=out) is out
+
+    # nan propagates
+    assert np.isnan(bank.phi([np.nan, 1.2], [0, 1])[0])
+
+    with pytest.raises(IndexError):
+        bank.phi(r, 3)
+    with pytest.raises(ValueError, match="at least one"):
+        pots.CubicTableBank([])
+    with pytest.raises(TypeError):
+        pots.CubicTableBank([pots.LennardJones()])
+
+
+@pytest.mark.parametrize("dphidr", [True, False])
+def test_adaptive_cubic_table(dphidr) -> None:
+    rng = np.random.default_rng()
+    p = pots.LennardJones()
+    atol = rtol = 1e-6
+    table = pots.AdaptiveCubicTable.from_phi(
+        p.phi,
+        rmin=0.8,
+        rmax=2.5,
+        atol=atol,
+        rtol=rtol,
+        dphidr=p.dphidr if dphidr else None,
+        dphi_left=5.0,
+        dphi_right=-1.0,
+    )
+    # non-uniform grid is much smaller than uniform grid of similar accuracy
+    uniform = pots.CubicTable.from_phi(p.phi, rmin=0.8, rmax=2.5, ds=0.001)
+    assert table.size * 10 < uniform.size
+    assert table.bounds == pytest.approx((0.64, 6.25))
+    assert table.segments == pytest.approx((0.8, 2.5))
+
+    r = np.sort(rng.uniform(0.8, 2.5, 10_000))
+    r[:5] = table.r_table[1:6]
+    phi = p.phi(r)
+    assert np.all(np.abs(table.phi(r) - phi) <= 2 * (atol + rtol * np.abs(phi)))
+    np.testing.assert_allclose(table.dphidr(r), p.dphidr(r), rtol=1e-2, atol=1e-2)
+    # continuous at knots
+    np.testing.assert_allclose(table.phi(table.r_table[1:-1]), table.phi_table[1:-1])
+
+    v, dv = table.phidphi(r)
+    np.testing.assert_allclose(v, table.phi(r))
+    np.testing.assert_allclose(table.dphidr(r), -r * dv)
+
+    # out of bounds
+    r_out = np.array([0.5, 0.8, 2.5, 3.0])
+    v, dv = table.phidphi(r_out)
+    np.testing.assert_array_equal(v, [np.inf, np.inf, 0.0, 0.0])
+    np.testing.assert_array_equal(dv, [5.0, 5.0, -1.0, -1.0])
+
+    # nan propagates
+    v, dv = table.phidphi(np.array([np.nan, 1.2]))
+    assert np.isnan(v[0])
+    assert np.isnan(dv[0])
+
+    # scalars and preallocated output
+    assert table.phi(1.2).shape == ()
+    out = np.empty_like(r)
+    assert table.phi(r, out=out) is out
+
+
+def test_adaptive_cubic_table_lookup() -> None:
+    # lookup with arbitrary knots
+    rng = np.random.default_rng()
+    s_table = np.sort(rng.uniform(1.0, 4.0, 50))
+    table = pots.AdaptiveCubicTable(
+        rsq_table=s_table, phi_table=s_table**2, dphi_table=-4.0 * s_table
+    )
+    s = rng.uniform(1.0, 4.0, 1000)
+    s = s[(s > s_table[0]) & (s < s_table[-1])]
+    np.testing.assert_allclose(table.phi(np.sqrt(s)), s**2)
+    np.testing.assert_allclose(table.phidphi(np.sqrt(s))[1], -4.0 * s)
+
+    with pytest.raises(ValueError, match="strictly increasing"):
+        pots.AdaptiveCubicTable(
+            rsq_table=[1.0, 1.0], phi_table=[0, 0], dphi_table=[0, 0]
+        )
+    with pytest.raises(ValueError, match="same shape"):
+        pots.AdaptiveCubicTable(rsq_table=[1.0, 2.0], phi_table=[0], dphi_table=[0, 0])
+    with pytest.raises(ValueError, match="max_size"):
+        pots.AdaptiveCubicTable.from_phi(
+            pots.LennardJones().phi,
+            rmin=0.8,
+            rmax=2.5,
+            atol=1e-12,
+            rtol=0,
+            max_size=100,
+        )
+    with pytest.raises(ValueError, match="finite"):
+        pots.AdaptiveCubicTable.from_phi(pots.Yukawa().phi, rmin=1.0, rmax=2.5)
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_cubic_table_save_load(tmp_path, mmap) -> None:
+    p = pots.LennardJones()
+    table = pots.CubicTable.from_phi(
+        p.phi, rmin=0.8, rmax=2.5, ds=0.001, r_min=p.r_min, dphi_left=5.0
+    )
+    path = tmp_path / "table.bin"
+    table.save(path)
+
+    loaded = pots.CubicTable.load(path, mmap=mmap)
+    # coefficients are read from file, not recalculated
+    coefs = loaded._coefs  # noqa: SLF001
+    assert isinstance(coefs, np.memmap) is mmap
+    assert coefs.flags.writeable is not mmap
+    np.testing.assert_array_equal(coefs, table._coefs)  # noqa: SLF001
+    assert loaded.phi_table is None
+    assert len(loaded) == len(table)
+    for name in ("bounds", "segments", "r_min", "phi_min", "phi_left", "dphi_left"):
+        assert getattr(loaded, name) == getattr(table, name)
+
+    r = np.linspace(0.5, 3.0, 1000)
+    np.testing.assert_array_equal(loaded.phi(r), table.phi(r))
+    np.testing.assert_array_equal(loaded.dphidr(r), table.dphidr(r))
+
+    # changing coefficients recovers table values
+    other = loaded.new_like(phi_right=1.0)
+    assert isinstance(other.phi_table, np.ndarray)
+    np.testing.assert_allclose(other.phi_table, table.phi_table, rtol=1e-14)
+    np.testing.assert_allclose(
+        other.phi(r), table.new_like(phi_right=1.0).phi(r), rtol=1e-13
+    )
+    assert loaded.new_like(r_min=1.0)._coefs is coefs  # noqa: SLF001
+
+    with pytest.raises(ValueError, match="phi_table"):
+        pots.CubicTable(bounds=table.bounds, phi_table=None)
+
+    # tables are identified by coefficients
+    assert loaded == table
+    assert hash(loaded) == hash(table)
+    assert stable_hash(loaded.phi) == stable_hash(table.phi)
+
+    other_path = tmp_path / "other.bin"
+    pots.CubicTable.from_phi(
+        pots.LennardJonesNM(n=14, m=7).phi,
+        rmin=0.8,
+        rmax=2.5,
+        ds=0.001,
+        r_min=p.r_min,
+        dphi_left=5.0,
+    ).save(other_path)
+    other = pots.CubicTable.load(other_path, mmap=mmap)
+    assert other != loaded
+    assert hash(other) != hash(loaded)
+    assert stable_hash(other.phi) != stable_hash(loaded.phi)
+
+
+def test_cubic_table_load_errors(tmp_path) -> None:
+    path = tmp_path / "table.bin"
+    path.write_bytes(b"not a table")
+    with pytest.raises(ValueError, match="not a CubicTable file"):
+        pots.CubicTable.load(path)
+
+    pots.CubicTable.from_phi(pots.LennardJones().phi, rmin=0.8, rmax=2.5, ds=0.1).save(
+        path
+    )
+    path.write_bytes(path.read_bytes()[:-8])
+    with pytest.raises(ValueError, match="wrong size"):
+        pots.CubicTable.load(path)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "numba"])
+def test_float32(tmp_path, backend) -> None:
+    if backend == "numba" and not HAS_NUMBA:
+        pytest.skip("numba not installed")
+    rng = np.random.default_rng()
+    p = pots.LennardJones()
+    r = rng.uniform(0.81, 2.49, 1000)
+    r32 = r.astype(np.float32)
+
+    # analytic potentials follow input
+    for meth in (p.phi, p.dphidr):
+        assert meth(r32, backend=backend).dtype == np.float32
+        assert meth(r, backend=backend).dtype == np.float64
+
+    table = pots.CubicTable.from_phi(p.phi, rmin=0.8, rmax=2.5, ds=0.001)
+    table32 = table.new_like(dtype="float32")
+    assert table32.dtype == np.float32
+    assert table32._coefs.nbytes * 2 == table._coefs.nbytes  # noqa: SLF001
+
+    phi, phi32 = table.phi(r, backend=backend), table32.phi(r, backend=backend)
+    assert phi32.dtype == np.float32
+    assert table32.phi(r32, backend=backend).dtype == np.float32
+    assert table32.dphidr(r, backend=backend).dtype == np.float32
+    # documented error
+    scale = np.abs(phi) + np.abs(r * table.dphidr(r))
+    assert np.all(np.abs(phi32 - phi) <= 4 * np.finfo(np.float32).eps * scale)
+
+    bank = pots.CubicTableBank([table32, table32])
+    assert bank.dtype == np.float32
+    np.testing.assert_allclose(
+        bank.phi(r, 1, backend=backend), phi32, rtol=1e-5, atol=1e-5
+    )
+    assert pots.CubicTableBank([table32, table]).dtype == np.float64
+
+    path = tmp_path / "table.bin"
+    table32.save(path)
+    loaded = pots.CubicTable.load(path)
+    assert loaded.dtype == np.float32
+    np.testing.assert_array_equal(loaded.phi(r, backend=backend), phi32)
+
+    with pytest.raises(ValueError, match="dtype"):
+        table.new_like(dtype="int32")
+
+
+@pytest.mark.parametrize(
+    "p",
+    [
+        pots.LennardJones(sig=1.1, eps=0.9),
+        pots.LennardJonesNM(n=10.5, m=4.5),
+        pots.Yukawa(z=2.0),
+        pots.LennardJones().cut(2.5),
+        pots.LennardJones().lfs(2.5),
+        pots.Yukawa(z=2.0).lfs(2.5),
+        pots.Generic(phi_func=np.exp, dphidr_func=np.exp),
+        pots.CubicTable.from_phi(pots.LennardJones().phi, rmin=0.8, rmax=2.5, ds=0.01),
+        pots.AdaptiveCubicTable.from_phi(pots.LennardJones().phi, rmin=0.8, rmax=2.5),
+    ],
+)
+def test_phi_and_dphidr(p) -> None:
+    r = np.linspace(0.5, 3.0, 200)
+    phi, dphidr = p.phi_and_dphidr(r)
+    np.testing.assert_allclose(phi, p.phi(r), rtol=1e-12, atol=1e-14)
+    np.testing.assert_allclose(dphidr, p.dphidr(r), rtol=1e-12, atol=1e-14)
+
+    phi, dphidr = p.phi_and_dphidr(1.2)
+    assert np.shape(phi) == np.shape(dphidr) == ()
+
+
+def test_yukawa_dphidr() -> None:
+    p = pots.Yukawa(sig=1.1, eps=0.5, z=2.0)
+    r = np.linspace(1.2, 3.0, 100)
+    h = 1e-6
+    np.testing.assert_allclose(
+        p.dphidr(r), (p.phi(r + h) - p.phi(r - h)) / (2 * h), rtol=1e-6
+    )
+    assert p.dphidr(1.0) == -np.inf
+
+
+@pytest.mark.parametrize(
+    "p", [pots.LennardJones().cut(2.5), pots.Yukawa(z=2.0, sig=0.5).lfs(2.5)]
+)
+def test_cut_assume_sorted(p) -> None:
+    r = np.linspace(0.8, 3.0, 100)
+    phi, dphidr = p.phi(r), p.dphidr(r)
+
+    np.testing.assert_array_equal(p.phi(r, assume_sorted=True), phi)
+    np.testing.assert_array_equal(p.dphidr(r, assume_sorted=True), dphidr)
+    for v, expected in zip(
+        p.phi_and_dphidr(r, assume_sorted=True), (phi, dphidr), strict=True
+    ):
+        np.testing.assert_allclose(v, expected, rtol=1e-12, atol=1e-14)
+
+    # all inside or outside cutoff
+    for x in (r[:10], r[-10:], r[:0]):
+        np.testing.assert_array_equal(p.phi(x, assume_sorted=True), p.phi(x))
+
+    out = np.full_like(r, np.nan)
+    assert p.phi(r, assume_sorted=True, out=out) is out
+    np.testing.assert_array_equal(out, phi)
+
+    out = np.full_like(r, np.nan)
+    assert p.dphidr(r, out=out) is out
+    np.testing.assert_array_equal(out, dphidr)
+
+    outs = (np.empty_like(r), np.empty_like(r))
+    res = p.phi_and_dphidr(r, assume_sorted=True, out=outs)
+    assert res[0] is outs[0]
+    assert res[1] is outs[1]
+
+    with pytest.raises(ValueError, match="one dimensional"):
+        p.phi(r.reshape(10, 10), assume_sorted=True)
+    with pytest.raises(ValueError, match=r"out\.shape"):
+        p.phi(r, out=np.empty(10))
@@ -0,0 +1,104 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import analphipy.potential as pots
+from analphipy.norofrenkel import NoroFrenkelPair
+from analphipy.sweep import map_measures, map_nf
+
+betas = np.linspace(0.5, 1.5, 3)
+props = ["B2", "sig", "eps", "lam"]
+
+
+def _get_specs():
+    return [
+        {"potential_name": "nm", "n": n, "m": m}
+        for n, m in [(12, 6), (14, 7), (18, 9), (24, 12)]
+    ]
+
+
+def _get_expected(specs):
+    return [
+        NoroFrenkelPair.from_phi_class(pots.factory(**spec)).table(betas, props)
+        for spec in specs
+    ]
+
+
+def _check(out, expected) -> None:
+    assert len(out) == len(expected)
+    for x, y in zip(out, expected, strict=True):
+        for prop in ["beta", *props]:
+            np.testing.assert_allclose(x[prop], y[prop])
+
+
+@pytest.mark.parametrize("executor_type", [None, "thread"])
+def test_map_nf(executor_type) -> None:
+    specs = _get_specs()
+    expected = _get_expected(specs)
+
+    if executor_type is None:
+        out = map_nf(specs, betas, props, max_workers=1)
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            out = map_nf(specs, betas, props, executor=executor)
+
+    _check(out, expected)
+
+
+def test_map_nf_process() -> None:
+    specs = _get_specs()
+    expected = _get_expected(specs)
+
+    out = map_nf(specs, betas, props, max_workers=2, chunksize=2)
+    _check(out, expected)
+
+    # potential objects are picklable
+    # (use spawn, as forking after numba kernels have run is not safe)
+    potentials = [pots.factory(**spec) for spec in specs]
+    with ProcessPoolExecutor(
+        max_workers=2, mp_context=mp.get_context("spawn")
+    ) as executor:
+        out = map_nf(potentials, betas, props, executor=executor)
+    _check(out, expected)
+
+
+def test_map_nf_kws() -> None:
+    specs = [
+        {"potential_name": "nm", "n": 12, "m": 6, "lfs": True, "rcut": 2.5},
+        {"potential_name": "lj", "cut": True, "rcut": 2.5},
+    ]
+    nf_kws = {"r_min": 1.1, "bounds": [0.5, 1.5], "quad_kws": {"method": "gauss"}}
+
+    out = map_nf(
+        specs,
+        betas,
+        ["B2", "sig"],
+        key_format="{prop}_nf",
+        nf_kws=nf_kws,
+        max_workers=1,
+    )
+
+    for x, spec in zip(out, specs, strict=True):
+        nf = NoroFrenkelPair.from_phi_class(pots.factory(**spec), **nf_kws)
+        np.testing.assert_allclose(x["B2_nf"], nf.table(betas, ["B2"])["B2"])
+        np.testing.assert_allclose(x["sig_nf"], nf.table(betas, ["sig"])["sig"])
+
+
+def test_map_measures() -> None:
+    specs = _get_specs()
+    out = map_measures(
+        specs, betas, props=["secondvirial", "secondvirial_dbeta"], max_workers=1
+    )
+
+    for x, spec in zip(out, specs, strict=True):
+        m = pots.factory(**spec).to_measures()
+        np.testing.assert_allclose(x["beta"], betas)
+        np.testing.assert_allclose(
+            x["secondvirial"], [m.secondvirial(beta) for beta in betas]
+        )
+        np.testing.assert_allclose(
+            x["secondvirial_dbeta"], [m.secondvirial_dbeta(beta) for beta in betas]
+        )
@@ -0,0 +1,67 @@
+# mypy: disable-error-code="no-untyped-def, no-untyped-call"
+import numpy as np
+import pytest
+
+from analphipy.utils import gauss_legendre_nodes, quad_segments
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "expected"),
+    [
+        (0.0, 1.0, 1.0 - np.exp(-1.0)),
+        (0.0, np.inf, 1.0),
+        (1.0, np.inf, np.exp(-1.0)),
+    ],
+)
+def test_gauss_legendre_nodes_exp(a, b, expected) -> None:
+    x, w = gauss_legendre_nodes(a, b, order=100)
+    np.testing.assert_allclose(np.sum(w * np.exp(-x)), expected)
+
+
+def test_gauss_legendre_nodes_infinite() -> None:
+    x, w = gauss_legendre_nodes(-np.inf, 0.0, order=100)
+    np.testing.assert_allclose(np.sum(w * np.exp(x)), 1.0)
+
+    x, w = gauss_legendre_nodes(-np.inf, np.inf, order=200)
+    np.testing.assert_allclose(np.sum(w * np.exp(-(x**2))), np.sqrt(np.pi))
+
+
+def test_quad_segments_gauss() -> None:
+    def func(x):
+        return np.exp(-x) * np.sin(x) ** 2
+
+    segments = [0.0, 1.0, 3.0, np.inf]
+
+    for sum_integrals in [True, False]:
+        a = quad_segments(func, segments, err=False, sum_integrals=sum_integrals)
+        b = quad_segments(
+            func, segments, err=False, sum_integrals=sum_integrals, method="gauss"
+        )
+        np.testing.assert_allclose(a, b)
+
+    out = quad_segments(
+        func, segments, full_output=True, sum_errors=True, method="gauss", order=100
+    )
+    assert isinstance(out, tuple)
+    assert len(out) == 3  # noqa: PLR2004
+    integral, error, outputs = out
+    np.testing.assert_allclose(integral, 0.4)
+    np.testing.assert_allclose(error, 0.0, atol=1e-6)
+    assert isinstance(outputs, list)
+    assert [o["neval"] for o in outputs] == [150] * 3
+
+    # vector valued integrand
+    scale = np.array([1.0, 2.0, 3.0])
+
+    def func_vec(x):
+        return np.exp(-scale[:, None] * x)
+
+    np.testing.assert_allclose(
+        quad_segments(func_vec, segments, err=False, method="gauss"), 1.0 / scale
+    )
+
+    with pytest.raises(ValueError, match="Unknown arguments"):
+        quad_segments(func, segments, method="gauss", limit=100)
+
+    with pytest.raises(ValueError, match="Unknown method"):
+        quad_segments(func, segments, method="hello")